@@ -0,0 +1,79 @@
+import json
+from unittest.mock import patch
+import numpy as np
+import pytest
+from voxgrep.utils import jsonio
+
+# Every test runs against the stdlib fallback, and against orjson if installed
+BACKENDS = [False] + ([True] if jsonio.ORJSON_AVAILABLE else [])
+
+SEGMENTS = [
+    {"content": "Grüße, world", "start": 0.0, "end": 1.5, "words": []},
+    {"content": "second", "start": 1.5, "end": 2.0, "words": [{"word": "second", "start": 1.5, "end": 2.0}]},
+]
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda orjson: "orjson" if orjson else "stdlib")
+def backend(request):
+    with patch.object(jsonio, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+def test_dump_file_round_trip(backend, tmp_path):
+    path = str(tmp_path / "transcript.json")
+    jsonio.dump_file(SEGMENTS, path)
+
+    assert jsonio.load_file(path) == SEGMENTS
+    assert not (tmp_path / "transcript.json.part").exists()
+
+
+def test_dump_iter_file_writes_valid_json(backend, tmp_path):
+    path = str(tmp_path / "transcript.json")
+    count = jsonio.dump_iter_file(iter(SEGMENTS), path)
+
+    assert count == len(SEGMENTS)
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == SEGMENTS
+    assert not (tmp_path / "transcript.json.part").exists()
+
+
+def test_dump_iter_file_empty(backend, tmp_path):
+    path = str(tmp_path / "empty.json")
+
+    assert jsonio.dump_iter_file(iter([]), path) == 0
+    assert jsonio.load_file(path) == []
+
+
+def test_failed_dump_file_leaves_no_part_file(backend, tmp_path):
+    path = tmp_path / "transcript.json"
+    path.write_text("[]")
+
+    with patch.object(jsonio, "dumps", side_effect=TypeError("not serializable")):
+        with pytest.raises(TypeError):
+            jsonio.dump_file(SEGMENTS, str(path))
+
+    assert not (tmp_path / "transcript.json.part").exists()
+    assert jsonio.load_file(str(path)) == []
+
+
+def test_interrupted_dump_iter_file_leaves_no_part_file(backend, tmp_path):
+    path = tmp_path / "transcript.json"
+    path.write_text("[]")
+
+    def segments():
+        yield SEGMENTS[0]
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        jsonio.dump_iter_file(segments(), str(path))
+
+    assert not (tmp_path / "transcript.json.part").exists()
+    assert jsonio.load_file(str(path)) == []
+
+
+@pytest.mark.skipif(not jsonio.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_orjson_serializes_numpy_arrays(tmp_path):
+    path = str(tmp_path / "embedding.json")
+    jsonio.dump_file({"vector": np.array([0.5, 1.0], dtype=np.float32)}, path)
+
+    assert jsonio.load_file(path) == {"vector": [0.5, 1.0]}
@@ -175,3 +175,42 @@ def test_transcribe_with_different_model_callback_regenerate(tmp_path):
         with open(metadata_file, "r") as f:
             saved_meta = json.load(f)
             assert saved_meta["model"] == "large-v3"
+
+def test_transcribe_fingerprint_skips_metadata_check(tmp_path):
+    """
+    Test that a matching settings fingerprint short-circuits the metadata comparison.
+    """
+    dummy_video = tmp_path / "fingerprint_test.mp4"
+    dummy_video.write_text("fake video")
+
+    with patch('voxgrep.core.transcriber.WhisperModel') as mock_whisper:
+        mock_model = MagicMock()
+        mock_whisper.return_value = mock_model
+
+        mock_segment = MagicMock()
+        mock_segment.text = "Fresh transcript"
+        mock_segment.start = 0.0
+        mock_segment.end = 1.0
+        mock_segment.words = []
+
+        mock_model.transcribe.return_value = ([mock_segment], MagicMock(duration=1.0, language="en"))
+
+        transcriber.transcribe(str(dummy_video), model_name="tiny", device="cpu")
+
+    assert (tmp_path / "fingerprint_test.tmeta").exists()
+
+    # Tamper with the verbose metadata; the fingerprint alone should decide reuse
+    metadata_file = tmp_path / "fingerprint_test.transcript_meta.json"
+    with open(metadata_file, "w") as f:
+        json.dump({"model": "other"}, f)
+
+    def fail_callback(existing_meta, current_meta):
+        raise AssertionError("metadata should not be compared")
+
+    result = transcriber.transcribe(
+        str(dummy_video),
+        model_name="tiny",
+        device="cpu",
+        on_existing_transcript=fail_callback
+    )
+    assert result[0]["content"] == "Fresh transcript"
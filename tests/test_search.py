@@ -16,6 +16,38 @@ def test_find_transcript_prefer():
     found = search_mod.find_transcript(testvid, prefer=".srt")
     assert found.endswith("metallica.srt")
 
+def test_find_transcript_cache_sees_new_files(tmp_path):
+    import os
+    video = tmp_path / "clip.mp4"
+    video.write_text("dummy")
+    # Backdate the directory so the lookup is eligible for caching
+    os.utime(tmp_path, ns=(0, 0))
+    assert search_mod.find_transcript(str(video)) is None
+
+    (tmp_path / "clip.srt").write_text("")
+    found = search_mod.find_transcript(str(video))
+    assert found is not None and found.endswith("clip.srt")
+
+def test_transcript_cache_evicts_least_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_mod.TranscriptCache, "MAXSIZE", 2)
+    search_mod.TranscriptCache.clear()
+    paths = []
+    for name in ("a.json", "b.json", "c.json"):
+        path = tmp_path / name
+        path.write_text("[]")
+        paths.append(str(path))
+
+    search_mod.TranscriptCache.set(paths[0], [{"content": "a"}])
+    search_mod.TranscriptCache.set(paths[1], [{"content": "b"}])
+    # Touch "a" so "b" becomes the least recently used entry
+    assert search_mod.TranscriptCache.get(paths[0]) == [{"content": "a"}]
+    search_mod.TranscriptCache.set(paths[2], [{"content": "c"}])
+
+    assert search_mod.TranscriptCache.get(paths[1]) is None
+    assert search_mod.TranscriptCache.get(paths[0]) is not None
+    assert search_mod.TranscriptCache.get(paths[2]) is not None
+    search_mod.TranscriptCache.clear()
+
 def test_parse_transcript_srt():
     testvid = File("metallica.mp4")
     transcript = search_mod.parse_transcript(testvid, prefer=".srt")
@@ -29,6 +61,13 @@ def test_search_sentence():
     assert len(results) == 1
     assert "concerto" in results[0]["content"]
 
+def test_search_sentence_multiple_queries():
+    testvid = File("metallica.mp4")
+    single = search_mod.search(testvid, "concerto", search_type="sentence", prefer=".srt")
+    # Both queries hit the same line; it should only be returned once
+    results = search_mod.search(testvid, ["concerto", "concer"], search_type="sentence", prefer=".srt")
+    assert results == single
+
 def test_search_fragment():
     testvid = File("metallica.mp4")
     # "Prometo ser" is a fragment in the JSON/SRT if word timestamps exist
@@ -53,3 +92,45 @@ def test_get_ngrams():
     # Should have pairs of words
     assert len(ngrams) > 0
     assert len(ngrams[0]) == 2
+
+def test_count_ngrams_matches_get_ngrams(tmp_path, monkeypatch):
+    from collections import Counter
+    monkeypatch.setenv("VOXGREP_CACHE_DIR", str(tmp_path))
+    files = [File("metallica.mp4"), File("metallica.mp4")]
+    expected = Counter(search_mod.get_ngrams(files, n=3))
+    # Second call is served from the on-disk cache
+    for _ in range(2):
+        counts = search_mod.count_ngrams(files, n=3)
+        assert counts == expected
+        assert counts.most_common(10) == expected.most_common(10)
+    assert list((tmp_path / "ngrams").glob("*-3.pkl"))
+
+def test_synthesize_word_timestamps_even_split():
+    from voxgrep.core.word_timestamps import synthesize_word_timestamps
+    transcript = [
+        {"content": "one two three", "start": 1.0, "end": 2.5},
+        {"content": "", "start": 3.0, "end": 4.0},
+        {"content": "four five", "start": 5.0, "end": 6.0},
+    ]
+    words = synthesize_word_timestamps(transcript, file="clip.mp4", log_info=False)
+    assert [w["word"] for w in words] == ["one", "two", "three", "four", "five"]
+    assert [w["start"] for w in words] == pytest.approx([1.0, 1.5, 2.0, 5.0, 5.5])
+    assert [w["end"] for w in words] == pytest.approx([1.5, 2.0, 2.5, 5.5, 6.0])
+    assert all(w["file"] == "clip.mp4" for w in words)
+
+def test_synthesize_word_arrays_matches_dicts():
+    from voxgrep.core.word_timestamps import synthesize_word_arrays, synthesize_word_timestamps
+    transcript = [
+        {"content": "one two three", "start": 1.0, "end": 2.5},
+        {"content": "four five", "start": 5.0, "end": 6.0},
+    ]
+    words = synthesize_word_timestamps(transcript, log_info=False)
+    arrays = synthesize_word_arrays(transcript, log_info=False)
+    assert arrays.words.tolist() == [w["word"] for w in words]
+    assert arrays.starts.tolist() == [w["start"] for w in words]
+    assert arrays.ends.tolist() == [w["end"] for w in words]
+
+    # Existing word timestamps are used as-is
+    timed = search_mod.parse_transcript(File("metallica.mp4"), prefer=".json")
+    arrays = synthesize_word_arrays(timed, log_info=False)
+    assert arrays.words.tolist() == [w["word"] for line in timed for w in line["words"]]
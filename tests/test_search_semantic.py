@@ -44,6 +44,22 @@ def test_semantic_search_mock(mock_cos_sim, mock_transformer, tmp_path):
     assert results[0]["content"] == "Match this"
     assert results[0]["score"] == 0.9
 
+def test_encode_missing_batches_files(tmp_path):
+    mock_model = MagicMock()
+    mock_model.encode.return_value = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+    vid_a = str(tmp_path / "a.mp4")
+    vid_b = str(tmp_path / "b.mp4")
+    with patch('voxgrep.core.engine.SemanticModel.get_instance', return_value=mock_model):
+        result = search_engine.encode_missing({vid_a: ["one", "two"], vid_b: ["three"]})
+
+    # One model call covers every file
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args[0][0] == ["one", "two", "three"]
+    assert result[vid_a].shape == (2, 2)
+    assert result[vid_b].tolist() == [[4.0, 5.0]]
+    assert np.array_equal(search_engine.get_cached_embeddings(vid_b), result[vid_b])
+
 def test_mashup_punctuation_fix(tmp_path):
     # Test the punctuation fix I added earlier
     transcript = [{
@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import patch, MagicMock
 from voxgrep import transcribe
 import json
@@ -40,6 +41,9 @@ def test_transcribe_whisper_mock(mock_whisper, tmp_path):
         data = json.load(f)
         assert data[0]["content"] == "Hello world"
 
+    # Streamed partial file is folded into the final transcript
+    assert not (tmp_path / "test.json.partial.jsonl").exists()
+
 def test_transcribe_mlx_mock(tmp_path):
     # Ensure mlx_whisper exists in the module so we can patch it
     # This is necessary because on Windows/Linux mlx_whisper import fails and the name isn't defined
@@ -76,3 +80,129 @@ def test_transcribe_mlx_mock(tmp_path):
         assert len(result[0]["words"]) == 2
         assert result[0]["words"][0]["word"] == "Hello"
 
+
+def test_resolve_mlx_model_quantization():
+    resolve = transcribe.resolve_mlx_model
+    assert resolve("tiny") == "mlx-community/whisper-tiny-mlx"
+    assert resolve("large-v3", quantization="int4") == "mlx-community/whisper-large-v3-mlx-4bit"
+    # Full repos are mapped to their quantized counterpart too
+    assert resolve("mlx-community/whisper-base-mlx", quantization="int4") == "mlx-community/whisper-base-mlx-4bit"
+    # Unknown quantization falls back to full precision
+    assert resolve("tiny", quantization="int3") == "mlx-community/whisper-tiny-mlx"
+
+@patch('voxgrep.transcribe.WhisperModel')
+def test_transcribe_fills_word_table(mock_whisper, tmp_path):
+    mock_model = MagicMock()
+    mock_whisper.return_value = mock_model
+
+    mock_segment = MagicMock()
+    mock_segment.text = "Hello world"
+    mock_segment.start = 0.0
+    mock_segment.end = 1.0
+    mock_segment.words = [
+        MagicMock(word=" Hello", start=0.0, end=0.5, probability=0.9),
+        MagicMock(word=" world", start=0.5, end=1.0, probability=0.9)
+    ]
+    mock_model.transcribe.return_value = ([mock_segment], MagicMock(duration=1.0, language="en"))
+
+    dummy_video = tmp_path / "words.mp4"
+    dummy_video.write_text("dummy")
+
+    words = []
+    transcribe.transcribe(str(dummy_video), model_name="tiny", word_table=words)
+    assert words == [
+        {"word": "Hello", "start": 0.0, "end": 0.5, "file": str(dummy_video)},
+        {"word": "world", "start": 0.5, "end": 1.0, "file": str(dummy_video)},
+    ]
+
+    # Reusing the cached transcript yields the same table
+    cached_words = []
+    transcribe.transcribe(str(dummy_video), model_name="tiny", word_table=cached_words)
+    assert cached_words == words
+
+@patch('voxgrep.transcribe.WhisperModel')
+def test_transcribe_many_loads_model_once(mock_whisper, tmp_path):
+    mock_model = MagicMock()
+    mock_whisper.return_value = mock_model
+
+    def make_result(*args, **kwargs):
+        seg = MagicMock()
+        seg.text = "Shared model"
+        seg.start = 0.0
+        seg.end = 1.0
+        seg.words = []
+        return ([seg], MagicMock(duration=1.0, language="en"))
+
+    mock_model.transcribe.side_effect = make_result
+
+    files = []
+    for name in ("one.mp4", "two.mp4"):
+        f = tmp_path / name
+        f.write_text("dummy")
+        files.append(str(f))
+
+    results = transcribe.transcribe_many(files, model_name="tiny", device="cpu")
+
+    assert mock_whisper.call_count == 1
+    assert mock_model.transcribe.call_count == 2
+    assert set(results) == set(files)
+    assert results[files[0]][0]["content"] == "Shared model"
+
+@patch('voxgrep.transcribe.WhisperModel')
+def test_transcribe_many_regenerates_stale_transcript_with_warm_model(mock_whisper, tmp_path):
+    mock_model = MagicMock()
+    mock_whisper.return_value = mock_model
+
+    def make_result(*args, **kwargs):
+        seg = MagicMock()
+        seg.text = "Fresh"
+        seg.start = 0.0
+        seg.end = 1.0
+        seg.words = []
+        return ([seg], MagicMock(duration=1.0, language="en"))
+
+    mock_model.transcribe.side_effect = make_result
+
+    # Transcripts made with another model, which the callback asks to redo
+    files = []
+    for name in ("one", "two"):
+        f = tmp_path / f"{name}.mp4"
+        f.write_text("dummy")
+        (tmp_path / f"{name}.json").write_text(json.dumps([{"content": "Old", "start": 0, "end": 1}]))
+        (tmp_path / f"{name}.transcript_meta.json").write_text(json.dumps({"model": "base", "device": "cpu"}))
+        files.append(str(f))
+
+    results = transcribe.transcribe_many(
+        files, model_name="tiny", device="cpu",
+        on_existing_transcript=lambda existing, current: False
+    )
+
+    assert mock_whisper.call_count == 1
+    assert mock_model.transcribe.call_count == 2
+    assert all(results[f][0]["content"] == "Fresh" for f in files)
+    mock_model.model.unload_model.assert_called_once()
+
+@patch('voxgrep.transcribe.WhisperModel')
+def test_transcribe_failure_removes_partial_file(mock_whisper, tmp_path):
+    mock_model = MagicMock()
+    mock_whisper.return_value = mock_model
+
+    def segment_generator():
+        seg = MagicMock()
+        seg.text = "Before failure"
+        seg.start = 0.0
+        seg.end = 1.0
+        seg.words = []
+        yield seg
+        raise RuntimeError("decoder crashed")
+
+    mock_model.transcribe.return_value = (segment_generator(), MagicMock(duration=2.0, language="en"))
+
+    dummy_video = tmp_path / "broken.mp4"
+    dummy_video.write_text("dummy")
+
+    with pytest.raises(transcribe.TranscriptionFailedError):
+        transcribe.transcribe(str(dummy_video), model_name="tiny")
+
+    assert not (tmp_path / "broken.json").exists()
+    assert not (tmp_path / "broken.json.partial.jsonl").exists()
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+import numpy as np
+from sqlmodel import SQLModel, Session, create_engine
+
+from voxgrep.server import vector_store
+from voxgrep.server.models import Video, Embedding
+from voxgrep.server.vector_store import VectorStore, _IndexState
+
+
+def _normalized(count, dim=8, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = rng.standard_normal((count, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def _state(embeddings, row_video_ids):
+    row_ids = np.arange(1, len(embeddings) + 1, dtype=np.int64)
+    return _IndexState.from_arrays(embeddings, row_ids, np.asarray(row_video_ids, dtype=np.int64))
+
+
+def _store(tmp_path):
+    store = VectorStore()
+    store._snapshot_dir = tmp_path / "vector_index"
+    return store
+
+
+def test_score_rows_int8_matches_float32():
+    embeddings = _normalized(50)
+    video_ids = np.arange(50) % 3
+    query = _normalized(1, seed=1)[0]
+    float_state = _state(embeddings, video_ids)
+    int8_state = _state(np.round(embeddings * 127).astype(np.int8), video_ids)
+    rows = np.array([2, 5, 17, 31, 49])
+
+    # A small block size makes the int8 path span several blocks
+    with patch.object(vector_store, "INT8_SCORE_BLOCK", 7):
+        for subset in (None, rows):
+            expected = float_state.score_rows(query, subset)
+            scores = int8_state.score_rows(query, subset)
+            assert scores.dtype == np.float32
+            assert scores.shape == expected.shape
+            np.testing.assert_allclose(scores, expected, atol=0.03)
+
+    np.testing.assert_allclose(
+        float_state.score_rows(query, rows), float_state.score_rows(query)[rows], rtol=1e-6
+    )
+
+
+def test_rows_for_videos_missing_and_duplicate_ids():
+    state = _state(_normalized(6), [3, 1, 3, 2, 1, 3])
+
+    assert state.rows_for_videos([3, 3]).tolist() == [0, 2, 5]
+    assert state.rows_for_videos([1, 99]).tolist() == [1, 4]
+    assert state.rows_for_videos([99, 0]).tolist() == []
+    assert state.rows_for_videos([]).tolist() == []
+    assert state.rows_for_videos([2, 1, 3]).tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_snapshot_round_trip_and_fingerprint_mismatch(tmp_path):
+    store = _store(tmp_path)
+    embeddings = _normalized(4)
+    row_ids = np.array([10, 11, 12, 13], dtype=np.int64)
+    row_video_ids = np.array([1, 1, 2, 2], dtype=np.int64)
+    fingerprint = [4, 13, 123.0, "model", "float32"]
+
+    store._save_snapshot(fingerprint, embeddings, row_ids, row_video_ids)
+    assert not list(store._snapshot_dir.glob("*.part"))
+
+    loaded = store._load_snapshot(fingerprint)
+    assert loaded is not None
+    for saved, restored in zip((embeddings, row_ids, row_video_ids), loaded):
+        np.testing.assert_array_equal(saved, restored)
+
+    assert store._load_snapshot([5, 14, 124.0, "model", "float32"]) is None
+    assert store._load_snapshot([4, 13, 123.0, "model", "int8"]) is None
+
+
+def test_search_filters_by_video_ids(tmp_path):
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    # Non-negative vectors, so every row clears a zero threshold
+    embeddings = np.abs(_normalized(9))
+
+    with Session(engine) as session:
+        for video_id in (1, 2, 3):
+            session.add(Video(
+                id=video_id, path=f"/videos/{video_id}.mp4", filename=f"{video_id}.mp4",
+                size_bytes=1, created_at=0.0
+            ))
+        for i, vector in enumerate(embeddings):
+            session.add(Embedding(
+                video_id=i % 3 + 1, segment_index=i, segment_start=float(i),
+                segment_end=float(i + 1), segment_content=f"segment {i}",
+                embedding_blob=vector.tobytes(), embedding_dim=len(vector)
+            ))
+        session.commit()
+
+        store = _store(tmp_path)
+        with patch.object(vector_store, "TRANSFORMERS_AVAILABLE", True), \
+                patch.object(vector_store, "_encode_query", return_value=embeddings[4]):
+            results = store.search("query", session, threshold=0.0, limit=100, video_ids=[2, 2, 99])
+            unfiltered = store.search("query", session, threshold=0.0, limit=100)
+
+    assert {r["video_id"] for r in results} == {2}
+    assert sorted(r["content"] for r in results) == ["segment 1", "segment 4", "segment 7"]
+    assert results[0]["content"] == "segment 4"
+    assert all(r["file"] == "/videos/2.mp4" for r in results)
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+    assert len(unfiltered) == 9
+    assert unfiltered[0]["content"] == "segment 4"
@@ -3,7 +3,7 @@ Core Logic Package
 """
 from .logic import voxgrep, remove_overlaps, pad_and_sync
 from .engine import search, find_transcript, parse_transcript, get_ngrams, SemanticModel
-from .transcriber import transcribe, transcribe_whisper, transcribe_mlx
+from .transcriber import transcribe, transcribe_whisper, transcribe_mlx, transcribe_many
 from .exporter import create_supercut
 from .types import (
     SearchType,
@@ -14,13 +14,14 @@ from .types import (
     VoxGrepResult,
     TranscriptionResult,
     Segment,
+    WordArray,
 )
 
 __all__ = [
     # Core functions
     "voxgrep", "remove_overlaps", "pad_and_sync",
     "search", "find_transcript", "parse_transcript", "get_ngrams", "SemanticModel",
-    "transcribe", "transcribe_whisper", "transcribe_mlx",
+    "transcribe", "transcribe_whisper", "transcribe_mlx", "transcribe_many",
     "create_supercut",
     # Types
     "SearchType",
@@ -31,4 +32,5 @@ __all__ = [
     "VoxGrepResult",
     "TranscriptionResult",
     "Segment",
+    "WordArray",
 ]
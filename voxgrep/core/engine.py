@@ -1,9 +1,16 @@
+import hashlib
 import os
+import pickle
 import re
-import json
 import random
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice, tee
 from pathlib import Path
-from typing import Iterator, Any
+from typing import Any, Callable, Iterator
 from tqdm import tqdm
 
 import numpy as np
@@ -14,14 +21,17 @@ try:
 except ImportError:
     SEMANTIC_AVAILABLE = False
 
-from .types import SearchType
-from .word_timestamps import synthesize_word_timestamps
+from .types import SearchType, WordArray
+from .word_timestamps import synthesize_word_arrays
 from ..formats import vtt, srt, sphinx
 from ..utils.config import (
     SUBTITLE_EXTENSIONS,
     DEFAULT_SEMANTIC_MODEL,
-    DEFAULT_SEMANTIC_THRESHOLD
+    DEFAULT_SEMANTIC_THRESHOLD,
+    FeatureFlags,
+    get_cache_dir
 )
+from ..utils import jsonio
 from ..utils.helpers import setup_logger, ensure_list
 from ..utils.exceptions import (
     TranscriptNotFoundError,
@@ -34,6 +44,21 @@ logger = setup_logger(__name__)
 # Legacy constant for backwards compatibility
 SUB_EXTS = SUBTITLE_EXTENSIONS
 
+# Directories modified more recently than this bypass the find_transcript cache
+_FIND_TRANSCRIPT_SETTLE_NS = 2_000_000_000
+
+# Characters that make a sentence query a regex rather than a literal string
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Worker threads for loading transcripts during search (ThreadPoolExecutor's default)
+_LOAD_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Word separators for transcripts without word-level timestamps (n-grams)
+_NGRAM_SPLIT = re.compile(r"[.?!,:\"]+\s*|\s+")
+
+# Punctuation ignored when matching words in mash search
+_MASH_PUNCT = re.compile(r"[.?!,:\"]+")
+
 
 class SemanticModel:
     """Singleton class for managing the semantic search model."""
@@ -67,41 +92,72 @@ class SemanticModel:
 
 
 class TranscriptCache:
-    """Singleton for caching parsed transcripts to avoid redundant I/O."""
-    _cache: dict[str, list[dict]] = {}
-    _files_mtime: dict[str, float] = {}
+    """
+    Thread-safe LRU cache of parsed transcripts to avoid redundant I/O.
 
-    @classmethod
-    def get(cls, subfile: str) -> list[dict] | None:
-        """Get transcript from cache if available and file hasn't changed."""
-        if not os.path.exists(subfile):
-            return None
+    Entries are keyed by subtitle path and store the file's mtime alongside
+    the parsed transcript, so edits on disk invalidate them.
+    """
+    MAXSIZE = 512
+    _cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+    _lock = threading.Lock()
 
-        try:
-            mtime = os.path.getmtime(subfile)
-            if subfile in cls._cache and cls._files_mtime.get(subfile) == mtime:
-                return cls._cache[subfile]
-        except OSError:
-            pass
-        return None
+    @classmethod
+    def get(cls, subfile: str, mtime: float | None = None) -> list[dict] | None:
+        """
+        Get transcript from cache if available and file hasn't changed.
+
+        Args:
+            subfile: Path to the subtitle file.
+            mtime: The file's current mtime, if the caller already has it.
+        """
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(subfile)
+            except OSError:
+                return None
+
+        with cls._lock:
+            entry = cls._cache.get(subfile)
+            if entry is None or entry[0] != mtime:
+                return None
+            cls._cache.move_to_end(subfile)
+            return entry[1]
 
     @classmethod
-    def set(cls, subfile: str, transcript: list[dict]):
-        """Cache the transcript and its modification time."""
-        try:
-            cls._cache[subfile] = transcript
-            cls._files_mtime[subfile] = os.path.getmtime(subfile)
-        except OSError:
-            pass
+    def set(cls, subfile: str, transcript: list[dict], mtime: float | None = None):
+        """
+        Cache the transcript and its modification time.
+
+        Args:
+            subfile: Path to the subtitle file.
+            transcript: Parsed transcript segments.
+            mtime: The mtime the transcript was read at, if already known.
+        """
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(subfile)
+            except OSError:
+                return
+
+        with cls._lock:
+            cls._cache[subfile] = (mtime, transcript)
+            cls._cache.move_to_end(subfile)
+            while len(cls._cache) > cls.MAXSIZE:
+                cls._cache.popitem(last=False)
 
     @classmethod
     def clear(cls):
         """Clear the cache."""
-        cls._cache.clear()
-        cls._files_mtime.clear()
+        with cls._lock:
+            cls._cache.clear()
 
 
-def find_transcript(videoname: str, prefer: str | None = None) -> str | None:
+def find_transcript(
+    videoname: str,
+    prefer: str | None = None,
+    dir_listing: list[os.DirEntry] | None = None,
+) -> str | None:
     """
     Find a transcript file for a given video file.
 
@@ -111,45 +167,94 @@ def find_transcript(videoname: str, prefer: str | None = None) -> str | None:
     Args:
         videoname: Path to the video file
         prefer: Preferred subtitle extension to try first (e.g., '.srt')
+        dir_listing: Optional pre-scanned entries of the video's directory.
+            Callers checking many videos in one folder can pass the same
+            listing to avoid re-reading the directory for each video.
 
     Returns:
         Path to the transcript file if found, None otherwise
     """
-    video_path = Path(videoname)
-    if not video_path.parent.exists():
+    if dir_listing is not None:
+        return _find_transcript(videoname, prefer, dir_listing)
+
+    # Results are memoized per directory state: adding, removing or renaming
+    # a file updates the directory mtime, which invalidates the cached entry.
+    try:
+        dir_mtime = os.stat(os.path.dirname(videoname) or ".").st_mtime_ns
+    except OSError:
         return None
+    # Timestamps are coarse, so a directory changed in the last couple of
+    # seconds could change again without its mtime moving; skip the cache.
+    if time.time_ns() - dir_mtime < _FIND_TRANSCRIPT_SETTLE_NS:
+        return _find_transcript(videoname, prefer)
+    return _find_transcript_cached(videoname, prefer, dir_mtime)
+
+
+@lru_cache(maxsize=4096)
+def _find_transcript_cached(videoname: str, prefer: str | None, dir_mtime: int) -> str | None:
+    """Memoized find_transcript lookup keyed on the parent directory mtime."""
+    return _find_transcript(videoname, prefer)
+
+
+def _find_transcript(
+    videoname: str,
+    prefer: str | None = None,
+    dir_listing: list[os.DirEntry] | None = None,
+) -> str | None:
+    """Uncached implementation of find_transcript."""
+    video_path = Path(videoname)
+    parent = video_path.parent
 
     _sub_exts = list(SUBTITLE_EXTENSIONS)
     if prefer is not None:
         _sub_exts = [prefer] + _sub_exts
 
-    parent = video_path.parent
     name_stem = video_path.stem
 
-    # Strategy 1: Exact match (video.mp4 -> video.srt)
-    for ext in _sub_exts:
-        candidate = video_path.with_suffix(ext)
-        if candidate.exists():
-            return candidate.as_posix()
+    if dir_listing is None:
+        if not parent.exists():
+            return None
 
-    # Pre-list files once for efficiency
-    try:
-        all_files = list(parent.iterdir())
-    except OSError:
-        return None
+        # Strategy 1: Exact match (video.mp4 -> video.srt)
+        for ext in _sub_exts:
+            candidate = video_path.with_suffix(ext)
+            if candidate.is_file():
+                return candidate.as_posix()
+
+        # Pre-list files once for efficiency
+        try:
+            with os.scandir(parent) as it:
+                dir_listing = list(it)
+        except OSError:
+            return None
+    else:
+        # Strategy 1 against the cached listing
+        names = {entry.name for entry in dir_listing if entry.is_file()}
+        for ext in _sub_exts:
+            if name_stem + ext in names:
+                return video_path.with_suffix(ext).as_posix()
+
+    # Bucket files by extension in one pass; DirEntry caches its type, so
+    # this needs no extra stat calls
+    all_files = []
+    by_ext: dict[str, list[str]] = defaultdict(list)
+    for entry in dir_listing:
+        if entry.is_file():
+            all_files.append(entry.name)
+            by_ext[os.path.splitext(entry.name)[1]].append(entry.name)
 
     # Strategy 2: Fuzzy match for filenames with language codes (video.en.srt)
     for ext in _sub_exts:
-        for f in all_files:
-            if f.is_file() and f.name.startswith(name_stem) and f.suffix == ext:
-                return f.as_posix()
+        for name in by_ext.get(ext, ()):
+            if name.startswith(name_stem):
+                return (parent / name).as_posix()
 
     # Strategy 3: Legacy regex-based fallback for complex multi-part extensions
     for ext in _sub_exts:
-        pattern = re.escape(name_stem) + r".*?\.?" + ext.replace(".", "")
-        for f in all_files:
-            if f.is_file() and re.search(pattern, f.name):
-                return f.as_posix()
+        pattern = re.compile(re.escape(name_stem) + r".*?\.?" + ext.replace(".", ""))
+        for name in all_files:
+            if pattern.search(name):
+                return (parent / name).as_posix()
 
     return None
 
@@ -174,52 +279,136 @@ def parse_transcript(
         logger.error(f"No subtitle file found for {videoname}")
         return None
 
+    # Stat once and share the mtime between the cache lookup and store
+    try:
+        mtime = os.stat(subfile).st_mtime
+    except OSError:
+        logger.error(f"Could not access subtitle file {subfile}")
+        return None
+
     # Check cache first
-    cached = TranscriptCache.get(subfile)
+    cached = TranscriptCache.get(subfile, mtime)
     if cached is not None:
         return cached
 
     transcript = None
 
     try:
-        with open(subfile, "r", encoding="utf8") as infile:
-            if subfile.endswith(".srt"):
-                transcript = srt.parse(infile)
-            elif subfile.endswith(".vtt"):
-                transcript = vtt.parse(infile)
-            elif subfile.endswith(".json"):
-                transcript = json.load(infile)
-            elif subfile.endswith(".transcript"):
-                transcript = sphinx.parse(infile)
-    except (json.JSONDecodeError, UnicodeDecodeError, ValueError, IndexError) as e:
+        if subfile.endswith(".json"):
+            # Word-level JSON can run to megabytes; decode it straight from
+            # bytes (orjson when available) rather than through a text stream
+            transcript = jsonio.load_file(subfile)
+        else:
+            with open(subfile, "r", encoding="utf8") as infile:
+                if subfile.endswith(".srt"):
+                    transcript = srt.parse(infile)
+                elif subfile.endswith(".vtt"):
+                    transcript = vtt.parse(infile)
+                elif subfile.endswith(".transcript"):
+                    transcript = sphinx.parse(infile)
+    except (jsonio.JSONDecodeError, UnicodeDecodeError, ValueError, IndexError) as e:
         logger.error(f"Error parsing transcript file {subfile}: {e}")
         return None
 
     if transcript is not None:
-        TranscriptCache.set(subfile, transcript)
+        TranscriptCache.set(subfile, transcript, mtime)
 
     return transcript
 
 
+def get_transcript_path(videoname: str) -> str:
+    """Get the path of the JSON transcript written for a video."""
+    return os.path.splitext(videoname)[0] + ".json"
+
+
 def get_embeddings_path(videoname: str) -> str:
     """Get the path where embeddings for a video are cached."""
     return os.path.splitext(videoname)[0] + ".embeddings.npy"
 
 
-def get_embeddings(videoname: str, transcript: list[dict], force: bool = False) -> np.ndarray:
+def get_cached_embeddings(videoname: str) -> np.ndarray | None:
     """
-    Get or generate semantic embeddings for a transcript.
+    Load previously saved embeddings for a video, if any.
+
+    The cache is memory-mapped read-only, so pages are only read when the
+    rows are copied into the search matrix and are shared between processes.
     """
     emb_path = get_embeddings_path(videoname)
-    if os.path.exists(emb_path) and not force:
-        return np.load(emb_path)
+    if not os.path.isfile(emb_path):
+        return None
+    return np.load(emb_path, mmap_mode="r")
+
+
+def encode_missing(files_to_sentences: dict[str, list[str]]) -> dict[str, np.ndarray]:
+    """
+    Encode sentences for several files in a single model call and cache them.
+
+    All sentences are flattened into one list so the model can batch across
+    file boundaries, then split back per file and saved next to each video.
+
+    Args:
+        files_to_sentences: Mapping of video path to its transcript sentences.
+
+    Returns:
+        Mapping of video path to its embeddings array.
+    """
+    if not files_to_sentences:
+        return {}
 
     model = SemanticModel.get_instance()
+    all_sentences = []
+    boundaries = []
+    for videoname, sentences in files_to_sentences.items():
+        all_sentences.extend(sentences)
+        boundaries.append(len(all_sentences))
+
+    logger.info(
+        f"Generating embeddings for {len(files_to_sentences)} file(s) "
+        f"({len(all_sentences)} sentences)..."
+    )
+    embeddings = model.encode(
+        all_sentences, batch_size=64, convert_to_numpy=True, show_progress_bar=False
+    )
+
+    result = {}
+    if FeatureFlags().enable_fp16_embeddings:
+        # Opt-in: halves disk size and load time at a small precision cost
+        embeddings = np.asarray(embeddings, dtype=np.float16)
+    for videoname, chunk in zip(files_to_sentences, np.split(embeddings, boundaries[:-1])):
+        np.save(get_embeddings_path(videoname), chunk)
+        result[videoname] = chunk
+    return result
+
+
+def get_embeddings(videoname: str, transcript: list[dict], force: bool = False) -> np.ndarray:
+    """
+    Get or generate semantic embeddings for a transcript.
+    """
+    if not force:
+        embeddings = get_cached_embeddings(videoname)
+        if embeddings is not None:
+            return embeddings
+
     sentences = [line["content"] for line in transcript]
-    logger.info(f"Generating embeddings for {videoname}...")
-    embeddings = model.encode(sentences, show_progress_bar=False)
-    np.save(emb_path, embeddings)
-    return embeddings
+    return encode_missing({videoname: sentences})[videoname]
+
+
+def _transcript_words(transcript: list[dict]) -> Iterator[str]:
+    """Words of a transcript, from word timestamps or split from the text."""
+    return chain.from_iterable(
+        (w["word"] for w in line["words"]) if "words" in line
+        else _NGRAM_SPLIT.split(line["content"])
+        for line in transcript
+    )
+
+
+def _iter_ngrams(words: list[str], n: int) -> Iterator[tuple]:
+    """n-grams of a word list."""
+    # n staggered iterators over one list instead of n sliced copies of it
+    iterators = tee(words, n)
+    for offset, it in enumerate(iterators):
+        next(islice(it, offset, offset), None)
+    return zip(*iterators)
 
 
 def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | None = None) -> Iterator[tuple]:
@@ -233,13 +422,9 @@ def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | No
         transcript = parse_transcript(file)
         if transcript is None:
             continue
-        for line in transcript:
-            if "words" in line:
-                words += [w["word"] for w in line["words"]]
-            else:
-                words += re.split(r"[.?!,:\"]+\s*|\s+", line["content"])
+        words.extend(_transcript_words(transcript))
 
-    ngrams = zip(*[words[i:] for i in range(n)])
+    ngrams = _iter_ngrams(words, n)
 
     if ignored_words:
         normalized_ignored = set(w.lower() for w in ignored_words)
@@ -251,10 +436,125 @@ def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | No
         yield from ngrams
 
 
+def _ngram_cache_path(file: str, mtime_ns: int, n: int) -> Path:
+    digest = hashlib.sha1(os.path.abspath(file).encode("utf-8")).hexdigest()
+    return get_cache_dir() / "ngrams" / f"{digest}-{mtime_ns}-{n}.pkl"
+
+
+def _file_ngram_counts(file: str, n: int) -> dict | None:
+    """
+    Count the n-grams inside one transcript, cached on disk by mtime.
+
+    Returns a dict with the Counter plus the first and last n-1 words, which
+    count_ngrams needs to rebuild n-grams that span two files. Returns None
+    when the file has no transcript.
+    """
+    subfile = find_transcript(file)
+    if subfile is None:
+        return None
+    cache_path = _ngram_cache_path(file, os.stat(subfile).st_mtime_ns, n)
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    transcript = parse_transcript(file)
+    if transcript is None:
+        return None
+    words = list(_transcript_words(transcript))
+    edge = n - 1
+    entry = {
+        "counts": Counter(_iter_ngrams(words, n)),
+        "head": words[:edge],
+        "tail": words[-edge:] if edge else [],
+    }
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop counts cached for older versions of this transcript
+        for stale in cache_path.parent.glob(f"{cache_path.name.split('-')[0]}-*-{n}.pkl"):
+            stale.unlink(missing_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug(f"Could not cache n-grams for {file}: {e}")
+    return entry
+
+
+def count_ngrams(
+    files: str | list[str],
+    n: int = 1,
+    ignored_words: list[str] | None = None
+) -> Counter:
+    """
+    Count n-grams across transcript files.
+
+    Same counts (and key order) as Counter(get_ngrams(...)), but each file's
+    counts are computed on a thread pool and cached on disk, so repeated
+    calls over an unchanged library only merge cached Counters.
+    """
+    files = ensure_list(files)
+    total = Counter()
+    # Last n-1 words seen so far; n-grams that start here continue into
+    # the next file, as they do in get_ngrams' concatenated word stream
+    carry: list[str] = []
+    edge = n - 1
+
+    for _, entry in _map_files(partial(_file_ngram_counts, n=n), files, "Counting n-grams"):
+        if entry is None:
+            continue
+        if carry:
+            joined = carry + entry["head"]
+            total.update(
+                tuple(joined[i:i + n]) for i in range(len(carry)) if i + n <= len(joined)
+            )
+        total.update(entry["counts"])
+        if edge:
+            carry = (carry + entry["tail"])[-edge:] if len(entry["head"]) < edge else entry["tail"]
+
+    if ignored_words:
+        normalized_ignored = set(w.lower() for w in ignored_words)
+        total = Counter({
+            g: c for g, c in total.items()
+            if not any(w.lower() in normalized_ignored for w in g)
+        })
+    return total
+
+
 # =============================================================================
 # Search Strategy Implementations
 # =============================================================================
 
+def _map_files(fn: Callable[[str], Any], files: list[str], desc: str) -> Iterator[tuple[str, Any]]:
+    """
+    Apply fn to each file on a thread pool, yielding (file, result) in order.
+
+    Loading a transcript is mostly file I/O, so parsing the next few files
+    overlaps with searching the current one. At most two tasks per worker
+    are in flight, keeping memory bounded on large libraries.
+    """
+    workers = min(_LOAD_WORKERS, len(files))
+    with tqdm(total=len(files), desc=desc, unit="file", disable=len(files) < 2) as progress:
+        if workers < 2:
+            for file in files:
+                yield file, fn(file)
+                progress.update()
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            remaining = iter(files)
+            in_flight = deque(
+                (file, pool.submit(fn, file)) for file in islice(remaining, workers * 2)
+            )
+            while in_flight:
+                file, future = in_flight.popleft()
+                for next_file in islice(remaining, 1):
+                    in_flight.append((next_file, pool.submit(fn, next_file)))
+                yield file, future.result()
+                progress.update()
+
+
 def _search_mash(
     files: list[str],
     query: list[str],
@@ -266,18 +566,27 @@ def _search_mash(
     Finds individual words and picks random instances for each query word,
     enabling creative remixing of speech.
     """
-    all_words = []
-
-    for file in tqdm(files, desc="Indexing words for mash", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    # Normalized word -> every occurrence as (file, word columns, position),
+    # so each lookup is a dict hit and no per-word dict is built
+    index: dict[str, list[tuple[str, WordArray, int]]] = defaultdict(list)
+    # Raw word -> normalized key. Vocabulary is far smaller than the word
+    # count, so most words skip the lower()/regex work entirely.
+    keys: dict[str, str] = {}
+
+    load = partial(parse_transcript, prefer=prefer)
+    for file, transcript in _map_files(load, files, "Indexing words for mash"):
         if not transcript:
             continue
 
         # Get word-level timestamps (synthesized if needed)
-        words = synthesize_word_timestamps(transcript, file=file, log_info=True)
-        all_words.extend(words)
-
-    if not all_words:
+        word_array = synthesize_word_arrays(transcript, file=file, log_info=True)
+        for i, raw in enumerate(word_array.words.tolist()):
+            key = keys.get(raw)
+            if key is None:
+                key = keys[raw] = _MASH_PUNCT.sub("", raw.lower())
+            index[key].append((file, word_array, i))
+
+    if not index:
         logger.error("Could not extract any words from the provided files.")
         return []
 
@@ -285,20 +594,86 @@ def _search_mash(
     for _query in query:
         queries = _query.split(" ")
         for q in queries:
-            matches = [w for w in all_words if re.sub(r"[.?!,:\"]+", "", w["word"].lower()) == q.lower()]
+            matches = index.get(q.lower())
             if not matches:
                 continue
-            word = random.choice(matches)
+            file, word_array, i = random.choice(matches)
             segments.append({
-                "file": word["file"],
-                "start": word["start"],
-                "end": word["end"],
-                "content": word["word"],
+                "file": file,
+                "start": float(word_array.starts[i]),
+                "end": float(word_array.ends[i]),
+                "content": word_array.words[i],
             })
 
     return segments
 
 
+def _stack_embeddings(chunks: list[np.ndarray], device: Any = None) -> Any:
+    """
+    Copy per-file embedding blocks into one preallocated matrix.
+
+    Without an accelerator the result is a NumPy array filled in place from
+    the (memory-mapped) chunks. For CUDA/MPS the matrix is allocated on the
+    device in fp16 and each chunk is uploaded as it is read; on CUDA the
+    host copy is pinned and transferred asynchronously, so paging in the
+    next file overlaps with the previous upload.
+    """
+    total_rows = sum(len(chunk) for chunk in chunks)
+    dim = chunks[0].shape[1]
+    offset = 0
+
+    if device is None or device.type == "cpu":
+        out = np.empty((total_rows, dim), dtype=np.result_type(*chunks))
+        for chunk in chunks:
+            out[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return out
+
+    out = torch.empty((total_rows, dim), device=device, dtype=torch.float16)
+    for chunk in chunks:
+        host = torch.empty(chunk.shape, dtype=torch.float16, pin_memory=device.type == "cuda")
+        host.numpy()[...] = chunk
+        out[offset:offset + len(chunk)].copy_(host, non_blocking=True)
+        offset += len(chunk)
+    return out
+
+
+def _score_embeddings(
+    query_embeddings: Any,
+    corpus_embeddings: Any,
+    threshold: float,
+) -> list[tuple[int, int, float]]:
+    """
+    Find (query index, corpus index, score) triples at or above a threshold.
+
+    Tensor queries are scored on their own device: the corpus (a NumPy
+    array or a tensor already on that device) is converted once, in fp16 on
+    accelerators, then normalized and multiplied in a single matmul.
+    Thresholding also happens on-device so only the hits are copied back to
+    the CPU.
+    """
+    if isinstance(query_embeddings, torch.Tensor):
+        device = query_embeddings.device
+        # Half precision halves transfer and matmul bandwidth on GPU/MPS;
+        # CPU kernels for fp16 are slow or missing, so stay in fp32 there.
+        dtype = torch.float32 if device.type == "cpu" else torch.float16
+        with torch.no_grad():
+            q = torch.nn.functional.normalize(query_embeddings.to(dtype), dim=1)
+            c = torch.nn.functional.normalize(
+                torch.as_tensor(corpus_embeddings, device=device, dtype=dtype), dim=1
+            )
+            cos_scores = q @ c.T
+            hits = (cos_scores >= threshold).nonzero(as_tuple=False)
+            hit_scores = cos_scores[hits[:, 0], hits[:, 1]].float().cpu().tolist()
+        return [(int(i), int(j), score) for (i, j), score in zip(hits.cpu().tolist(), hit_scores)]
+
+    # NumPy query embeddings: compute all scores at once on the CPU
+    corpus_embeddings = np.asarray(corpus_embeddings, dtype=np.float32)
+    cos_scores = np.asarray(util.cos_sim(query_embeddings, corpus_embeddings))
+    rows, cols = np.nonzero(cos_scores >= threshold)
+    return [(int(i), int(j), float(cos_scores[i, j])) for i, j in zip(rows, cols)]
+
+
 def _search_semantic(
     files: list[str],
     query: list[str],
@@ -316,54 +691,87 @@ def _search_semantic(
         raise SemanticSearchNotAvailableError("Semantic search requires sentence-transformers.")
 
     model = SemanticModel.get_instance()
-    query_embeddings = model.encode(query, show_progress_bar=False)
+    # Keep query embeddings on the model's device so scoring runs there
+    query_embeddings = model.encode(query, convert_to_tensor=True, show_progress_bar=False)
 
     # Batch processing: Collect all embeddings from all files
-    total_embeddings = []
-    embedding_metadata = []  # (file, segment)
+    file_embeddings = {}
+    file_transcripts = {}
+    missing = {}
 
-    for file in tqdm(files, desc="Loading embeddings", unit="file", disable=len(files) < 2):
+    def load(file: str) -> tuple[list[dict] | None, np.ndarray | None]:
+        # Read the embedding cache in the same worker as the transcript
         transcript = parse_transcript(file, prefer=prefer)
+        if not transcript or force_reindex:
+            return transcript, None
+        return transcript, get_cached_embeddings(file)
+
+    for file, (transcript, embeddings) in _map_files(load, files, "Loading embeddings"):
         if not transcript:
             continue
 
-        embeddings = get_embeddings(file, transcript, force=force_reindex)
-        total_embeddings.append(embeddings)
-        for j in range(len(transcript)):
-            embedding_metadata.append((file, transcript[j]))
+        file_transcripts[file] = transcript
+        if embeddings is None:
+            missing[file] = [line["content"] for line in transcript]
+        else:
+            file_embeddings[file] = embeddings
+
+    # Encode every uncached file in one batched model call
+    file_embeddings.update(encode_missing(missing))
 
-    if not total_embeddings or len(query_embeddings) == 0:
+    if not file_transcripts or len(query_embeddings) == 0:
         return []
 
-    # Combine into one large matrix
-    combined_embeddings = np.vstack(total_embeddings)
+    # Combine into one preallocated matrix, on the scoring device if possible
+    device = query_embeddings.device if isinstance(query_embeddings, torch.Tensor) else None
+    combined_embeddings = _stack_embeddings(
+        [file_embeddings[file] for file in file_transcripts], device
+    )
+    embedding_metadata = []  # (file, segment)
+    for file, transcript in file_transcripts.items():
+        embedding_metadata.extend((file, segment) for segment in transcript)
 
     # Guard against dimension mismatch
     if query_embeddings.ndim < 2 or query_embeddings.shape[1] == 0:
         logger.error("Query embeddings have invalid shape. Check your search terms.")
         return []
 
-    # Compute all scores at once (matrix multiplication)
-    cos_scores = util.cos_sim(query_embeddings, combined_embeddings)
-
     segments = []
-    for i, _query in enumerate(query):
-        scores = cos_scores[i]
-        # Use argwhere or similar for fast thresholding
-        indices = np.where(scores >= threshold)[0]
-        for idx in indices:
-            file_path, segment = embedding_metadata[idx]
-            segments.append({
-                "file": file_path,
-                "start": segment["start"],
-                "end": segment["end"],
-                "content": segment["content"],
-                "score": float(scores[idx])
-            })
+    for query_idx, idx, score in _score_embeddings(query_embeddings, combined_embeddings, threshold):
+        file_path, segment = embedding_metadata[idx]
+        segments.append({
+            "file": file_path,
+            "start": segment["start"],
+            "end": segment["end"],
+            "content": segment["content"],
+            "score": score
+        })
 
     return sorted(segments, key=lambda k: k["score"], reverse=True)
 
 
+def _combine_queries(compiled_queries: list[tuple[str, re.Pattern]]) -> re.Pattern | None:
+    """
+    Merge per-query regexes into a single alternation.
+
+    Scanning each line once with one pattern replaces K separate
+    ``search`` calls. Returns None when the patterns cannot be safely
+    combined: capture groups would be renumbered (breaking numeric
+    backreferences), and some patterns only compile on their own.
+    """
+    if len(compiled_queries) < 2:
+        return compiled_queries[0][1] if compiled_queries else None
+    if any(regex.groups for _, regex in compiled_queries):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{regex.pattern})" for _, regex in compiled_queries),
+            re.IGNORECASE
+        )
+    except re.error:
+        return None
+
+
 def _search_sentence(
     files: list[str],
     query: list[str],
@@ -373,27 +781,45 @@ def _search_sentence(
     """
     Sentence search: full sentence matching with regex.
 
-    Matches entire transcript segments where the query pattern appears
-    anywhere in the sentence content.
+    Matches entire transcript segments where any query pattern appears
+    anywhere in the sentence content. Each matching segment is returned
+    once, even if several queries match it.
     """
+    # Plain-text queries are matched with a substring test on the lowered
+    # line, which is much cheaper than a regex search; only queries that
+    # actually use regex syntax (or exact-match word boundaries) go through re.
+    literals = []
+    regex_queries = []
+    for q, regex in compiled_queries:
+        if regex.pattern == q and _REGEX_META.isdisjoint(q):
+            literals.append(q.lower())
+        else:
+            regex_queries.append((q, regex))
+
     segments = []
+    combined = _combine_queries(regex_queries)
+    regexes = [combined] if combined is not None else [r for _, r in regex_queries]
 
-    for file in tqdm(files, desc="Searching files", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    load = partial(parse_transcript, prefer=prefer)
+    for file, transcript in _map_files(load, files, "Searching files"):
         if transcript is None:
             continue
 
         file_segments = []
         for line in transcript:
             content = line["content"]
-            for _query_str, _query_regex in compiled_queries:
-                if _query_regex.search(content):
-                    file_segments.append({
-                        "file": file,
-                        "start": line["start"],
-                        "end": line["end"],
-                        "content": content,
-                    })
+            if literals:
+                content_low = content.lower()
+                hit = any(literal in content_low for literal in literals)
+            else:
+                hit = False
+            if hit or any(_query_regex.search(content) for _query_regex in regexes):
+                file_segments.append({
+                    "file": file,
+                    "start": line["start"],
+                    "end": line["end"],
+                    "content": content,
+                })
 
         segments.extend(sorted(file_segments, key=lambda k: k["start"]))
 
@@ -413,45 +839,63 @@ def _search_fragment(
     Uses word-level timestamps to find exact multi-word phrases,
     returning tightly-timed clips of just the matched words.
     """
+    # Prepare each query once. Query words are matched literally (as
+    # case-insensitive substrings), so plain `in` checks on pre-lowered words
+    # replace a regex search per word; word-boundary matching for
+    # exact_match still needs a regex.
+    prepared = []
+    for _query_str, _query_regex in compiled_queries:
+        queries = [q.strip() for q in _query_str.split(" ") if q.strip()]
+        if not queries:
+            continue
+        if exact_match:
+            patterns = [re.compile(r"\b" + re.escape(q) + r"\b", re.IGNORECASE) for q in queries]
+            prepared.append((None, patterns))
+        else:
+            prepared.append(([q.lower() for q in queries], None))
+
     segments = []
 
-    for file in tqdm(files, desc="Searching files", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    load = partial(parse_transcript, prefer=prefer)
+    for file, transcript in _map_files(load, files, "Searching files"):
         if not transcript:
             continue
 
-        # Get word-level timestamps (synthesized if needed)
-        words = synthesize_word_timestamps(transcript, file=file, log_info=True)
+        # Get word-level timestamps (synthesized if needed) as columns
+        word_array = synthesize_word_arrays(transcript, file=file, log_info=True)
 
-        if not words:
+        if not len(word_array):
             continue
 
-        for _query_str, _query_regex in compiled_queries:
-            queries = [q.strip() for q in _query_str.split(" ") if q.strip()]
-            if not queries:
-                continue
+        word_texts = word_array.words.tolist()
+        lowered = [w.lower() for w in word_texts]
+        starts = word_array.starts.tolist()
+        ends = word_array.ends.tolist()
+
+        for literals, patterns in prepared:
+            fragment_len = len(literals or patterns)
+            positions = range(len(word_texts) - fragment_len + 1)
+
+            if literals is not None:
+                first = literals[0]
+                matches = (
+                    i for i in positions
+                    if first in lowered[i]
+                    and all(literals[j] in lowered[i + j] for j in range(1, fragment_len))
+                )
+            else:
+                matches = (
+                    i for i in positions
+                    if all(patterns[j].search(word_texts[i + j]) for j in range(fragment_len))
+                )
 
-            fragment_len = len(queries)
-
-            # Compile individual regex patterns for each query word
-            query_patterns = []
-            for q in queries:
-                if exact_match:
-                    pattern = r"\b" + re.escape(q) + r"\b"
-                else:
-                    pattern = re.escape(q)
-                query_patterns.append(re.compile(pattern, re.IGNORECASE))
-
-            for i in range(len(words) - fragment_len + 1):
-                fragment = words[i:i+fragment_len]
-                # Match each query word against its corresponding fragment word
-                if all(query_patterns[j].search(fragment[j]["word"]) for j in range(fragment_len)):
-                    segments.append({
-                        "file": file,
-                        "start": fragment[0]["start"],
-                        "end": fragment[-1]["end"],
-                        "content": " ".join([w["word"] for w in fragment]),
-                    })
+            for i in matches:
+                segments.append({
+                    "file": file,
+                    "start": starts[i],
+                    "end": ends[i + fragment_len - 1],
+                    "content": " ".join(word_texts[i:i + fragment_len]),
+                })
 
     return segments
 
@@ -8,12 +8,16 @@ import time
 import numpy as np
 import logging
 import os
+from collections import deque
 from typing import Callable, Optional, Any
 
 from .types import TranscriptionBackend
 
 logger = logging.getLogger(__name__)
 
+# Number of stderr lines kept from each child process for error reporting
+STDERR_TAIL_LINES = 20
+
 
 class StreamHandler:
     """
@@ -131,6 +135,23 @@ class StreamHandler:
         if self.process_ffmpeg:
             self.process_ffmpeg.terminate()
 
+    @staticmethod
+    def _drain_stderr(pipe, tail: deque) -> threading.Thread:
+        """
+        Consume a child's stderr line by line on a daemon thread.
+
+        Only the last few lines are kept, so a chatty process neither blocks
+        on a full pipe nor accumulates its whole log in memory.
+        """
+        def _drain():
+            for line in iter(pipe.readline, b""):
+                tail.append(line)
+            pipe.close()
+
+        thread = threading.Thread(target=_drain, daemon=True)
+        thread.start()
+        return thread
+
     def _io_loop(self, url, output_path):
         logger.info(f"Starting stream download: {url} -> {output_path}")
 
@@ -176,6 +197,12 @@ class StreamHandler:
                 stderr=subprocess.PIPE
             )
 
+            ytdlp_stderr = deque(maxlen=STDERR_TAIL_LINES)
+            ytdlp_drain = self._drain_stderr(self.process_ytdlp.stderr, ytdlp_stderr)
+            self._drain_stderr(
+                self.process_ffmpeg.stderr, deque(maxlen=STDERR_TAIL_LINES)
+            )
+
             with open(output_path, "wb") as f_out:
                 while self.running:
                     # Read chunk from yt-dlp
@@ -187,8 +214,9 @@ class StreamHandler:
                         if self.process_ytdlp.poll() is not None:
                             logger.info("yt-dlp download finished.")
                             # Check for errors
-                            stderr_out = self.process_ytdlp.stderr.read()
-                            if stderr_out:
+                            ytdlp_drain.join(timeout=1.0)
+                            if ytdlp_stderr:
+                                stderr_out = b"".join(ytdlp_stderr)
                                 logger.warning(f"yt-dlp stderr: {stderr_out.decode('utf-8', errors='ignore')}")
                             self.running = False
                             break
@@ -246,7 +274,7 @@ class StreamHandler:
                 while len(buffer) >= self.CHUNK_SIZE:
                     # Extract one chunk duration
                     pcm_bytes = buffer[:self.CHUNK_SIZE]
-                    buffer = buffer[self.CHUNK_SIZE:]
+                    del buffer[:self.CHUNK_SIZE]
 
                     self._transcribe_chunk(pcm_bytes, offset_seconds)
                     offset_seconds += self.BUFFER_DURATION
@@ -1,15 +1,28 @@
 import os
 import json
-import gc
-from collections.abc import Callable
+import hashlib
+import time
+import wave
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
 from tqdm import tqdm
 
+import numpy as np
+
 try:
     from faster_whisper import WhisperModel
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
 
+try:
+    from faster_whisper.vad import get_vad_model
+except ImportError:
+    get_vad_model = None
+
 try:
     import mlx_whisper
     MLX_AVAILABLE = True
@@ -17,31 +30,48 @@ except ImportError:
     MLX_AVAILABLE = False
 
 from .types import DeviceType
+from .word_timestamps import synthesize_word_timestamps
 from ..utils.config import (
     DEFAULT_WHISPER_MODEL,
     DEFAULT_MLX_MODEL,
     DEFAULT_DEVICE,
     DEFAULT_COMPUTE_TYPE,
-    MLX_MODEL_MAPPING
+    MLX_MODEL_MAPPING,
+    MLX_QUANTIZATION_SUFFIXES
 )
 from ..utils.helpers import setup_logger
+from ..utils import jsonio
 from ..utils.exceptions import (
     TranscriptionModelNotAvailableError,
     TranscriptionFailedError,
-    FileNotFoundError as VoxGrepFileNotFoundError
+    FileNotFoundError as VoxGrepFileNotFoundError,
+    VoxGrepError
+)
+from ..utils.audio import (
+    normalize_audio as norm_audio,
+    get_normalized_cache_path,
+    remove_stale_normalized_audio,
+    should_normalize_audio,
+    load_pcm_wav
 )
-from ..utils.audio import normalize_audio as norm_audio, get_normalized_cache_path, should_normalize_audio
 
 logger = setup_logger(__name__)
 
+# Minimum seconds between progress bar refreshes in the tqdm fallback
+PROGRESS_FLUSH_INTERVAL = 0.1
+
 
 def _prepare_audio_input(
     videofile: str,
     normalize_audio: bool,
     progress_callback: Callable | None = None
-) -> str:
+) -> str | np.ndarray:
     """
-    Prepare audio input file, optionally normalizing audio levels.
+    Prepare audio input, optionally normalizing audio levels.
+
+    The normalized audio is already 16kHz mono PCM, so it is handed to the
+    backend as a decoded float32 array instead of a path that would be
+    decoded a second time.
 
     Args:
         videofile: Original input file path.
@@ -49,7 +79,7 @@ def _prepare_audio_input(
         progress_callback: Optional callback for progress updates.
 
     Returns:
-        Path to the audio file to use (original or normalized).
+        Original file path, or the normalized audio samples.
     """
     if not normalize_audio:
         return videofile
@@ -68,16 +98,304 @@ def _prepare_audio_input(
                     pass
 
             normalized_path = norm_audio(videofile, output_file=cache_path)
+            remove_stale_normalized_audio(videofile)
             logger.info(f"Using normalized audio: {normalized_path}")
-            return normalized_path
         else:
+            normalized_path = cache_path
             logger.info(f"Using cached normalized audio: {cache_path}")
-            return cache_path
 
     except Exception as e:
         logger.warning(f"Audio normalization failed: {e}. Continuing with original audio.")
         return videofile
 
+    try:
+        return load_pcm_wav(normalized_path)
+    except (OSError, EOFError, ValueError, wave.Error) as e:
+        logger.debug(f"Could not load {normalized_path} as PCM, passing path instead: {e}")
+        return normalized_path
+
+
+def warm_vad_model() -> None:
+    """
+    Load the Silero VAD session ahead of the first transcription.
+
+    faster-whisper keeps a single VAD session per process (get_vad_model is
+    cached), so warming it once means every vad_filter transcription reuses
+    the same session rather than paying the ONNX load on the first file.
+    """
+    if get_vad_model is None:
+        return
+    try:
+        get_vad_model()
+    except Exception as e:
+        logger.debug(f"Could not pre-load VAD model: {e}")
+
+
+def get_partial_transcript_path(transcript_file: str) -> str:
+    """Get the path of the JSON-lines file segments are streamed to while transcribing."""
+    return transcript_file + ".partial.jsonl"
+
+
+@contextmanager
+def _segment_sink(partial_file: str | None, collected: list[dict]) -> Iterator[Callable[[dict], None]]:
+    """
+    Open a JSON-lines sink that segments are appended to as they are produced.
+
+    Writing each segment as soon as it is decoded means segments are not
+    held in memory while the model runs, an interrupted or crashed run still
+    leaves its progress on disk, and the final transcript can be assembled
+    from already-serialized lines.
+
+    Args:
+        partial_file: Path of the JSON-lines file, or None to collect the
+                      segments into collected instead.
+        collected: List segments are appended to when partial_file is None.
+
+    Yields:
+        Callable taking a segment dict.
+    """
+    if partial_file is None:
+        yield collected.append
+        return
+
+    with open(partial_file, "wb") as sink:
+        def write(item: dict) -> None:
+            sink.write(jsonio.dumps(item))
+            sink.write(b"\n")
+
+        yield write
+
+
+def _read_partial_transcript(partial_file: str) -> list[dict]:
+    """Read back the segments streamed to a JSON-lines partial file."""
+    with open(partial_file, "rb") as src:
+        return [jsonio.loads(line) for line in src if line.strip()]
+
+
+def _finalize_partial_transcript(partial_file: str, transcript_file: str) -> None:
+    """
+    Convert a streamed JSON-lines transcript into the final JSON array file.
+
+    Lines are copied verbatim in a single pass, so segments are not parsed
+    or re-encoded.
+    """
+    with open(partial_file, "rb") as src, open(transcript_file, "wb") as dst:
+        dst.write(b"[")
+        first = True
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(b",")
+            dst.write(line)
+            first = False
+        dst.write(b"]")
+
+    os.remove(partial_file)
+
+
+def _settings_fingerprint(videofile: str, metadata: dict) -> str:
+    """
+    Build a compact fingerprint of the transcription settings and source file.
+
+    Combines a BLAKE2 hash of the settings with the media file's size and
+    mtime, so an unchanged transcript can be recognized with one stat call
+    and a short string comparison.
+    """
+    settings_hash = hashlib.blake2b(
+        repr(sorted(metadata.items())).encode(), digest_size=16
+    ).hexdigest()
+    st = os.stat(videofile)
+    return f"{settings_hash}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _read_fingerprint(fingerprint_file: str) -> str | None:
+    """Read a stored settings fingerprint, or None if missing/unreadable."""
+    try:
+        with open(fingerprint_file, "r", encoding="ascii") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_fingerprint(fingerprint_file: str, fingerprint: str) -> None:
+    """Store a settings fingerprint next to the transcript."""
+    try:
+        with open(fingerprint_file, "w", encoding="ascii") as f:
+            f.write(fingerprint)
+    except OSError as e:
+        logger.debug(f"Could not write settings fingerprint {fingerprint_file}: {e}")
+
+
+def resolve_mlx_model(model_name: str | None = None, quantization: str | None = None) -> str:
+    """
+    Resolve an MLX model short name or repo to a HuggingFace repo.
+
+    Args:
+        model_name: Short name (e.g. 'large-v3') or repo; defaults to DEFAULT_MLX_MODEL.
+        quantization: Optional quantization level ('int4') selecting the
+                      pre-quantized repo when one exists.
+
+    Returns:
+        HuggingFace repo (or the name unchanged if it is not a known model).
+    """
+    model = model_name or DEFAULT_MLX_MODEL
+
+    if quantization:
+        suffix = MLX_QUANTIZATION_SUFFIXES.get(quantization)
+        if suffix is None:
+            logger.warning(
+                f"Unsupported MLX quantization '{quantization}'. "
+                f"Supported: {', '.join(MLX_QUANTIZATION_SUFFIXES)}. Using full precision."
+            )
+        else:
+            # Accept full repos too by mapping them back to their short name
+            if model not in MLX_MODEL_MAPPING:
+                repo_to_name = {repo: name for name, repo in MLX_MODEL_MAPPING.items()}
+                model = repo_to_name.get(model, model)
+            if not model.endswith(suffix):
+                if model + suffix in MLX_MODEL_MAPPING:
+                    model = model + suffix
+                else:
+                    logger.warning(f"No {quantization} variant of {model}, using full precision.")
+
+    return MLX_MODEL_MAPPING.get(model, model)
+
+
+def _transcription_metadata(
+    model_name: str | None,
+    device: str,
+    compute_type: str,
+    language: str | None = None,
+    prompt: str | None = None,
+    beam_size: int = 5,
+    vad_filter: bool = True,
+    normalize_audio: bool = False,
+    translate: bool = False,
+    quantization: str | None = None
+) -> dict:
+    """Build the settings recorded with a transcript (resolving the model name)."""
+    if device == "mlx":
+        model = resolve_mlx_model(model_name, quantization)
+    else:
+        model = model_name or DEFAULT_WHISPER_MODEL
+
+    return {
+        "model": model,
+        "device": device,
+        "language": language,
+        "compute_type": compute_type if device != "mlx" else None,
+        "beam_size": beam_size,
+        "vad_filter": vad_filter,
+        "has_prompt": bool(prompt),
+        "normalize_audio": normalize_audio,
+        "translate": translate
+    }
+
+
+def _compare_transcript_settings(
+    videofile: str,
+    current_metadata: dict,
+    fingerprint: str
+) -> tuple[dict | None, list[str]]:
+    """
+    Compare the settings of videofile's existing transcript with the requested ones.
+
+    A transcript found to match has its fingerprint refreshed, so the next
+    check takes the fast path.
+
+    Returns:
+        (existing metadata or None if not read, descriptions of significant
+        changes - empty if the transcript can be reused as is)
+    """
+    base = os.path.splitext(videofile)[0]
+    metadata_file = base + ".transcript_meta.json"
+    fingerprint_file = base + ".tmeta"
+
+    # Fast path: identical settings and source file, skip parsing metadata
+    if _read_fingerprint(fingerprint_file) == fingerprint:
+        return None, []
+    if not os.path.exists(metadata_file):
+        return None, []
+
+    try:
+        with open(metadata_file, "r", encoding="utf-8") as meta_file:
+            existing_metadata = json.load(meta_file)
+
+        # Check significant changes
+        changes = []
+        if existing_metadata.get("model") != current_metadata["model"]:
+            changes.append(f"Model: {existing_metadata.get('model')} -> {current_metadata['model']}")
+
+        if existing_metadata.get("device") != current_metadata["device"]:
+            changes.append(f"Device: {existing_metadata.get('device')} -> {current_metadata['device']}")
+
+        # Check detailed settings (default to standard values if missing)
+        existing_beam = existing_metadata.get("beam_size", 5)
+        if existing_beam != current_metadata["beam_size"]:
+            changes.append(f"Beam Size: {existing_beam} -> {current_metadata['beam_size']}")
+
+        existing_vad = existing_metadata.get("vad_filter", True)
+        if existing_vad != current_metadata["vad_filter"]:
+            changes.append(f"VAD: {existing_vad} -> {current_metadata['vad_filter']}")
+
+        existing_prompt = existing_metadata.get("has_prompt", False)
+        if existing_prompt != current_metadata["has_prompt"]:
+            changes.append(f"Vocabulary Prompt: {existing_prompt} -> {current_metadata['has_prompt']}")
+
+        existing_trans = existing_metadata.get("translate", False)
+        if existing_trans != current_metadata["translate"]:
+            changes.append(f"Translate: {existing_trans} -> {current_metadata['translate']}")
+    except (json.JSONDecodeError, KeyError):
+        logger.warning(f"Could not read metadata file {metadata_file}")
+        return None, []
+
+    if not changes:
+        _write_fingerprint(fingerprint_file, fingerprint)
+    return existing_metadata, changes
+
+
+def _load_whisper_model(model_name: str, device: str, compute_type: str) -> "WhisperModel":
+    """
+    Load a faster-whisper model, falling back to CPU if CUDA loading fails.
+
+    Raises:
+        TranscriptionFailedError: If the model cannot be loaded.
+    """
+    try:
+        return WhisperModel(model_name, device=device, compute_type=compute_type)
+    except Exception as e:
+        logger.error(f"Could not load model {model_name} on {device}: {e}")
+        if device == "cuda":
+            logger.info("Falling back to CPU...")
+            try:
+                return WhisperModel(model_name, device="cpu", compute_type="int8")
+            except Exception as e2:
+                raise TranscriptionFailedError(f"Fallback to CPU failed: {e2}") from e2
+        raise TranscriptionFailedError(f"Failed to load Whisper model: {e}") from e
+
+
+def _release_whisper_model(model: "WhisperModel") -> None:
+    """
+    Free a faster-whisper model's weights (and VRAM) immediately.
+
+    CTranslate2 models expose unload_model(); calling it releases device
+    memory without waiting for garbage collection.
+    """
+    try:
+        model.model.unload_model()
+    except Exception as e:
+        logger.debug(f"Could not unload Whisper model explicitly: {e}")
+
+
+def _flush_progress(pbar: tqdm, pending_lines: list[str], position: float) -> None:
+    """Write buffered segment lines to the tqdm bar in one call and advance it."""
+    if pending_lines:
+        pbar.write("\n".join(pending_lines))
+        pending_lines.clear()
+    pbar.update(position - pbar.n)
+
 
 def _process_whisper_segment(segment) -> dict:
     """
@@ -93,15 +411,10 @@ def _process_whisper_segment(segment) -> dict:
     start_sec = segment.start
     end_sec = segment.end
 
-    w_list = []
-    if segment.words:
-        for w in segment.words:
-            w_list.append({
-                "word": w.word.strip(),
-                "start": w.start,
-                "end": w.end,
-                "conf": w.probability
-            })
+    w_list = [
+        {"word": w.word.strip(), "start": w.start, "end": w.end, "conf": w.probability}
+        for w in (segment.words or ())
+    ]
 
     return {
         "content": content,
@@ -111,6 +424,26 @@ def _process_whisper_segment(segment) -> dict:
     }
 
 
+def _append_flat_words(word_table: list[dict], item: dict, file_tag: str | None) -> None:
+    """
+    Append a converted segment's words to a flat word table.
+
+    Produces the same records as synthesize_word_timestamps() ('word',
+    'start', 'end' and optionally 'file'), so search code can consume them
+    without a second pass over the transcript.
+    """
+    if file_tag:
+        word_table.extend(
+            {"word": w["word"], "start": w["start"], "end": w["end"], "file": file_tag}
+            for w in item["words"]
+        )
+    else:
+        word_table.extend(
+            {"word": w["word"], "start": w["start"], "end": w["end"]}
+            for w in item["words"]
+        )
+
+
 def _process_mlx_segment(segment: dict) -> dict:
     """
     Convert an mlx-whisper segment dict to standard format.
@@ -125,15 +458,10 @@ def _process_mlx_segment(segment: dict) -> dict:
     start_sec = segment["start"]
     end_sec = segment["end"]
 
-    w_list = []
-    if "words" in segment:
-        for w in segment["words"]:
-            w_list.append({
-                "word": w["word"].strip(),
-                "start": w["start"],
-                "end": w["end"],
-                "conf": w.get("probability", 1.0)
-            })
+    w_list = [
+        {"word": w["word"].strip(), "start": w["start"], "end": w["end"], "conf": w.get("probability", 1.0)}
+        for w in segment.get("words", ())
+    ]
 
     return {
         "content": content,
@@ -156,7 +484,12 @@ def transcribe_whisper(
     vad_filter: bool = True,
     vad_parameters: dict | None = None,
     normalize_audio: bool = False,
-    translate: bool = False
+    translate: bool = False,
+    partial_file: str | None = None,
+    word_table: list[dict] | None = None,
+    file_tag: str | None = None,
+    whisper_model: Any = None,
+    audio: str | np.ndarray | None = None
 ) -> list[dict]:
     """
     Transcribes a video file using faster-whisper (CTranslate2)
@@ -170,6 +503,16 @@ def transcribe_whisper(
         vad_parameters: Optional VAD parameters dict
         normalize_audio: Pre-process audio with loudnorm filter for better quality. Default: False
         translate: Translate the subtitles to English. Default: False
+        partial_file: Optional JSON-lines path each segment is appended to as soon
+                      as it is decoded instead of being kept in memory, so partial
+                      progress survives interruption. The returned segments are
+                      read back from it at the end.
+        word_table: Optional list that flat word records are appended to while
+                    segments are converted (same shape as synthesize_word_timestamps).
+        file_tag: Optional 'file' value added to each word_table record.
+        whisper_model: Optional already-loaded WhisperModel to reuse instead of loading one.
+        audio: Optional pre-prepared audio (path or 16kHz float32 samples) to
+               transcribe instead of preparing it from videofile.
     """
     if not WHISPER_AVAILABLE:
         raise TranscriptionModelNotAvailableError(
@@ -184,95 +527,117 @@ def transcribe_whisper(
     logger.info(f"Accuracy settings: beam_size={beam_size}, best_of={best_of}, vad_filter={vad_filter}, normalize_audio={normalize_audio}, translate={translate}")
 
     # Audio normalization pre-processing
-    actual_input_file = _prepare_audio_input(videofile, normalize_audio, progress_callback)
+    if audio is not None:
+        actual_input_file = audio
+    else:
+        actual_input_file = _prepare_audio_input(videofile, normalize_audio, progress_callback)
 
-    # Load model
-    try:
-        model = WhisperModel(model_name, device=device, compute_type=compute_type)
-    except Exception as e:
-        logger.error(f"Could not load model {model_name} on {device}: {e}")
-        if device == "cuda":
-            logger.info("Falling back to CPU...")
-            try:
-                model = WhisperModel(model_name, device="cpu", compute_type="int8")
-            except Exception as e2:
-                raise TranscriptionFailedError(f"Fallback to CPU failed: {e2}") from e2
-        else:
-            raise TranscriptionFailedError(f"Failed to load Whisper model: {e}") from e
+    # Load model (or reuse a warm one supplied by the caller)
+    owns_model = whisper_model is None
+    model = whisper_model if whisper_model is not None else _load_whisper_model(model_name, device, compute_type)
+
+    if vad_filter:
+        warm_vad_model()
 
     # Transcribe with advanced parameters
     try:
         logger.info(f"Starting transcription with {model_name} model...")
 
-        # Build transcription parameters
+        # Build transcription parameters, passing only values that differ
+        # from faster-whisper's None defaults
         transcribe_params = {
-            "word_timestamps": True,
-            "initial_prompt": prompt,
-            "language": language,
-            "beam_size": beam_size,
-            "best_of": best_of,
-            "vad_filter": vad_filter,
-            "task": "translate" if translate else "transcribe"
+            key: value for key, value in (
+                ("word_timestamps", True),
+                ("initial_prompt", prompt),
+                ("language", language),
+                ("beam_size", beam_size),
+                ("best_of", best_of),
+                ("vad_filter", vad_filter),
+                ("task", "translate" if translate else "transcribe"),
+                # faster-whisper pops keys from this dict, so hand it a copy
+                ("vad_parameters", dict(vad_parameters) if vad_parameters else None),
+            )
+            if value is not None
         }
 
-        # Add VAD parameters if provided
-        if vad_parameters:
-            transcribe_params["vad_parameters"] = vad_parameters
-
         segments_generator, info = model.transcribe(actual_input_file, **transcribe_params)
 
         logger.info(f"Transcription started. Detected language: {info.language}")
 
-        out = []
+        collected: list[dict] = []
+        count = 0
+        pending_lines: list[str] = []
+        position = 0.0
+        last_flush = time.monotonic()
 
         # Use callback if provided, otherwise use tqdm
-        try:
-            if progress_callback:
-                current_time = 0
-                for segment in segments_generator:
-                    current_time = segment.end
-
-                    content = segment.text.strip()
-                    # Pass text to callback if it accepts kwargs or 3 args
-                    try:
-                        progress_callback(current_time, info.duration, text=content)
-                    except TypeError:
-                        # Fallback for old callbacks
-                        progress_callback(current_time, info.duration)
-
-                    out.append(_process_whisper_segment(segment))
-            else:
-                # Fallback to tqdm for non-CLI usage
-                pbar = tqdm(total=info.duration, unit="sec", desc="Transcribing", bar_format="{l_bar}{bar}| {n:.2f}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]")
-
-                for segment in segments_generator:
-                    pbar.update(segment.end - pbar.n)
-
-                    content = segment.text.strip()
-                    # Print active segment to tqdm
-                    pbar.write(f"[{segment.start:.2f}s] {content}")
-
-                    out.append(_process_whisper_segment(segment))
-
-                pbar.close()
-
-        except KeyboardInterrupt:
-            logger.warning(f"Transcription cancelled by user. Saving {len(out)} partial segments...")
-            if not progress_callback:
-                pbar.close()
-            # Continue to save partial results below
-
-        logger.info(f"Processed {len(out)} segments.")
-
-        # Explicitly cleanup model to avoid crashes on return
-        del model
-        gc.collect()
+        with _segment_sink(partial_file, collected) as emit:
+            try:
+                if progress_callback:
+                    current_time = 0
+                    for segment in segments_generator:
+                        current_time = segment.end
+
+                        content = segment.text.strip()
+                        # Pass text to callback if it accepts kwargs or 3 args
+                        try:
+                            progress_callback(current_time, info.duration, text=content)
+                        except TypeError:
+                            # Fallback for old callbacks
+                            progress_callback(current_time, info.duration)
+
+                        item = _process_whisper_segment(segment)
+                        emit(item)
+                        count += 1
+                        if word_table is not None:
+                            _append_flat_words(word_table, item, file_tag)
+                else:
+                    # Fallback to tqdm for non-CLI usage
+                    pbar = tqdm(
+                        total=info.duration, unit="sec", desc="Transcribing",
+                        bar_format="{l_bar}{bar}| {n:.2f}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+                        mininterval=0.5, miniters=1
+                    )
+
+                    for segment in segments_generator:
+                        # Print active segment to tqdm (buffered, flushed at most ~10 Hz)
+                        pending_lines.append(f"[{segment.start:.2f}s] {segment.text.strip()}")
+                        position = segment.end
+
+                        now = time.monotonic()
+                        if now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                            _flush_progress(pbar, pending_lines, position)
+                            last_flush = now
+
+                        item = _process_whisper_segment(segment)
+                        emit(item)
+                        count += 1
+                        if word_table is not None:
+                            _append_flat_words(word_table, item, file_tag)
+
+                    _flush_progress(pbar, pending_lines, position)
+                    pbar.close()
+
+            except KeyboardInterrupt:
+                logger.warning(f"Transcription cancelled by user. Saving {count} partial segments...")
+                if not progress_callback:
+                    _flush_progress(pbar, pending_lines, position)
+                    pbar.close()
+                # Continue to save partial results below
+
+        logger.info(f"Processed {count} segments.")
+
+        # Release the model deterministically; no full-heap GC pass needed
+        if owns_model:
+            _release_whisper_model(model)
+            del model
 
     except Exception as e:
         logger.error(f"Error during transcription: {e}")
         raise TranscriptionFailedError(f"Whisper transcription failed: {e}") from e
 
-    return out
+    # Streamed segments are only loaded once the model has been released
+    return collected if partial_file is None else _read_partial_transcript(partial_file)
 
 
 def transcribe_mlx(
@@ -280,21 +645,39 @@ def transcribe_mlx(
     model_name: str = DEFAULT_MLX_MODEL,
     language: str | None = None,
     prompt: str | None = None,
-    normalize_audio: bool = False
+    normalize_audio: bool = False,
+    partial_file: str | None = None,
+    quantization: str | None = None,
+    word_table: list[dict] | None = None,
+    file_tag: str | None = None,
+    audio: str | np.ndarray | None = None
 ) -> list[dict]:
     """
     Transcribes a video file using mlx-whisper (Apple Silicon GPU)
     With word-level timestamps enabled.
+
+    Args:
+        partial_file: Optional JSON-lines path each converted segment is appended to
+                      instead of being kept in memory; read back at the end.
+        quantization: Optional quantization level ('int4') to use a 4-bit model.
+        word_table: Optional list that flat word records are appended to.
+        file_tag: Optional 'file' value added to each word_table record.
+        audio: Optional pre-prepared audio (path or 16kHz float32 samples).
     """
     if not MLX_AVAILABLE:
         raise TranscriptionModelNotAvailableError(
             "mlx-whisper is not installed. Install with 'pip install mlx-whisper'"
         )
 
+    model_name = resolve_mlx_model(model_name, quantization)
+
     logger.info(f"Transcribing {videofile} using mlx-whisper ({model_name})")
 
     # Audio normalization pre-processing
-    actual_input_file = _prepare_audio_input(videofile, normalize_audio)
+    if audio is not None:
+        actual_input_file = audio
+    else:
+        actual_input_file = _prepare_audio_input(videofile, normalize_audio)
 
     try:
         # mlx_whisper.transcribe returns "text" and "segments" in a dict
@@ -306,13 +689,18 @@ def transcribe_mlx(
             initial_prompt=prompt
         )
 
-        out = []
+        collected: list[dict] = []
         # result["segments"] is a list of dicts
-        for segment in result["segments"]:
-            out.append(_process_mlx_segment(segment))
+        with _segment_sink(partial_file, collected) as emit:
+            for segment in result["segments"]:
+                item = _process_mlx_segment(segment)
+                emit(item)
+                if word_table is not None:
+                    _append_flat_words(word_table, item, file_tag)
 
-        logger.info(f"Processed {len(out)} segments.")
-        return out
+        logger.info(f"Processed {len(result['segments'])} segments.")
+        del result
+        return collected if partial_file is None else _read_partial_transcript(partial_file)
 
     except Exception as e:
         logger.error(f"Error during mlx transcription: {e}")
@@ -333,7 +721,11 @@ def transcribe(
     vad_filter: bool = True,
     vad_parameters: dict | None = None,
     normalize_audio: bool = False,
-    translate: bool = False
+    translate: bool = False,
+    quantization: str | None = None,
+    word_table: list[dict] | None = None,
+    whisper_model: Any = None,
+    audio: str | np.ndarray | None = None
 ) -> list[dict]:
     """
     Transcribes a video file using Whisper, handling caching and backend selection.
@@ -348,6 +740,11 @@ def transcribe(
         vad_parameters: Optional VAD parameters
         normalize_audio: Pre-process audio with loudnorm filter
         translate: Translate the subtitles to English
+        quantization: MLX only - use a pre-quantized model ('int4')
+        word_table: Optional list filled with flat word records tagged with
+                    videofile, built in the same pass as the transcript.
+        whisper_model: Optional warm faster-whisper model to reuse.
+        audio: Optional pre-prepared audio input (see transcribe_many).
     """
     if not os.path.exists(videofile):
         raise VoxGrepFileNotFoundError(f"Could not find file {videofile}")
@@ -359,117 +756,217 @@ def transcribe(
     # Transcript file is based on the input filename
     transcript_file = os.path.splitext(videofile)[0] + ".json"
     metadata_file = os.path.splitext(videofile)[0] + ".transcript_meta.json"
-
-    # Determine the model to use
-    if device == "mlx":
-        _model = model_name or DEFAULT_MLX_MODEL
-        if _model in MLX_MODEL_MAPPING:
-            _model = MLX_MODEL_MAPPING[_model]
-    else:
-        _model = model_name or DEFAULT_WHISPER_MODEL
+    fingerprint_file = os.path.splitext(videofile)[0] + ".tmeta"
+    partial_file = get_partial_transcript_path(transcript_file)
 
     # Current transcription metadata
-    current_metadata = {
-        "model": _model,
-        "device": device,
-        "language": language,
-        "compute_type": compute_type if device != "mlx" else None,
-        "beam_size": beam_size,
-        "vad_filter": vad_filter,
-        "has_prompt": bool(prompt),
-        "normalize_audio": normalize_audio,
-        "translate": translate
-    }
+    current_metadata = _transcription_metadata(
+        model_name, device, compute_type,
+        language=language,
+        prompt=prompt,
+        beam_size=beam_size,
+        vad_filter=vad_filter,
+        normalize_audio=normalize_audio,
+        translate=translate,
+        quantization=quantization
+    )
+    _model = current_metadata["model"]
+    fingerprint = _settings_fingerprint(videofile, current_metadata)
 
     if os.path.exists(transcript_file):
         # Check if metadata exists and matches
         should_reuse = True
-
-        if os.path.exists(metadata_file):
-            try:
-                with open(metadata_file, "r", encoding="utf-8") as meta_file:
-                    existing_metadata = json.load(meta_file)
-
-                # Check significant changes
-                changes = []
-                if existing_metadata.get("model") != current_metadata["model"]:
-                    changes.append(f"Model: {existing_metadata.get('model')} -> {current_metadata['model']}")
-
-                if existing_metadata.get("device") != current_metadata["device"]:
-                    changes.append(f"Device: {existing_metadata.get('device')} -> {current_metadata['device']}")
-
-                # Check detailed settings (default to standard values if missing)
-                existing_beam = existing_metadata.get("beam_size", 5)
-                if existing_beam != current_metadata["beam_size"]:
-                    changes.append(f"Beam Size: {existing_beam} -> {current_metadata['beam_size']}")
-
-                existing_vad = existing_metadata.get("vad_filter", True)
-                if existing_vad != current_metadata["vad_filter"]:
-                    changes.append(f"VAD: {existing_vad} -> {current_metadata['vad_filter']}")
-
-                existing_prompt = existing_metadata.get("has_prompt", False)
-                if existing_prompt != current_metadata["has_prompt"]:
-                    changes.append(f"Vocabulary Prompt: {existing_prompt} -> {current_metadata['has_prompt']}")
-
-                existing_trans = existing_metadata.get("translate", False)
-                if existing_trans != current_metadata["translate"]:
-                    changes.append(f"Translate: {existing_trans} -> {current_metadata['translate']}")
-
-                if changes:
-                    if on_existing_transcript:
-                        # Ask user what to do
-                        should_reuse = on_existing_transcript(existing_metadata, current_metadata)
-                    else:
-                        # Non-interactive mode: log warning and reuse
-                        logger.warning(
-                            f"Existing transcript settings differ from requested: {', '.join(changes)}. "
-                            f"Reusing existing transcript. Delete {transcript_file} to regenerate."
-                        )
-            except (json.JSONDecodeError, KeyError):
-                logger.warning(f"Could not read metadata file {metadata_file}")
+        existing_metadata, changes = _compare_transcript_settings(
+            videofile, current_metadata, fingerprint
+        )
+        if changes:
+            if on_existing_transcript:
+                # Ask user what to do
+                should_reuse = on_existing_transcript(existing_metadata, current_metadata)
+            else:
+                # Non-interactive mode: log warning and reuse
+                logger.warning(
+                    f"Existing transcript settings differ from requested: {', '.join(changes)}. "
+                    f"Reusing existing transcript. Delete {transcript_file} to regenerate."
+                )
 
         if should_reuse:
             try:
-                with open(transcript_file, "r", encoding="utf-8") as infile:
-                    data = json.load(infile)
-                    logger.info(f"Using existing transcript file: {transcript_file}")
-                    return data
-            except json.JSONDecodeError:
+                data = jsonio.load_file(transcript_file)
+                logger.info(f"Using existing transcript file: {transcript_file}")
+                if word_table is not None:
+                    word_table.extend(synthesize_word_timestamps(data, file=videofile, log_info=False))
+                return data
+            except jsonio.JSONDecodeError:
                 logger.warning(f"Existing transcript file {transcript_file} is corrupt. Regenerating...")
 
-    out = []
-
-    # Check backend selection and transcribe
-    if device == "mlx":
-        out = transcribe_mlx(videofile, _model, language=language, prompt=prompt, normalize_audio=normalize_audio)
-    else:
-        out = transcribe_whisper(
-            videofile,
-            _model,
-            prompt=prompt,
-            language=language,
-            device=device,
-            compute_type=compute_type,
-            progress_callback=progress_callback,
-            beam_size=beam_size,
-            best_of=best_of,
-            vad_filter=vad_filter,
-            vad_parameters=vad_parameters,
-            normalize_audio=normalize_audio,
-            translate=translate
-        )
-
-    if not out:
-        logger.warning(f"No speech detected in {videofile}")
-        return []
-
-    # Save transcript
-    logger.info(f"Saving transcript to {transcript_file}")
-    with open(transcript_file, "w", encoding="utf-8") as outfile:
-        json.dump(out, outfile)
+    # Check backend selection and transcribe. Segments stream to the partial
+    # file, which is folded into the transcript or removed on the way out
+    try:
+        if device == "mlx":
+            out = transcribe_mlx(
+                videofile,
+                _model,
+                language=language,
+                prompt=prompt,
+                normalize_audio=normalize_audio,
+                partial_file=partial_file,
+                word_table=word_table,
+                file_tag=videofile,
+                audio=audio
+            )
+        else:
+            out = transcribe_whisper(
+                videofile,
+                _model,
+                prompt=prompt,
+                language=language,
+                device=device,
+                compute_type=compute_type,
+                progress_callback=progress_callback,
+                beam_size=beam_size,
+                best_of=best_of,
+                vad_filter=vad_filter,
+                vad_parameters=vad_parameters,
+                normalize_audio=normalize_audio,
+                translate=translate,
+                partial_file=partial_file,
+                word_table=word_table,
+                file_tag=videofile,
+                whisper_model=whisper_model,
+                audio=audio
+            )
+
+        if not out:
+            logger.warning(f"No speech detected in {videofile}")
+            return []
+
+        # Save transcript from the streamed segments
+        logger.info(f"Saving transcript to {transcript_file}")
+        _finalize_partial_transcript(partial_file, transcript_file)
+    finally:
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
 
     # Save metadata
     with open(metadata_file, "w", encoding="utf-8") as meta_file:
         json.dump(current_metadata, meta_file, indent=2)
+    _write_fingerprint(fingerprint_file, fingerprint)
 
     return out
+
+
+def transcribe_many(
+    videofiles: list[str],
+    model_name: str | None = None,
+    device: str | DeviceType = DEFAULT_DEVICE,
+    compute_type: str = DEFAULT_COMPUTE_TYPE,
+    normalize_audio: bool = False,
+    prefetch: int = 2,
+    max_prepare_workers: int | None = None,
+    **kwargs
+) -> dict[str, list[dict]]:
+    """
+    Transcribe several files with a single warm model.
+
+    The faster-whisper model is loaded once and reused for every file. When
+    normalize_audio is enabled, audio for the next files (ffmpeg loudnorm +
+    PCM load) is prepared on a background thread pool while the current file
+    is being transcribed, so the model is not left idle during decoding. At
+    most `prefetch` prepared inputs are held in memory at a time.
+
+    Args:
+        videofiles: Media files to transcribe.
+        model_name: Whisper model name (backend default if None).
+        device: Device/backend, as for transcribe().
+        compute_type: Compute type for faster-whisper.
+        normalize_audio: Pre-process audio with loudnorm filter.
+        prefetch: Number of upcoming files to prepare ahead.
+        max_prepare_workers: Threads used for audio preparation
+                             (defaults to half the CPU count).
+        **kwargs: Further arguments passed to transcribe().
+
+    Returns:
+        Dict mapping each successfully processed file to its transcript.
+        Files that fail are logged and omitted.
+    """
+    if isinstance(device, DeviceType):
+        device = device.value
+
+    # Files that will actually be transcribed, by the same reuse check as
+    # transcribe(): transcripts with different settings are only redone if
+    # the on_existing_transcript callback may ask for it
+    current_metadata = _transcription_metadata(
+        model_name, device, compute_type,
+        language=kwargs.get("language"),
+        prompt=kwargs.get("prompt"),
+        beam_size=kwargs.get("beam_size", 5),
+        vad_filter=kwargs.get("vad_filter", True),
+        normalize_audio=normalize_audio,
+        translate=kwargs.get("translate", False),
+        quantization=kwargs.get("quantization")
+    )
+    may_regenerate = kwargs.get("on_existing_transcript") is not None
+
+    def needs_transcription(videofile: str) -> bool:
+        if not os.path.exists(os.path.splitext(videofile)[0] + ".json"):
+            return True
+        if not os.path.exists(videofile):
+            return False
+        _, changes = _compare_transcript_settings(
+            videofile, current_metadata, _settings_fingerprint(videofile, current_metadata)
+        )
+        return bool(changes) and may_regenerate
+
+    pending = [f for f in videofiles if needs_transcription(f)]
+
+    whisper_model = None
+    if device != "mlx" and pending:
+        if not WHISPER_AVAILABLE:
+            raise TranscriptionModelNotAvailableError(
+                "faster-whisper is not installed. Install with 'pip install faster-whisper'"
+            )
+        whisper_model = _load_whisper_model(model_name or DEFAULT_WHISPER_MODEL, device, compute_type)
+
+    workers = max_prepare_workers or max(1, (os.cpu_count() or 2) // 2)
+    to_prepare = deque(pending if normalize_audio else [])
+    prepared: dict[str, Future] = {}
+    results: dict[str, list[dict]] = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            def fill_queue() -> None:
+                while to_prepare and len(prepared) < prefetch:
+                    f = to_prepare.popleft()
+                    prepared[f] = pool.submit(_prepare_audio_input, f, True)
+
+            try:
+                fill_queue()
+                for f in videofiles:
+                    future = prepared.pop(f, None)
+                    fill_queue()
+                    audio = future.result() if future is not None else None
+
+                    try:
+                        results[f] = transcribe(
+                            f,
+                            model_name=model_name,
+                            device=device,
+                            compute_type=compute_type,
+                            normalize_audio=normalize_audio,
+                            whisper_model=whisper_model,
+                            audio=audio,
+                            **kwargs
+                        )
+                    except VoxGrepError as e:
+                        logger.error(f"Failed to transcribe {f}: {e}")
+            except KeyboardInterrupt:
+                for future in prepared.values():
+                    future.cancel()
+                raise
+    finally:
+        # Free the warm model's VRAM now rather than whenever it is collected
+        if whisper_model is not None:
+            _release_whisper_model(whisper_model)
+
+    return results
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+
 
 class SearchType(str, Enum):
     """Available search strategies."""
@@ -64,14 +66,56 @@ class ExportStrategy(str, Enum):
     AUDIO = "audio"
 
 
-@dataclass
+@dataclass(slots=True)
+class WordArray:
+    """
+    Word-level timestamps stored as parallel arrays (struct-of-arrays).
+
+    Avoids a Python dict per word and allows vectorized range queries,
+    e.g. ``wa.starts[(wa.starts >= a) & (wa.ends <= b)]``. Times are kept in
+    float64 so they round-trip through JSON unchanged.
+    """
+    words: np.ndarray  # dtype=object
+    starts: np.ndarray  # float64
+    ends: np.ndarray  # float64
+    conf: np.ndarray  # float32
+
+    @classmethod
+    def from_dicts(cls, words: list[dict]) -> "WordArray":
+        """Build from the list[dict] word layout used in transcript JSON."""
+        return cls(
+            words=np.array([w["word"] for w in words], dtype=object),
+            starts=np.array([w["start"] for w in words], dtype=np.float64),
+            ends=np.array([w["end"] for w in words], dtype=np.float64),
+            conf=np.array([w.get("conf", 1.0) for w in words], dtype=np.float32),
+        )
+
+    def to_dicts(self) -> list[dict]:
+        """Materialize the list[dict] word layout for JSON serialization."""
+        return [
+            {"word": w, "start": s, "end": e, "conf": c}
+            for w, s, e, c in zip(
+                self.words.tolist(), self.starts.tolist(),
+                self.ends.tolist(), self.conf.tolist()
+            )
+        ]
+
+    def in_range(self, start: float, end: float) -> np.ndarray:
+        """Return indices of words fully contained in [start, end]."""
+        return np.flatnonzero((self.starts >= start) & (self.ends <= end))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+@dataclass(slots=True)
 class Segment:
     """A single transcript segment with timing and content."""
     file: str
     start: float
     end: float
     content: str
-    words: list[dict] = field(default_factory=list)
+    words: list[dict] | WordArray = field(default_factory=list)
     score: Optional[float] = None  # For semantic search results
 
     def to_dict(self) -> dict:
@@ -82,14 +126,17 @@ class Segment:
             "end": self.end,
             "content": self.content,
         }
-        if self.words:
-            d["words"] = self.words
+        if len(self.words):
+            if isinstance(self.words, WordArray):
+                d["words"] = self.words.to_dicts()
+            else:
+                d["words"] = self.words
         if self.score is not None:
             d["score"] = self.score
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class VoxGrepResult:
     """
     Result from a voxgrep operation.
@@ -126,7 +173,7 @@ class VoxGrepResult:
         return self.success
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Result from transcription."""
     segments: list[dict]
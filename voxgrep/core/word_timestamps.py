@@ -4,6 +4,11 @@ VoxGrep Word Timestamp Utilities
 Provides shared functionality for synthesizing word-level timestamps
 from sentence-level transcript data.
 """
+import os
+
+import numpy as np
+
+from .types import WordArray
 from ..utils.helpers import setup_logger
 
 logger = setup_logger(__name__)
@@ -35,56 +40,127 @@ def synthesize_word_timestamps(
 
     # Check if transcript already has word-level timestamps
     if transcript and "words" in transcript[0]:
-        # Use existing word-level timestamps
+        # Use existing word-level timestamps; size the output up front and
+        # fill by index rather than growing it per word.
+        words = [None] * sum(len(line["words"]) for line in transcript)
+        i = 0
         for line in transcript:
             for w in line["words"]:
-                word_dict = {
-                    "word": w["word"],
-                    "start": w["start"],
-                    "end": w["end"],
-                }
                 if file:
-                    word_dict["file"] = file
-                words.append(word_dict)
+                    words[i] = {"word": w["word"], "start": w["start"], "end": w["end"], "file": file}
+                else:
+                    words[i] = {"word": w["word"], "start": w["start"], "end": w["end"]}
+                i += 1
         return words
 
     # Synthesize word-level timestamps from sentence-level data
     if log_info and file:
-        import os
-        logger.info(
-            f"Synthesizing word-level timestamps for '{os.path.basename(file)}' "
-            f"(original transcript has sentence-level timestamps only)"
-        )
+        _log_synthesis(file)
 
-    for line in transcript:
-        content = line["content"]
-        start_time = line["start"]
-        end_time = line["end"]
-        duration = end_time - start_time
-
-        # Split content into words
-        word_list = content.split()
-        if not word_list:
-            continue
+    word_list, word_starts, word_ends = _synthesize_columns(transcript)
+    if not word_list:
+        return words
+
+    word_starts = word_starts.tolist()
+    word_ends = word_ends.tolist()
 
-        # Distribute time evenly across words
-        time_per_word = duration / len(word_list)
-
-        for i, word in enumerate(word_list):
-            word_start = start_time + (i * time_per_word)
-            word_end = start_time + ((i + 1) * time_per_word)
-            word_dict = {
-                "word": word,
-                "start": word_start,
-                "end": word_end,
-            }
-            if file:
-                word_dict["file"] = file
-            words.append(word_dict)
+    if file:
+        words = [
+            {"word": w, "start": s, "end": e, "file": file}
+            for w, s, e in zip(word_list, word_starts, word_ends)
+        ]
+    else:
+        words = [
+            {"word": w, "start": s, "end": e}
+            for w, s, e in zip(word_list, word_starts, word_ends)
+        ]
 
     return words
 
 
+def synthesize_word_arrays(
+    transcript: list[dict],
+    file: str | None = None,
+    log_info: bool = True
+) -> WordArray:
+    """
+    Columnar variant of synthesize_word_timestamps().
+
+    Returns the same words and timings as parallel arrays instead of one
+    dict per word, for search paths that scan every word of a transcript.
+
+    Args:
+        transcript: List of transcript segments with 'content', 'start', 'end' keys.
+                   May optionally have 'words' key for pre-existing word timestamps.
+        file: Optional filename for logging context.
+        log_info: Whether to log info message about synthesis.
+
+    Returns:
+        WordArray with one entry per word.
+    """
+    if transcript and "words" in transcript[0]:
+        return WordArray.from_dicts([w for line in transcript for w in line["words"]])
+
+    if log_info and file:
+        _log_synthesis(file)
+
+    word_list, word_starts, word_ends = _synthesize_columns(transcript)
+    return WordArray(
+        words=np.array(word_list, dtype=object),
+        starts=word_starts,
+        ends=word_ends,
+        conf=np.ones(len(word_list), dtype=np.float32),
+    )
+
+
+def _log_synthesis(file: str) -> None:
+    logger.info(
+        f"Synthesizing word-level timestamps for '{os.path.basename(file)}' "
+        f"(original transcript has sentence-level timestamps only)"
+    )
+
+
+def _synthesize_columns(transcript: list[dict]) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Split sentence content into words and spread each line's time evenly."""
+    # First pass: split lines once and record per-line timing. str.split()
+    # is a single C-level scan and measures several times faster than
+    # re.findall(r"\S+") on the same input, with identical results.
+    split_lines = []
+    counts = []
+    line_starts = []
+    line_durations = []
+    for line in transcript:
+        line_words = line["content"].split()
+        if not line_words:
+            continue
+        split_lines.append(line_words)
+        counts.append(len(line_words))
+        line_starts.append(line["start"])
+        line_durations.append(line["end"] - line["start"])
+
+    if not counts:
+        return [], np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    # Second pass: fill a preallocated flat word buffer
+    word_list = [None] * sum(counts)
+    pos = 0
+    for line_words, n in zip(split_lines, counts):
+        word_list[pos:pos + n] = line_words
+        pos += n
+
+    # Compute all offsets in one vectorized pass instead of per-word arithmetic
+    counts_arr = np.asarray(counts)
+    # Distribute time evenly across words of each line
+    time_per_word = np.repeat(np.asarray(line_durations, dtype=np.float64) / counts_arr, counts_arr)
+    base = np.repeat(np.asarray(line_starts, dtype=np.float64), counts_arr)
+    line_offsets = np.repeat(np.cumsum(counts_arr) - counts_arr, counts_arr)
+    index_in_line = np.arange(len(word_list)) - line_offsets
+
+    word_starts = base + index_in_line * time_per_word
+    word_ends = base + (index_in_line + 1) * time_per_word
+    return word_list, word_starts, word_ends
+
+
 def extract_words_from_transcript(
     transcript: list[dict],
     file: str | None = None
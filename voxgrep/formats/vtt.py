@@ -1,12 +1,26 @@
 import re
 import io
+from functools import lru_cache
 from typing import Union, List
 
+# Inline word timestamp tag, e.g. <00:00:00.000>
+_TS_PAT = re.compile(r"<(\d\d:\d\d:\d\d(?:\.\d+)?)>")
+# Any other tag such as <c> or </c>. The bare <c>/</c> pair that dominates
+# YouTube captions is tried first as a plain literal, skipping the
+# lookahead; it removes exactly what the general branch would.
+_TAG_STRIP = re.compile(r"</?c>|<(?!/?\d\d:\d\d:\d\d)/?[^>]+>")
+# Line containing a timestamp
+_HAS_TS = re.compile(r"\d\d:\d\d:\d\d")
 
+
+@lru_cache(maxsize=131072)
 def timestamp_to_secs(ts: str) -> float:
     """
     Convert a timestamp to seconds
 
+    Cached because every inline word tag is read twice while parsing (as
+    the end of one word and the start of the next).
+
     :param ts str: Timestamp
     :rtype float: Seconds
     """
@@ -22,9 +36,7 @@ def secs_to_timestamp(secs: float) -> str:
 
 def parse_cued(data: List[str]) -> List[dict]:
     out = []
-    # regex for timestamp tags: <00:00:00.000>
-    timestamp_pat = r"<(\d\d:\d\d:\d\d(?:\.\d+)?)>"
-    
+
     for meta, content in data:
         start_match, end_match = meta.split(" --> ")
         seg_start = timestamp_to_secs(start_match)
@@ -32,70 +44,66 @@ def parse_cued(data: List[str]) -> List[dict]:
         seg_end = timestamp_to_secs(end_match.split(" ")[0])
         
         # Strip other tags like <c> or </c>
-        clean_content = re.sub(r"<(?!/?\d\d:\d\d:\d\d)/?[^>]+>", "", content)
+        clean_content = _TAG_STRIP.sub("", content)
         
         # Split by timestamp tags, keeping the tags in the result
-        parts = re.split(timestamp_pat, clean_content)
+        parts = _TS_PAT.split(clean_content)
         
         sentence = {"content": "", "words": [], "start": seg_start, "end": seg_end}
+        content_parts = []
         
         current_time = seg_start
         
         # re.split with one capturing group returns [text, tag, text, tag, ...]
         for i in range(0, len(parts), 2):
+            # If there's a next timestamp, that's the end of this part.
+            # Otherwise seg_end is the end.
+            next_time = seg_end
+            if i + 1 < len(parts):
+                next_time = timestamp_to_secs(parts[i+1])
+
             text = parts[i].strip()
             if text:
-                # This text belongs to the previous time or the segment start
-                # We'll assign it the current_time as start
-                # If there's a next timestamp, that's the end. 
-                # Otherwise seg_end is the end.
-                next_time = seg_end
-                if i + 1 < len(parts):
-                    next_time = timestamp_to_secs(parts[i+1])
-                
-                # Split text into words if multiple
+                # This text belongs to the previous time or the segment start.
+                # We don't know the timing of individual sub-words, so each
+                # one spans the whole part.
                 sub_words = text.split()
-                for j, sw in enumerate(sub_words):
-                    # For sub-words, we don't know the exact timing, so we'll just distribute
-                    # them or just keep them together. For better results, let's just 
-                    # create one entry per split text for now if it's meant to be one word.
-                    sentence["words"].append({
-                        "word": sw,
-                        "start": current_time,
-                        "end": next_time
-                    })
-            
-            if i + 1 < len(parts):
-                current_time = timestamp_to_secs(parts[i+1])
+                sentence["words"].extend(
+                    {"word": sw, "start": current_time, "end": next_time}
+                    for sw in sub_words
+                )
+                content_parts.extend(sub_words)
+
+            current_time = next_time
                 
         if sentence["words"]:
-            sentence["content"] = " ".join([w["word"] for w in sentence["words"]])
+            sentence["content"] = " ".join(content_parts)
             out.append(sentence)
 
     return out
 
 
 def parse_uncued(data: str) -> List[dict]:
-    out = []
-    lines = [d.strip() for d in data.split("\n") if d.strip() != ""]
-    out = [{"content": "", "start": None, "end": None}]
+    lines = [d.strip() for d in data.split("\n")]
+    out = [{"content": [], "start": None, "end": None}]
     for line in lines:
-        if " --> " in line:
-            start, end = line.split(" --> ")
-            end = end.split(" ")[0]
+        if not line:
+            continue
+        start, sep, end = line.partition(" --> ")
+        if sep:
             start = timestamp_to_secs(start)
-            end = timestamp_to_secs(end)
+            end = timestamp_to_secs(end.partition(" ")[0])
             if out[-1]["start"] is None:
                 out[-1]["start"] = start
                 out[-1]["end"] = end
             else:
-                out.append({"content": "", "start": start, "end": end})
-        else:
-            if out[-1]["start"] is not None:
-                out[-1]["content"] += " " + line.strip()
+                out.append({"content": [], "start": start, "end": end})
+        elif out[-1]["start"] is not None:
+            out[-1]["content"].append(line)
 
+    # Content is collected as a list of lines and joined once per cue
     for o in out:
-        o["content"] = o["content"].strip()
+        o["content"] = " ".join(o["content"])
 
     return out
 
@@ -112,14 +120,13 @@ def parse(vtt: Union[io.IOBase, str]) -> List[dict]:
     else:
         _vtt = vtt
 
-    pat = r"<(\d\d:\d\d:\d\d(\.\d+)?)>"
     out = []
 
     lines = []
     data = _vtt.split("\n")
-    data = [d for d in data if re.search(r"\d\d:\d\d:\d\d", d) is not None]
+    data = [d for d in data if _HAS_TS.search(d)]
     for i, d in enumerate(data):
-        if re.search(pat, d):
+        if _TS_PAT.search(d):
             lines.append((data[i - 1], d))
 
     if len(lines) > 0:
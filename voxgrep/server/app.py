@@ -14,9 +14,10 @@ from .vector_store import EmbeddingModel
 from .routers import (
     library_router, ingest_router, media_router,
     search_router, index_router, speaker_router,
-    export_router, system_router
+    export_router, system_router, jobs_router
 )
 from .dependencies import config, features, logger
+from .workers import get_cpu_pool, get_transcriber_pool, shutdown_cpu_pool
 from .routers.library import _scan_path
 
 app = FastAPI(
@@ -43,6 +44,7 @@ app.include_router(search_router)
 app.include_router(index_router)
 app.include_router(speaker_router)
 app.include_router(export_router)
+app.include_router(jobs_router)
 
 
 # ============================================================================
@@ -66,10 +68,20 @@ def on_startup():
                 logger.warning(f"Failed to pre-load semantic model: {e}")
         
         threading.Thread(target=pre_load_model, daemon=True).start()
+    
+    # Worker processes for indexing, diarization and export, plus one
+    # transcription process that loads the Whisper model up front
+    app.state.cpu_pool = get_cpu_pool()
+    app.state.transcriber = get_transcriber_pool()
             
     logger.info(f"VoxGrep Server v0.3.0 started. Database initialized.")
 
 
+@app.on_event("shutdown")
+def on_shutdown():
+    shutdown_cpu_pool()
+
+
 def main():
     import uvicorn
     uvicorn.run(app, host=config.host, port=config.port)
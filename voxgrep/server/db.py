@@ -1,3 +1,4 @@
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine, Session
 from ..utils.config import ServerConfig, get_data_dir
 
@@ -12,6 +13,25 @@ sqlite_url = f"sqlite:///{db_path}"
 connect_args = {"check_same_thread": False}
 engine = create_engine(sqlite_url, connect_args=connect_args)
 
+# WAL lets background writers (indexing, transcription, diarization) commit
+# while API requests keep reading instead of blocking on the journal lock
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Applies SQLITE_PRAGMAS to every new pooled connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 def create_db_and_tables():
     """Initializes the database schema."""
     SQLModel.metadata.create_all(engine)
@@ -1,12 +1,15 @@
 """
 Common dependencies for VoxGrep Server routers.
 """
+from typing import Optional
 from sqlmodel import Session
 from fastapi import Depends
 
 from .db import engine, get_session as _get_db_session
 from .vector_store import get_vector_store as _get_vector_store
 from .multi_model import get_model_manager as _get_model_manager
+from .query_cache import get_query_cache as _get_query_cache, get_video_cache
+from .models import Video
 from ..utils.config import ServerConfig, FeatureFlags
 from ..utils.helpers import setup_logger
 
@@ -27,3 +30,32 @@ def get_vector_store():
 def get_model_manager():
     """Dependency wrapper for model manager."""
     return _get_model_manager()
+
+def get_query_cache():
+    """Dependency wrapper for the search result cache."""
+    return _get_query_cache()
+
+def get_video_snapshot(video_id: int, session: Session) -> Optional[Video]:
+    """
+    Look up a video by id for read-only use, cached for a couple of seconds.
+
+    Players fan out to several per-video endpoints at once, so this saves a
+    query per request. The returned Video is detached from the session; use
+    session.get() instead when the row will be modified or deleted.
+    """
+    cache = get_video_cache()
+    snapshot = cache.get(video_id)
+    if snapshot is None:
+        video = session.get(Video, video_id)
+        if video is None:
+            return None
+        snapshot = video.model_dump()
+        cache.put(video_id, snapshot)
+    return Video.model_construct(**snapshot)
+
+def invalidate_video(video_id: Optional[int] = None) -> None:
+    """Drop a cached video row, or every cached row when video_id is None."""
+    if video_id is None:
+        get_video_cache().clear()
+    else:
+        get_video_cache().pop(video_id)
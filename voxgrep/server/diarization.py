@@ -4,35 +4,104 @@ VoxGrep Speaker Diarization Module
 Provides speaker identification and diarization for audio/video files.
 Uses pyannote.audio for speaker diarization when available.
 """
+import hashlib
+import importlib.util
 import os
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Sequence, Union
 from pathlib import Path
 
-from ..utils.config import get_cache_dir
+import numpy as np
+
+from ..utils import jsonio
+from ..utils.audio import decode_audio
+from ..utils.config import get_cache_dir, FeatureFlags, DEFAULT_DIARIZATION_MODEL
 from ..utils.helpers import setup_logger
 
 logger = setup_logger(__name__)
 
-# Try to import pyannote
+# pyannote's segmentation and embedding models run at 16 kHz
+DIARIZATION_SAMPLE_RATE = 16000
+
+# Long inputs are diarized in overlapping windows so peak memory does not
+# grow with file length
+DEFAULT_CHUNK_MINUTES = 30
+DEFAULT_CHUNK_OVERLAP_SECONDS = 10
+
+# Max cosine distance between speaker centroids of two windows for them to
+# be treated as the same person (close to pyannote 3.1's own clustering
+# threshold)
+SPEAKER_MATCH_THRESHOLD = 0.7
+
+# Transcript segments matched against speaker segments per vectorized block
+ASSIGN_BLOCK_SIZE = 256
+
+# Optional JIT for the speaker assignment loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Opt-in shared-memory cache for model weights: overmind patches torch.load
+# so processes after the first map the pipeline's weights instead of
+# reading them from disk. Must be applied before pyannote is imported.
+SHM_CACHE_ENABLED = False
+if os.getenv("VOXGREP_SHM_CACHE"):
+    try:
+        import overmind.api
+        overmind.api.monkey_patch_all()
+        SHM_CACHE_ENABLED = True
+    except ImportError:
+        logger.warning("VOXGREP_SHM_CACHE is set but overmind is not installed")
+
+# pyannote pulls in torch, lightning and more, which takes seconds; only check
+# that it is installed here and import it when the pipeline is first loaded
 try:
-    from pyannote.audio import Pipeline
-    PYANNOTE_AVAILABLE = True
+    PYANNOTE_AVAILABLE = importlib.util.find_spec("pyannote.audio") is not None
 except ImportError:
     PYANNOTE_AVAILABLE = False
 
 
+def _detect_torch_device() -> str:
+    """Pick the fastest torch device available for the pipeline."""
+    if not FeatureFlags().enable_gpu_acceleration:
+        return "cpu"
+    import torch
+    if torch.cuda.is_available():
+        return "cuda"
+    if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
 class DiarizationPipeline:
     """Singleton for the speaker diarization pipeline."""
     _instance: Optional[Any] = None
     _auth_token: Optional[str] = None
+    _device: Optional[str] = None
+    _model_id: Optional[str] = None
     
     @classmethod
-    def get_instance(cls, auth_token: Optional[str] = None) -> Any:
+    def get_instance(
+        cls,
+        auth_token: Optional[str] = None,
+        device: Optional[str] = None,
+        model_id: Optional[str] = None
+    ) -> Any:
         """
         Get or create the diarization pipeline instance.
         
-        Note: pyannote.audio requires a Hugging Face token with access to
-        the pyannote/speaker-diarization model.
+        Note: pyannote.audio requires a Hugging Face token, and the model's
+        conditions must be accepted on its Hugging Face page.
+        
+        Args:
+            auth_token: Hugging Face token (defaults to HF_TOKEN)
+            device: Torch device to run on ("cuda", "mps", "cpu");
+                auto-detected when None
+            model_id: Pipeline to load (defaults to DEFAULT_DIARIZATION_MODEL),
+                e.g. "pyannote/speaker-diarization-community-1"
         """
         if not PYANNOTE_AVAILABLE:
             raise RuntimeError(
@@ -40,24 +109,61 @@ class DiarizationPipeline:
                 "pip install pyannote.audio"
             )
         
-        if cls._instance is None:
+        model_id = model_id or cls._model_id or DEFAULT_DIARIZATION_MODEL
+        if cls._instance is None or model_id != cls._model_id:
             token = auth_token or os.getenv("HF_TOKEN")
             if not token:
                 raise RuntimeError(
                     "Hugging Face token required for pyannote.audio. "
-                    "Set HF_TOKEN environment variable or pass auth_token."
+                    "Set HF_TOKEN environment variable or pass auth_token, "
+                    f"and accept the conditions at https://hf.co/{model_id}"
                 )
             
-            logger.info("Loading speaker diarization pipeline...")
-            cls._instance = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.0",
-                use_auth_token=token
-            )
+            from pyannote.audio import Pipeline
+            
+            logger.info(f"Loading speaker diarization pipeline {model_id}...")
+            pipeline = Pipeline.from_pretrained(model_id, use_auth_token=token)
+            if pipeline is None:
+                # from_pretrained returns None when the gated model is not accessible
+                raise RuntimeError(
+                    f"Could not load {model_id}. Accept its conditions at "
+                    f"https://hf.co/{model_id} with the account of the given token."
+                )
+            cls._instance = pipeline
             cls._auth_token = token
+            cls._model_id = model_id
+            cls._device = None
             logger.info("Diarization pipeline loaded successfully")
         
+        # from_pretrained always loads onto the CPU
+        target = device or cls._device or _detect_torch_device()
+        if target != cls._device:
+            import torch
+            cls._instance.to(torch.device(target))
+            cls._device = target
+            logger.info(f"Diarization pipeline running on {target}")
+            cls._set_embedding_precision(target)
+        
         return cls._instance
     
+    @classmethod
+    def _set_embedding_precision(cls, device: str) -> None:
+        """
+        Run speaker embeddings in fp16 on tensor-core GPUs.
+        
+        Embedding extraction dominates diarization time. pyannote 3.1+ keeps
+        statistics pooling in fp32 when the embedding frontend is fp16, so
+        speaker clustering is unaffected. Older versions lack the setting.
+        """
+        import torch
+        if not hasattr(cls._instance, "_embedding_precision"):
+            return
+        if device == "cuda" and torch.cuda.get_device_capability()[0] >= 7:
+            cls._instance._embedding_precision = torch.float16
+            logger.info("Using fp16 speaker embeddings")
+        else:
+            cls._instance._embedding_precision = torch.float32
+    
     @classmethod
     def is_available(cls) -> bool:
         """Check if diarization is available."""
@@ -67,6 +173,9 @@ class DiarizationPipeline:
 class SpeakerSegment:
     """Represents a segment of audio attributed to a specific speaker."""
     
+    # Segments are created per speaker turn, so skip the per-instance __dict__
+    __slots__ = ("speaker_id", "start", "end", "confidence")
+    
     def __init__(
         self,
         speaker_id: str,
@@ -87,6 +196,15 @@ class SpeakerSegment:
             "confidence": self.confidence
         }
     
+    def to_tuple(self) -> Tuple[str, float, float, float]:
+        """Compact (speaker_id, start, end, confidence) form."""
+        return (self.speaker_id, self.start, self.end, self.confidence)
+    
+    @classmethod
+    def from_tuple(cls, row: Sequence) -> "SpeakerSegment":
+        """Build a segment from its to_tuple() form."""
+        return cls(*row)
+    
     def overlaps(self, start: float, end: float) -> bool:
         """Check if this segment overlaps with a time range."""
         return self.start < end and self.end > start
@@ -98,13 +216,101 @@ class SpeakerSegment:
         return max(0, overlap_end - overlap_start)
 
 
+class SpeakerSegmentArray:
+    """
+    Diarization output stored as parallel arrays, one row per speaker turn.
+    
+    Speaker labels are stored once in labels and referenced by index, so a
+    long recording is a few contiguous arrays rather than thousands of
+    objects. Indexing and iteration yield SpeakerSegment objects, so code
+    written against a list of segments keeps working.
+    
+    Times stay float64 so they round-trip exactly: pyannote and the legacy
+    JSON cache hand back Python floats, and they are compared against
+    float64 transcript times when assigning speakers.
+    """
+    
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        speaker_idx: np.ndarray,
+        labels: Sequence[str],
+        confidences: Optional[np.ndarray] = None
+    ):
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self.speaker_idx = np.asarray(speaker_idx, dtype=np.int32)
+        self.labels = list(labels)
+        self.confidences = (
+            np.ones(len(self.starts), dtype=np.float32) if confidences is None
+            else np.asarray(confidences, dtype=np.float32)
+        )
+    
+    @classmethod
+    def from_tracks(cls, tracks: Iterator[Tuple[float, float, str]]) -> "SpeakerSegmentArray":
+        """Build from (start, end, speaker_id) tuples."""
+        label_index: Dict[str, int] = {}
+        starts, ends, idx = [], [], []
+        for start, end, speaker in tracks:
+            starts.append(start)
+            ends.append(end)
+            idx.append(label_index.setdefault(speaker, len(label_index)))
+        return cls(starts, ends, idx, list(label_index))
+    
+    @classmethod
+    def coerce(
+        cls,
+        segments: Union["SpeakerSegmentArray", Sequence[SpeakerSegment]]
+    ) -> "SpeakerSegmentArray":
+        """Return segments as a SpeakerSegmentArray, converting a list if needed."""
+        if isinstance(segments, cls):
+            return segments
+        array = cls.from_tracks((s.start, s.end, s.speaker_id) for s in segments)
+        array.confidences = np.array([s.confidence for s in segments], dtype=np.float32)
+        return array
+    
+    @property
+    def speaker_ids(self) -> np.ndarray:
+        """Speaker label of every row."""
+        return np.asarray(self.labels, dtype=object)[self.speaker_idx]
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __getitem__(self, i: int) -> SpeakerSegment:
+        return SpeakerSegment(
+            speaker_id=self.labels[self.speaker_idx[i]],
+            start=float(self.starts[i]),
+            end=float(self.ends[i]),
+            confidence=float(self.confidences[i])
+        )
+    
+    def __iter__(self) -> Iterator[SpeakerSegment]:
+        # Convert whole columns at once rather than four numpy scalars per row
+        rows = zip(
+            self.speaker_ids.tolist(),
+            self.starts.tolist(),
+            self.ends.tolist(),
+            self.confidences.tolist()
+        )
+        return map(SpeakerSegment.from_tuple, rows)
+    
+    def to_dicts(self) -> List[dict]:
+        """Segments as SpeakerSegment.to_dict() dicts."""
+        return [seg.to_dict() for seg in self]
+
+
 def diarize(
     audio_path: str,
     num_speakers: Optional[int] = None,
     min_speakers: int = 1,
     max_speakers: int = 10,
-    auth_token: Optional[str] = None
-) -> List[SpeakerSegment]:
+    auth_token: Optional[str] = None,
+    samples: Optional[np.ndarray] = None,
+    chunk_minutes: float = DEFAULT_CHUNK_MINUTES,
+    overlap_seconds: float = DEFAULT_CHUNK_OVERLAP_SECONDS
+) -> SpeakerSegmentArray:
     """
     Perform speaker diarization on an audio/video file.
     
@@ -114,13 +320,18 @@ def diarize(
         min_speakers: Minimum expected speakers
         max_speakers: Maximum expected speakers
         auth_token: Hugging Face auth token
+        samples: The file's audio already decoded by decode_audio at
+            DIARIZATION_SAMPLE_RATE (decoded here when None)
+        chunk_minutes: Files longer than this are diarized in windows of
+            this length, with speakers matched across windows
+        overlap_seconds: Overlap between consecutive windows
         
     Returns:
-        List of SpeakerSegment objects
+        SpeakerSegmentArray of speaker turns
     """
     if not PYANNOTE_AVAILABLE:
         logger.warning("Speaker diarization not available")
-        return []
+        return SpeakerSegmentArray.from_tracks(())
     
     if not os.path.exists(audio_path):
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
@@ -137,101 +348,349 @@ def diarize(
         params["min_speakers"] = min_speakers
         params["max_speakers"] = max_speakers
     
-    # Run diarization
-    diarization = pipeline(audio_path, **params)
+    # Decode once up front. Given a path, pyannote re-opens and re-decodes
+    # the file for every chunk it crops, which dominates runtime on video
+    if samples is None:
+        samples = decode_audio(audio_path, sample_rate=DIARIZATION_SAMPLE_RATE)
     
-    # Convert to SpeakerSegments
-    segments = []
-    for turn, _, speaker in diarization.itertracks(yield_label=True):
-        segments.append(SpeakerSegment(
-            speaker_id=speaker,
-            start=turn.start,
-            end=turn.end
-        ))
+    chunk_len = int(chunk_minutes * 60 * DIARIZATION_SAMPLE_RATE)
+    if len(samples) > chunk_len:
+        segments = _diarize_chunked(
+            pipeline, samples, params, chunk_len,
+            int(overlap_seconds * DIARIZATION_SAMPLE_RATE)
+        )
+    else:
+        diarization = _run_pipeline(pipeline, samples, params)
+        segments = SpeakerSegmentArray.from_tracks(
+            (turn.start, turn.end, speaker)
+            for turn, _, speaker in diarization.itertracks(yield_label=True)
+        )
     
     logger.info(f"Found {len(segments)} speaker segments")
     return segments
 
 
+def _run_pipeline(
+    pipeline: Any,
+    samples: np.ndarray,
+    params: dict,
+    return_embeddings: bool = False
+) -> Any:
+    """Run the pipeline on in-memory audio."""
+    import torch
+    waveform = torch.from_numpy(np.array(samples, dtype=np.float32)).unsqueeze(0)
+    if return_embeddings:
+        params = {**params, "return_embeddings": True}
+    
+    # No autograd bookkeeping needed
+    with torch.inference_mode():
+        return pipeline(
+            {"waveform": waveform, "sample_rate": DIARIZATION_SAMPLE_RATE},
+            **params
+        )
+
+
+def _match_speakers(
+    centroids: np.ndarray,
+    global_centroids: List[np.ndarray]
+) -> List[Optional[int]]:
+    """
+    Match a window's speaker centroids to the speakers seen so far.
+    
+    Uses a one-to-one Hungarian assignment on cosine distance; pairs
+    further apart than SPEAKER_MATCH_THRESHOLD stay unmatched (None).
+    """
+    matches: List[Optional[int]] = [None] * len(centroids)
+    if not global_centroids or len(centroids) == 0:
+        return matches
+    
+    from scipy.optimize import linear_sum_assignment
+    known = np.stack(global_centroids)
+    a = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+    b = known / np.linalg.norm(known, axis=1, keepdims=True)
+    # NaN embeddings (too little speech) never match
+    distance = np.nan_to_num(1.0 - a @ b.T, nan=np.inf)
+    rows, cols = linear_sum_assignment(np.minimum(distance, 1e6))
+    for r, c in zip(rows, cols):
+        if distance[r, c] <= SPEAKER_MATCH_THRESHOLD:
+            matches[r] = int(c)
+    return matches
+
+
+def _diarize_chunked(
+    pipeline: Any,
+    samples: np.ndarray,
+    params: dict,
+    chunk_len: int,
+    overlap: int
+) -> SpeakerSegmentArray:
+    """
+    Diarize long audio in overlapping windows and stitch speakers together.
+    
+    Each window returns its speakers' embedding centroids, which are matched
+    against the speakers found in earlier windows. Each overlap is split at
+    its midpoint, so every instant is labelled by exactly one window.
+    """
+    if num := params.get("num_speakers"):
+        # A window may contain only some of the speakers
+        params = {"min_speakers": 1, "max_speakers": num}
+    
+    step = chunk_len - overlap
+    starts = list(range(0, max(len(samples) - overlap, 1), step))
+    logger.info(f"Diarizing {len(samples) / DIARIZATION_SAMPLE_RATE / 60:.1f} min in {len(starts)} windows")
+    
+    global_centroids: List[np.ndarray] = []
+    global_counts: List[int] = []
+    tracks: List[Tuple[float, float, str]] = []
+    half_overlap = overlap / 2 / DIARIZATION_SAMPLE_RATE
+    
+    for n, start in enumerate(starts):
+        offset = start / DIARIZATION_SAMPLE_RATE
+        diarization, embeddings = _run_pipeline(
+            pipeline, samples[start:start + chunk_len], params, return_embeddings=True
+        )
+        local_labels = diarization.labels()
+        centroids = np.asarray(embeddings, dtype=np.float64)[:len(local_labels)]
+        
+        # Map this window's labels to global speakers, adding new ones
+        matches = _match_speakers(centroids, global_centroids)
+        label_map = {}
+        for label, centroid, match in zip(local_labels, centroids, matches):
+            if match is None:
+                match = len(global_centroids)
+                global_centroids.append(np.nan_to_num(centroid))
+                global_counts.append(0)
+            elif not np.isnan(centroid).any():
+                # Running mean of the speaker's centroids across windows
+                global_counts[match] += 1
+                weight = 1.0 / (global_counts[match] + 1)
+                global_centroids[match] = (1 - weight) * global_centroids[match] + weight * centroid
+            label_map[label] = f"SPEAKER_{match:02d}"
+        
+        # Each overlap is split at its midpoint; a window only keeps the
+        # parts of its turns that fall on its own side
+        lower = offset + half_overlap if n > 0 else 0.0
+        upper = offset + (chunk_len / DIARIZATION_SAMPLE_RATE) - half_overlap if n + 1 < len(starts) else np.inf
+        for turn, _, speaker in diarization.itertracks(yield_label=True):
+            start = max(offset + turn.start, lower)
+            end = min(offset + turn.end, upper)
+            if end > start:
+                tracks.append((start, end, label_map[speaker]))
+    
+    tracks.sort(key=lambda t: t[0])
+    
+    # Rejoin turns that were cut at a split point
+    merged: List[Tuple[float, float, str]] = []
+    for start, end, label in tracks:
+        previous = merged[-1] if merged else None
+        if previous and previous[2] == label and previous[1] == start:
+            merged[-1] = (previous[0], end, label)
+        else:
+            merged.append((start, end, label))
+    return SpeakerSegmentArray.from_tracks(merged)
+
+
+def summarize_speakers(
+    segments: Union[SpeakerSegmentArray, List[SpeakerSegment]]
+) -> List[Tuple[str, float, int]]:
+    """
+    Total speaking time and segment count per speaker.
+    
+    Args:
+        segments: Speaker segments from diarization
+        
+    Returns:
+        (speaker_id, total_duration, segment_count) tuples, in order of
+        each speaker's first segment
+    """
+    segments = SpeakerSegmentArray.coerce(segments)
+    if len(segments) == 0:
+        return []
+    
+    idx = segments.speaker_idx
+    totals = np.bincount(idx, weights=segments.ends - segments.starts, minlength=len(segments.labels))
+    counts = np.bincount(idx, minlength=len(segments.labels))
+    
+    present, first_seen = np.unique(idx, return_index=True)
+    order = present[np.argsort(first_seen)]
+    return [
+        (segments.labels[i], float(totals[i]), int(counts[i]))
+        for i in order
+    ]
+
+
+def _best_overlap(
+    seg_starts: np.ndarray,
+    seg_ends: np.ndarray,
+    spk_starts: np.ndarray,
+    spk_ends: np.ndarray,
+    spk_reach: np.ndarray,
+    spk_order: np.ndarray
+) -> np.ndarray:
+    """
+    For each transcript segment, the index of the speaker segment that
+    overlaps it most (the earliest one on ties), or -1 if none does.
+    
+    Speaker segments are given sorted by start, with spk_reach the running
+    max of their ends and spk_order their original indices (see
+    assign_speakers_to_transcript). Returned indices are original ones.
+    """
+    best = np.full(len(seg_starts), -1, dtype=np.int64)
+    for lo in range(0, len(seg_starts), ASSIGN_BLOCK_SIZE):
+        hi = lo + ASSIGN_BLOCK_SIZE
+        starts = seg_starts[lo:hi, None]
+        ends = seg_ends[lo:hi, None]
+        # Only speaker segments overlapping this block's time span can match:
+        # those after the last one ending by the block start and before the
+        # first one starting at its end
+        first = np.searchsorted(spk_reach, starts.min(initial=np.inf), side="right")
+        last = np.searchsorted(spk_starts, ends.max(initial=-np.inf), side="left")
+        if first >= last:
+            continue
+        overlap = np.minimum(spk_ends[first:last], ends) - np.maximum(spk_starts[first:last], starts)
+        top = overlap.max(axis=1, keepdims=True)
+        # Of equal overlaps the first match wins, as in the original order
+        pick = np.where(overlap == top, spk_order[first:last], len(spk_order)).min(axis=1)
+        best[lo:hi] = np.where(top[:, 0] > 0, pick, -1)
+    
+    return best
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _best_overlap_jit(seg_starts, seg_ends, spk_starts, spk_ends, spk_reach, spk_order):
+        """Compiled _best_overlap: a bounded double loop, with no temporaries."""
+        best = np.full(seg_starts.size, -1, dtype=np.int64)
+        for i in range(seg_starts.size):
+            first = np.searchsorted(spk_reach, seg_starts[i], side="right")
+            last = np.searchsorted(spk_starts, seg_ends[i], side="left")
+            best_overlap = 0.0
+            for j in range(first, last):
+                overlap = min(spk_ends[j], seg_ends[i]) - max(spk_starts[j], seg_starts[i])
+                if overlap > best_overlap or (
+                    overlap == best_overlap and overlap > 0 and spk_order[j] < best[i]
+                ):
+                    best_overlap = overlap
+                    best[i] = spk_order[j]
+        return best
+
+
 def assign_speakers_to_transcript(
     transcript: List[dict],
-    speaker_segments: List[SpeakerSegment]
+    speaker_segments: Union[SpeakerSegmentArray, List[SpeakerSegment]]
 ) -> List[dict]:
     """
     Assign speaker labels to transcript segments based on diarization.
     
     Args:
         transcript: List of transcript segments with 'start' and 'end' keys
-        speaker_segments: List of SpeakerSegment objects from diarization
+        speaker_segments: Speaker segments from diarization
         
     Returns:
         Transcript with 'speaker' field added to each segment
     """
-    result = []
+    seg_starts = np.array([seg.get("start", 0) for seg in transcript], dtype=np.float64)
+    seg_ends = np.array([seg.get("end", 0) for seg in transcript], dtype=np.float64)
+    speaker_segments = SpeakerSegmentArray.coerce(speaker_segments)
     
-    for seg in transcript:
-        seg_start = seg.get("start", 0)
-        seg_end = seg.get("end", 0)
-        
-        # Find the speaker with most overlap
-        best_speaker = None
-        best_overlap = 0
-        
-        for speaker_seg in speaker_segments:
-            if speaker_seg.overlaps(seg_start, seg_end):
-                overlap = speaker_seg.overlap_duration(seg_start, seg_end)
-                if overlap > best_overlap:
-                    best_overlap = overlap
-                    best_speaker = speaker_seg.speaker_id
-        
+    # Sorted by start, binary searches bound the speaker segments each
+    # transcript segment can overlap. Turns may overlap each other, so ends
+    # are not sorted; their running max is, and bounds the other side
+    order = np.argsort(speaker_segments.starts, kind="stable")
+    spk_starts = speaker_segments.starts[order]
+    spk_ends = speaker_segments.ends[order]
+    spk_reach = np.maximum.accumulate(spk_ends) if len(spk_ends) else spk_ends
+    
+    # Index of the best speaker segment per transcript segment, -1 for none
+    kernel = _best_overlap_jit if NUMBA_AVAILABLE else _best_overlap
+    best = kernel(seg_starts, seg_ends, spk_starts, spk_ends, spk_reach, order)
+    
+    labels = speaker_segments.labels
+    speaker_idx = speaker_segments.speaker_idx.tolist()
+    result = []
+    for seg, idx in zip(transcript, best.tolist()):
         # Create new segment with speaker info
         new_seg = seg.copy()
-        new_seg["speaker"] = best_speaker or "UNKNOWN"
+        new_seg["speaker"] = (labels[speaker_idx[idx]] if idx >= 0 else None) or "UNKNOWN"
         result.append(new_seg)
     
     return result
 
 
+# Videos known to have no cache file in this process, so repeated lookups
+# (e.g. while batch indexing) skip the filesystem. Cleared on save
+_missing_cache: set = set()
+
+
 def get_diarization_cache_path(video_path: str) -> Path:
     """Get the cache path for diarization results."""
-    import hashlib
+    # Only a short file name is needed, so blake2b with an 8-byte digest
+    # gives the 16 hex characters directly
+    video_hash = hashlib.blake2b(video_path.encode(), digest_size=8).hexdigest()
+    return get_cache_dir() / "diarization" / f"{video_hash}.npz"
+
+
+def _legacy_diarization_cache_path(video_path: str) -> Path:
+    """Path of JSON caches written by earlier versions."""
     video_hash = hashlib.md5(video_path.encode()).hexdigest()[:16]
     return get_cache_dir() / "diarization" / f"{video_hash}.json"
 
 
-def save_diarization(video_path: str, segments: List[SpeakerSegment]) -> None:
+def save_diarization(
+    video_path: str,
+    segments: Union[SpeakerSegmentArray, List[SpeakerSegment]]
+) -> None:
     """Save diarization results to cache."""
-    import json
     cache_path = get_diarization_cache_path(video_path)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
+    segments = SpeakerSegmentArray.coerce(segments)
     
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "video_path": video_path,
-            "segments": [s.to_dict() for s in segments]
-        }, f)
+    # One uncompressed .npz holding the arrays as-is; no pickled objects
+    with open(cache_path, "wb") as f:
+        np.savez(
+            f,
+            video_path=np.array(video_path),
+            starts=segments.starts,
+            ends=segments.ends,
+            speaker_idx=segments.speaker_idx,
+            confidences=segments.confidences,
+            labels=np.array(segments.labels, dtype=str)
+        )
     
+    _missing_cache.discard(video_path)
     logger.debug(f"Saved diarization cache: {cache_path}")
 
 
-def load_diarization(video_path: str) -> Optional[List[SpeakerSegment]]:
+def load_diarization(video_path: str) -> Optional[SpeakerSegmentArray]:
     """Load cached diarization results."""
-    import json
-    cache_path = get_diarization_cache_path(video_path)
-    
-    if not cache_path.exists():
+    if video_path in _missing_cache:
         return None
     
+    # Open directly rather than checking exists() first: one syscall per
+    # lookup instead of two
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            with open(get_diarization_cache_path(video_path), "rb") as f, \
+                    np.load(f, allow_pickle=False) as data:
+                return SpeakerSegmentArray(
+                    data["starts"], data["ends"], data["speaker_idx"],
+                    data["labels"].tolist(), data["confidences"]
+                )
+        except FileNotFoundError:
+            pass
         
-        return [
+        # Caches written before the switch to .npz
+        try:
+            data = jsonio.load_file(_legacy_diarization_cache_path(video_path))
+        except FileNotFoundError:
+            _missing_cache.add(video_path)
+            return None
+        return SpeakerSegmentArray.coerce([
             SpeakerSegment(**seg) for seg in data.get("segments", [])
-        ]
+        ])
     except Exception as e:
         logger.warning(f"Failed to load diarization cache: {e}")
-        return None
+    return None
 
 
 def diarize_cached(
@@ -239,7 +698,7 @@ def diarize_cached(
     num_speakers: Optional[int] = None,
     force: bool = False,
     **kwargs
-) -> List[SpeakerSegment]:
+) -> SpeakerSegmentArray:
     """
     Perform speaker diarization with caching.
     
@@ -250,7 +709,7 @@ def diarize_cached(
         **kwargs: Additional arguments passed to diarize()
         
     Returns:
-        List of SpeakerSegment objects
+        SpeakerSegmentArray of speaker turns
     """
     if not force:
         cached = load_diarization(audio_path)
@@ -261,3 +720,59 @@ def diarize_cached(
     segments = diarize(audio_path, num_speakers=num_speakers, **kwargs)
     save_diarization(audio_path, segments)
     return segments
+
+
+def _decode_for_diarization(audio_path: str) -> Optional[np.ndarray]:
+    """Decode a file for diarize(), or None if it cannot be (diarize reports why)."""
+    if not PYANNOTE_AVAILABLE or not os.path.exists(audio_path):
+        return None
+    return decode_audio(audio_path, sample_rate=DIARIZATION_SAMPLE_RATE)
+
+
+def diarize_many(
+    audio_paths: List[str],
+    num_speakers: Optional[int] = None,
+    force: bool = False,
+    **kwargs
+) -> Iterator[Tuple[str, SpeakerSegmentArray]]:
+    """
+    Diarize several files with one pipeline load, caching each result.
+    
+    The pipeline is loaded (and moved to the GPU) once up front, and the
+    next uncached file's audio is decoded by ffmpeg while the current one
+    runs through the pipeline.
+    
+    Args:
+        audio_paths: Paths to the audio or video files
+        num_speakers: Exact number of speakers (if known)
+        force: If True, re-run diarization even if cached
+        **kwargs: Additional arguments passed to diarize()
+        
+    Yields:
+        (path, SpeakerSegmentArray) in input order
+    """
+    results: Dict[str, SpeakerSegmentArray] = {}
+    if not force:
+        for path in audio_paths:
+            cached = load_diarization(path)
+            if cached is not None:
+                results[path] = cached
+    pending = list(dict.fromkeys(p for p in audio_paths if p not in results))
+    
+    if pending and PYANNOTE_AVAILABLE:
+        DiarizationPipeline.get_instance(kwargs.get("auth_token"))
+    
+    with ThreadPoolExecutor(max_workers=1) as decoder:
+        # pending is processed in order; keep one file decoding ahead
+        upcoming = iter(pending)
+        decoding = [decoder.submit(_decode_for_diarization, p) for p in islice(upcoming, 1)]
+        
+        for path in audio_paths:
+            if path not in results:
+                samples = decoding.pop().result()
+                decoding.extend(decoder.submit(_decode_for_diarization, p) for p in islice(upcoming, 1))
+                
+                segments = diarize(path, num_speakers=num_speakers, samples=samples, **kwargs)
+                save_diarization(path, segments)
+                results[path] = segments
+            yield path, results[path]
@@ -71,7 +71,7 @@ class Embedding(SQLModel, table=True):
     segment_start: float
     segment_end: float
     segment_content: str
-    embedding_blob: bytes  # Serialized numpy array
+    embedding_blob: bytes  # float32 vector bytes (float16 if fp16 embeddings are enabled)
     embedding_dim: int
     created_at: float = Field(default_factory=lambda: datetime.now().timestamp())
     
@@ -9,31 +9,29 @@ Provides unified interface for multiple transcription backends:
 
 Supports model hot-swapping and performance optimization.
 """
+import gc
 import os
-from typing import List, Optional, Dict, Any, Callable
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Callable, Iterator, Tuple
+from dataclasses import dataclass, replace
 from abc import ABC, abstractmethod
 
-from ..core.types import TranscriptionBackend, TranscriptionResult as CoreTranscriptionResult
+from ..core.types import TranscriptionBackend, TranscriptionResult
 from ..utils.config import (
     DEFAULT_WHISPER_MODEL,
     DEFAULT_MLX_MODEL,
     DEFAULT_DEVICE,
-    DEFAULT_COMPUTE_TYPE,
     get_cache_dir
 )
+from ..utils import jsonio
 from ..utils.helpers import setup_logger
 
 logger = setup_logger(__name__)
 
-
-@dataclass
-class TranscriptionResult:
-    """Result from transcription."""
-    segments: List[dict]
-    language: Optional[str] = None
-    duration: Optional[float] = None
-    backend: Optional[str] = None
+# Number of models each local backend (faster-whisper, MLX) keeps loaded, so
+# switching between a couple of models does not reload weights every time
+MODEL_CACHE_SIZE = max(1, int(os.getenv("VOXGREP_MODEL_CACHE", "2")))
 
 
 @dataclass
@@ -68,6 +66,25 @@ class TranscriptionProvider(ABC):
         """Transcribe an audio/video file."""
         pass
     
+    def transcribe_stream(
+        self,
+        audio_path: str | Any,
+        out_path: str,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        **kwargs
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio/video file and write its segments to a JSON file.
+        
+        The returned result has no segments; read them from out_path.
+        Providers that decode incrementally override this to write segments
+        as they are produced instead of collecting the whole list first.
+        """
+        result = self.transcribe(audio_path, model=model, language=language, **kwargs)
+        jsonio.dump_file(result.segments, out_path)
+        return replace(result, segments=[])
+    
     @abstractmethod
     def get_models(self) -> List[ModelInfo]:
         """Get list of available models for this provider."""
@@ -78,8 +95,10 @@ class FasterWhisperProvider(TranscriptionProvider):
     """Provider for faster-whisper (CTranslate2)."""
     
     def __init__(self):
-        self._model = None
-        self._model_name = None
+        # LRU of loaded models keyed by (model name, device, compute type).
+        # Each entry is (WhisperModel, BatchedInferencePipeline wrapping it,
+        # or None when the installed faster-whisper predates it)
+        self._models: "OrderedDict[tuple, tuple]" = OrderedDict()
         
     def is_available(self) -> bool:
         try:
@@ -88,54 +107,106 @@ class FasterWhisperProvider(TranscriptionProvider):
         except ImportError:
             return False
     
-    def transcribe(
+    def _get_model(self, model_name: str, device: str, compute_type: str) -> tuple:
+        """Return a cached (model, batched model) pair, loading it if needed."""
+        key = (model_name, device, compute_type)
+        if key in self._models:
+            self._models.move_to_end(key)
+            return self._models[key]
+        
+        while len(self._models) >= MODEL_CACHE_SIZE:
+            evicted = self._models.popitem(last=False)[0]
+            logger.info(f"Unloading faster-whisper model: {evicted[0]} ({evicted[2]})")
+            # CTranslate2 frees the weights once the last reference is gone
+            gc.collect()
+        
+        from faster_whisper import WhisperModel
+        logger.info(f"Loading faster-whisper model: {model_name} on {device} ({compute_type})")
+        whisper_model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        try:
+            from faster_whisper import BatchedInferencePipeline
+            batched_model = BatchedInferencePipeline(model=whisper_model)
+        except ImportError:
+            batched_model = None
+        
+        self._models[key] = (whisper_model, batched_model)
+        return self._models[key]
+    
+    def _iter_segments(
         self,
         audio_path: str | Any,
         model: Optional[str] = None,
         language: Optional[str] = None,
         device: str = DEFAULT_DEVICE,
-        compute_type: str = DEFAULT_COMPUTE_TYPE,
+        compute_type: Optional[str] = None,
+        batch_size: Optional[int] = None,
         **kwargs
-    ) -> TranscriptionResult:
-        from faster_whisper import WhisperModel
-        
+    ) -> Tuple[Iterator[dict], Any]:
+        """Start a transcription; segments are decoded as the iterator is consumed."""
         model_name = model or DEFAULT_WHISPER_MODEL
-        
-        # Load or reuse model
-        if self._model is None or self._model_name != model_name:
-            logger.info(f"Loading faster-whisper model: {model_name} on {device}")
-            self._model = WhisperModel(model_name, device=device, compute_type=compute_type)
-            self._model_name = model_name
+        # int8 weights halve memory traffic; on CUDA activations stay float16
+        compute_type = compute_type or ("int8_float16" if device.startswith("cuda") else "int8")
+        whisper_model, batched_model = self._get_model(model_name, device, compute_type)
         
         # Transcribe
-        segments_gen, info = self._model.transcribe(
-            audio_path,
-            word_timestamps=True,
-            language=language,
-            initial_prompt=kwargs.get("prompt")
-        )
+        if batched_model is not None:
+            segments_gen, info = batched_model.transcribe(
+                audio_path,
+                batch_size=batch_size or (16 if device == "cuda" else 8),
+                word_timestamps=True,
+                language=language,
+                initial_prompt=kwargs.get("prompt")
+            )
+        else:
+            segments_gen, info = whisper_model.transcribe(
+                audio_path,
+                word_timestamps=True,
+                language=language,
+                initial_prompt=kwargs.get("prompt")
+            )
         
-        segments = []
-        for seg in segments_gen:
-            words = []
-            if seg.words:
-                for w in seg.words:
-                    words.append({
-                        "word": w.word.strip(),
-                        "start": w.start,
-                        "end": w.end,
-                        "conf": w.probability
-                    })
-            
-            segments.append({
+        segments = (
+            {
                 "content": seg.text.strip(),
                 "start": seg.start,
                 "end": seg.end,
-                "words": words
-            })
-        
+                "words": [
+                    {"word": w.word.strip(), "start": w.start, "end": w.end, "conf": w.probability}
+                    for w in (seg.words or ())
+                ]
+            }
+            for seg in segments_gen
+        )
+        return segments, info
+    
+    def transcribe(
+        self,
+        audio_path: str | Any,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        **kwargs
+    ) -> TranscriptionResult:
+        segments, info = self._iter_segments(audio_path, model=model, language=language, **kwargs)
         return TranscriptionResult(
-            segments=segments,
+            segments=list(segments),
+            language=info.language,
+            duration=info.duration,
+            backend=TranscriptionBackend.FASTER_WHISPER.value
+        )
+    
+    def transcribe_stream(
+        self,
+        audio_path: str | Any,
+        out_path: str,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        **kwargs
+    ) -> TranscriptionResult:
+        segments, info = self._iter_segments(audio_path, model=model, language=language, **kwargs)
+        count = jsonio.dump_iter_file(segments, out_path)
+        logger.debug(f"Streamed {count} segments to {out_path}")
+        return TranscriptionResult(
+            segments=[],
             language=info.language,
             duration=info.duration,
             backend=TranscriptionBackend.FASTER_WHISPER.value
@@ -164,11 +235,25 @@ class FasterWhisperProvider(TranscriptionProvider):
         ]
 
 
+def _wire_mlx_memory() -> None:
+    """
+    Keep MLX buffers resident in GPU memory (wired) up to Metal's
+    recommended working set, so loaded weights are not paged out between
+    transcriptions. Needs macOS 15 and a recent MLX; otherwise a no-op.
+    """
+    try:
+        import mlx.core as mx
+        set_wired_limit = getattr(mx, "set_wired_limit", None) or mx.metal.set_wired_limit
+        set_wired_limit(mx.metal.device_info()["max_recommended_working_set_size"])
+    except (ImportError, AttributeError, KeyError, RuntimeError) as e:
+        logger.debug(f"Could not wire MLX memory: {e}")
+
+
 class MLXWhisperProvider(TranscriptionProvider):
     """Provider for MLX-Whisper (Apple Silicon)."""
     
     def __init__(self):
-        self._model_cache = {}
+        self._model_cache: "OrderedDict[tuple, Any]" = OrderedDict()
         self._original_load_model = None
 
     def is_available(self) -> bool:
@@ -207,11 +292,20 @@ class MLXWhisperProvider(TranscriptionProvider):
                     
                     if key in self._model_cache:
                         logger.debug(f"Using cached MLX model for {args[0] if args else 'unknown'}")
+                        self._model_cache.move_to_end(key)
                         return self._model_cache[key]
                     
+                    # Weights live in unified memory, so keep only the most
+                    # recently used models resident
+                    while len(self._model_cache) >= MODEL_CACHE_SIZE:
+                        evicted = self._model_cache.popitem(last=False)[0]
+                        logger.info(f"Unloading MLX model: {evicted[0][0] if evicted[0] else 'unknown'}")
+                        gc.collect()
+                    
                     logger.info(f"Loading new MLX model: {args[0] if args else 'unknown'}")
                     model_instance = self._original_load_model(*args, **kwargs)
                     self._model_cache[key] = model_instance
+                    _wire_mlx_memory()
                     return model_instance
                 
                 # Apply patch to the module
@@ -233,15 +327,10 @@ class MLXWhisperProvider(TranscriptionProvider):
         
         segments = []
         for seg in result.get("segments", []):
-            words = []
-            if "words" in seg:
-                for w in seg["words"]:
-                    words.append({
-                        "word": w["word"].strip(),
-                        "start": w["start"],
-                        "end": w["end"],
-                        "conf": w.get("probability", 1.0)
-                    })
+            words = [
+                {"word": w["word"].strip(), "start": w["start"], "end": w["end"], "conf": w.get("probability", 1.0)}
+                for w in seg.get("words", ())
+            ]
             
             segments.append({
                 "content": seg["text"].strip(),
@@ -263,6 +352,7 @@ class MLXWhisperProvider(TranscriptionProvider):
             ("mlx-community/whisper-small-mlx", "Small model for MLX", "5x"),
             ("mlx-community/whisper-medium-mlx", "Medium model for MLX", "2x"),
             ("mlx-community/whisper-large-v3-mlx", "Large-v3 for MLX", "1x"),
+            ("mlx-community/whisper-large-v3-mlx-4bit", "Large-v3 4-bit quantized for MLX", "2x"),
         ]
         
         return [
@@ -309,18 +399,21 @@ class OpenAIAPIProvider(TranscriptionProvider):
                 timestamp_granularities=["word", "segment"]
             )
         
+        # Word indices sorted by start: each segment's words are then found
+        # with two binary searches instead of a scan over every word
+        all_words = getattr(result, "words", None) or []
+        order = sorted(range(len(all_words)), key=lambda i: all_words[i].start)
+        word_starts = [all_words[i].start for i in order]
+        
         segments = []
         for seg in result.segments:
-            words = []
-            if hasattr(result, "words"):
-                seg_words = [w for w in result.words if seg.start <= w.start < seg.end]
-                for w in seg_words:
-                    words.append({
-                        "word": w.word,
-                        "start": w.start,
-                        "end": w.end,
-                        "conf": 1.0
-                    })
+            lo = bisect_left(word_starts, seg.start)
+            hi = bisect_left(word_starts, seg.end)
+            words = [
+                {"word": w.word, "start": w.start, "end": w.end, "conf": 1.0}
+                # Back in API order
+                for w in (all_words[i] for i in sorted(order[lo:hi]))
+            ]
             
             segments.append({
                 "content": seg.text.strip(),
@@ -434,6 +527,42 @@ class ModelManager:
         Returns:
             TranscriptionResult with segments
         """
+        provider = self._get_provider(backend)
+        return provider.transcribe(audio_path, model=model, language=language, **kwargs)
+    
+    def transcribe_stream(
+        self,
+        audio_path: str | Any,
+        out_path: str,
+        backend: Optional[TranscriptionBackend] = None,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        **kwargs
+    ) -> TranscriptionResult:
+        """
+        Transcribe straight to a JSON transcript file.
+        
+        Backends that decode incrementally write each segment as it is
+        produced, so the full segment list is never held in memory.
+        
+        Args:
+            audio_path: Path to audio/video file
+            out_path: Path of the JSON transcript to write
+            backend: Specific backend to use (auto-detect if None)
+            model: Model name for the backend
+            language: Language code
+            **kwargs: Additional arguments for the provider
+            
+        Returns:
+            TranscriptionResult with language and duration but no segments
+        """
+        provider = self._get_provider(backend)
+        return provider.transcribe_stream(
+            audio_path, out_path, model=model, language=language, **kwargs
+        )
+    
+    def _get_provider(self, backend: Optional[TranscriptionBackend]) -> TranscriptionProvider:
+        """Resolve the backend to use and return its provider."""
         target_backend = backend or self._default_backend
         
         if target_backend is None:
@@ -444,7 +573,35 @@ class ModelManager:
             raise RuntimeError(f"Backend {target_backend.value} is not available")
         
         logger.info(f"Transcribing with {target_backend.value}")
-        return provider.transcribe(audio_path, model=model, language=language, **kwargs)
+        return provider
+    
+    def warm_up(
+        self,
+        backend: Optional[TranscriptionBackend] = None,
+        model: Optional[str] = None
+    ) -> bool:
+        """
+        Load a model by transcribing a second of silence.
+
+        Besides loading the weights this compiles the MLX/CUDA kernels, so the
+        first real transcription in this process starts immediately. The
+        OpenAI API backend is skipped since it has nothing local to load.
+
+        Args:
+            backend: Backend to warm up (the default backend if None)
+            model: Model name for the backend (its default if None)
+
+        Returns:
+            True if a model was loaded
+        """
+        backend = backend or self._default_backend
+        if backend is None or backend == TranscriptionBackend.OPENAI_API:
+            return False
+
+        import numpy as np
+        logger.info(f"Warming up {backend.value} transcription model")
+        self._providers[backend].transcribe(np.zeros(16000, dtype=np.float32), model=model)
+        return True
     
     def set_default_backend(self, backend: TranscriptionBackend):
         """Set the default transcription backend."""
@@ -0,0 +1,109 @@
+"""
+VoxGrep Query Cache Module
+
+Provides an in-process LRU cache with TTL expiry for search results, so
+repeated queries from the UI skip query embedding and vector scoring. A
+second, short-lived instance holds video rows read by per-video endpoints.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from ..utils.helpers import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of search results with time-based expiry.
+
+    Entries are evicted least-recently-used first once max_size is reached,
+    and are treated as misses once older than ttl seconds. Callers must clear
+    the cache whenever the underlying index changes.
+    """
+
+    def __init__(self, max_size: int = 2000, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a single entry, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries (hit/miss counters are kept)."""
+        with self._lock:
+            if self._entries:
+                logger.debug(f"Clearing {len(self._entries)} cached entries")
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get hit/miss statistics for the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+# Video rows may be changed by worker processes, which cannot clear this
+# process's cache, so entries only live briefly
+VIDEO_CACHE_TTL = 2.0
+
+# Global cache instances
+_query_cache: Optional[QueryCache] = None
+_video_cache: Optional[QueryCache] = None
+
+
+def get_query_cache() -> QueryCache:
+    """Get or create the global query cache instance."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryCache()
+    return _query_cache
+
+
+def get_video_cache() -> QueryCache:
+    """Get or create the global cache of video rows, keyed by video id."""
+    global _video_cache
+    if _video_cache is None:
+        _video_cache = QueryCache(max_size=1024, ttl=VIDEO_CACHE_TTL)
+    return _video_cache
@@ -9,3 +9,4 @@ from .index import router as index_router
 from .speaker import router as speaker_router
 from .export import router as export_router
 from .system import router as system_router
+from .jobs import router as jobs_router
@@ -2,15 +2,58 @@
 Export Routes
 """
 
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends
 
 from ..dependencies import logger
 from ..models import SearchResult
 from ..transitions import concatenate_with_transitions, TransitionType as TransType
 from ..subtitles import SubtitleStyle, burn_subtitles_on_segments, PRESET_STYLES
+from ..workers import submit_task
 
 router = APIRouter(tags=["export"])
 
+# Presets never change at runtime, so serialize them once
+_PRESET_DICTS = {name: style.to_dict() for name, style in PRESET_STYLES.items()}
+
+def _run_export(
+    composition: list[dict],
+    output: str,
+    transition: str,
+    transition_duration: float,
+    burn_subtitles: bool,
+    subtitle_preset: str
+) -> None:
+    """Worker-process task: render a supercut to output."""
+    try:
+        # Determine transition type
+        trans_type = TransType.CUT
+        if transition == "crossfade":
+            trans_type = TransType.CROSSFADE
+        elif transition == "fade_to_black":
+            trans_type = TransType.FADE_TO_BLACK
+        elif transition == "dissolve":
+            trans_type = TransType.DISSOLVE
+        
+        if burn_subtitles:
+            style = PRESET_STYLES.get(subtitle_preset, SubtitleStyle())
+            burn_subtitles_on_segments(composition, output, style=style)
+        elif trans_type != TransType.CUT:
+            concatenate_with_transitions(
+                composition, output, 
+                transition_type=trans_type,
+                transition_duration=transition_duration
+            )
+        else:
+            # Use default exporter
+            from ...core.exporter import create_supercut
+            create_supercut(composition, output)
+        
+        logger.info(f"Export completed: {output}")
+    except Exception as e:
+        logger.error(f"Background export failed: {e}")
+        raise
+
+
 @router.post("/export")
 def export_supercut(
     matches: list[SearchResult], 
@@ -18,51 +61,21 @@ def export_supercut(
     transition: str = "cut",
     transition_duration: float = 0.5,
     burn_subtitles: bool = False,
-    subtitle_preset: str = "default",
-    background_tasks: BackgroundTasks = None
+    subtitle_preset: str = "default"
 ):
     """
     Exports a supercut from the given search results.
     """
     composition = [m.dict() for m in matches]
     
-    def run_export():
-        try:
-            # Determine transition type
-            trans_type = TransType.CUT
-            if transition == "crossfade":
-                trans_type = TransType.CROSSFADE
-            elif transition == "fade_to_black":
-                trans_type = TransType.FADE_TO_BLACK
-            elif transition == "dissolve":
-                trans_type = TransType.DISSOLVE
-            
-            if burn_subtitles:
-                style = PRESET_STYLES.get(subtitle_preset, SubtitleStyle())
-                burn_subtitles_on_segments(composition, output, style=style)
-            elif trans_type != TransType.CUT:
-                concatenate_with_transitions(
-                    composition, output, 
-                    transition_type=trans_type,
-                    transition_duration=transition_duration
-                )
-            else:
-                # Use default exporter
-                from ...core.exporter import create_supercut
-                create_supercut(composition, output)
-            
-            logger.info(f"Export completed: {output}")
-        except Exception as e:
-            logger.error(f"Background export failed: {e}")
-
-    background_tasks.add_task(run_export)
-    return {"status": "started", "path": output}
+    job = submit_task(
+        _run_export, composition, output, transition,
+        transition_duration, burn_subtitles, subtitle_preset
+    )
+    return {"status": "started", "path": output, "job_id": job.job_id}
 
 
 @router.get("/subtitle-presets")
 def get_subtitle_presets():
     """Get available subtitle style presets."""
-    return {
-        name: style.to_dict() 
-        for name, style in PRESET_STYLES.items()
-    }
+    return _PRESET_DICTS
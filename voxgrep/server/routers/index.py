@@ -2,13 +2,14 @@
 Indexing Routes
 """
 import time
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select, Session as DbSession
 
-from ..dependencies import get_session, get_vector_store, features, logger
+from ..dependencies import get_session, get_vector_store, invalidate_video, features, logger
 from ..models import Video, VectorStats
 from ...core import engine as search_engine
 from ..db import engine
+from ..workers import submit_task
 
 router = APIRouter(prefix="/index", tags=["indexing"])
 
@@ -43,46 +44,76 @@ def index_video(
     video.indexed_at = time.time()
     session.add(video)
     session.commit()
+    invalidate_video(video_id)
     
     return {"status": "indexed", "video_id": video_id, "segments": count}
 
 
+def _run_indexing(video_ids: list[int], force: bool) -> None:
+    """Worker-process task: embed the transcripts of the given videos."""
+    with DbSession(engine) as bg_session:
+        videos = bg_session.exec(select(Video).where(Video.id.in_(video_ids))).all()
+        vector_store = get_vector_store()
+        pending = {}
+        for video in videos:
+            try:
+                if not force and video.is_indexed:
+                    continue
+                
+                transcript = search_engine.parse_transcript(video.path)
+                if transcript:
+                    pending[video.id] = (video, transcript)
+            except Exception as e:
+                logger.error(f"Failed to load transcript for video {video.id}: {e}")
+        
+        # Encode every queued video's segments in one batched pass; videos
+        # that fail are logged and left out of the result
+        try:
+            counts = vector_store.index_videos_bulk(
+                {vid: transcript for vid, (_, transcript) in pending.items()},
+                bg_session,
+                force=force
+            )
+        except Exception as e:
+            logger.error(f"Failed to index videos: {e}")
+            raise
+        
+        now = time.time()
+        for vid, (video, _) in pending.items():
+            if vid not in counts:
+                continue
+            video.is_indexed = True
+            video.indexed_at = now
+            bg_session.add(video)
+        
+        bg_session.commit()
+        logger.info(f"Indexed {len(counts)} of {len(pending)} videos")
+
+
+def _after_indexing() -> None:
+    """Drop state the indexing worker made stale in this process."""
+    get_vector_store().invalidate()
+    invalidate_video()
+
+
 @router.post("/all")
 def index_all_videos(
     force: bool = False,
-    background_tasks: BackgroundTasks = None,
     session: Session = Depends(get_session)
 ):
     """Index all videos in the library for semantic search."""
     if not features.enable_semantic_search:
         raise HTTPException(status_code=400, detail="Semantic search is disabled")
     
-    videos = session.exec(select(Video).where(Video.has_transcript == True)).all()
-    
-    def run_indexing():
-        with DbSession(engine) as bg_session:
-            vector_store = get_vector_store()
-            indexed = 0
-            for video in videos:
-                try:
-                    if not force and video.is_indexed:
-                        continue
-                    
-                    transcript = search_engine.parse_transcript(video.path)
-                    if transcript:
-                        vector_store.index_video(video.id, transcript, bg_session, force=force)
-                        video.is_indexed = True
-                        video.indexed_at = time.time()
-                        bg_session.add(video)
-                        indexed += 1
-                except Exception as e:
-                    logger.error(f"Failed to index video {video.id}: {e}")
-            
-            bg_session.commit()
-            logger.info(f"Indexed {indexed} videos")
+    video_ids = session.exec(select(Video.id).where(Video.has_transcript == True)).all()
     
-    background_tasks.add_task(run_indexing)
-    return {"status": "started", "total_videos": len(videos)}
+    # The worker writes embeddings to the database; this process's
+    # in-memory index must be rebuilt once it is done
+    job = submit_task(
+        _run_indexing, list(video_ids), force,
+        on_done=_after_indexing
+    )
+    return {"status": "started", "total_videos": len(video_ids), "job_id": job.job_id}
 
 
 @router.get("/stats", response_model=VectorStats)
@@ -3,27 +3,156 @@ Ingest Routes (Download and Local Add)
 """
 import os
 import subprocess
-import json
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException
 from sqlmodel import select, Session as DbSession
 
 from ..dependencies import get_model_manager, get_vector_store, config, features, logger
 from ..models import Video
 from ..db import engine
 from ..multi_model import TranscriptionBackend
+from ..workers import submit_task, submit_transcription, submit_transcription_after
+from .library import _scan_path
 from ...modules.youtube import download_video
-from ...core.engine import parse_transcript, find_transcript
+from ...core.engine import parse_transcript, find_transcript, get_transcript_path
+from ...utils import jsonio
+from ...utils.config import MEDIA_EXTENSIONS
+from ...utils.helpers import is_media_file, ensure_directory_exists
 
 router = APIRouter()
 
+def _backend_for_device(device: str) -> TranscriptionBackend | None:
+    """Maps a device option to a transcription backend (None for auto)."""
+    if device == "mlx":
+        return TranscriptionBackend.MLX_WHISPER
+    if device == "cpu":
+        return TranscriptionBackend.FASTER_WHISPER
+    return None
+
+
+def _transcribe_file(
+    filepath: str,
+    transcript_path: str,
+    device: str,
+    compute_type: str | None = None
+) -> list[dict] | None:
+    """
+    Transcribe filepath into transcript_path.
+
+    If the transcript is about to be auto-indexed the segments are needed in
+    memory anyway, so they are kept and saved in one go instead of being
+    streamed to disk and read straight back.
+
+    Returns:
+        The segments when indexing, else None once they have been streamed
+        to disk
+    """
+    model_mgr = get_model_manager()
+    backend = _backend_for_device(device)
+
+    if features.enable_auto_indexing and features.enable_semantic_search:
+        result = model_mgr.transcribe(
+            filepath, backend=backend, compute_type=compute_type
+        )
+        jsonio.dump_file(result.segments, transcript_path)
+        return result.segments
+
+    model_mgr.transcribe_stream(
+        filepath, transcript_path, backend=backend, compute_type=compute_type
+    )
+    return None
+
+
+def _run_download(
+    url: str,
+    target_dir: str,
+    effective_cookies_browser: str | None,
+    effective_cookies_file: str | None
+) -> str | None:
+    """Worker-process task: download a video, returning its path."""
+    try:
+        logger.info(f"Downloading video from {url} to {target_dir}")
+
+        # Use shared module logic (includes subtitle download)
+        filepath = download_video(
+            url,
+            output_template=f"{target_dir}/%(title)s.%(ext)s",
+            quiet=False,
+            cookies_from_browser=effective_cookies_browser,
+            cookies_file=effective_cookies_file
+        )
+        
+        if not os.path.exists(filepath):
+            logger.error(f"Download reported success but file not found at {filepath}")
+            return None
+
+        logger.info(f"Successfully downloaded: {filepath}")
+        return filepath
+    except Exception as e:
+        logger.error(f"Download failed: {e}")
+        raise
+
+
+def _run_transcribe_download(
+    filepath: str,
+    target_dir: str,
+    device: str,
+    compute_type: str | None = None
+) -> None:
+    """Transcription-worker task: transcribe a downloaded video, then index it."""
+    try:
+        # 1. Check if subtitles were downloaded
+        transcript_path = get_transcript_path(filepath)
+        existing_sub = find_transcript(filepath)
+        
+        segments = None
+        
+        if existing_sub:
+            logger.info(f"Found existing subtitle file: {existing_sub}")
+            # Parse existing VTT/SRT into our internal JSON format
+            segments = parse_transcript(filepath)
+            if segments:
+                logger.info("Successfully parsed existing subtitles. Skipping Whisper transcription.")
+        
+        if segments:
+            # 2. Save parsed subtitles to JSON (for uniformity and server cache)
+            jsonio.dump_file(segments, transcript_path)
+        else:
+            # 3. Transcribe if no subtitles found
+            logger.info("No subtitles found. Starting Whisper transcription...")
+            segments = _transcribe_file(
+                filepath, transcript_path, device, compute_type
+            )
+            logger.info(f"Transcript saved to {transcript_path}")
+        
+        # Scan to update DB and index
+        with DbSession(engine) as session:
+            _scan_path(target_dir, session)
+            
+            # Auto-index for semantic search
+            if features.enable_auto_indexing and features.enable_semantic_search:
+                video = session.exec(
+                    select(Video).where(Video.path == filepath)
+                ).first()
+                if video:
+                    if segments is None:
+                        segments = jsonio.load_file(transcript_path)
+                    if segments:
+                        vector_store = get_vector_store()
+                        vector_store.index_video(video.id, segments, session)
+            
+    except Exception as e:
+        logger.error(f"Transcription of download failed: {e}")
+        raise
+
+
 @router.post("/download")
-def download_video_route(
+async def download_video_route(
     url: str,
     output_dir: str | None = None,
     device: str = "auto",
     cookies_from_browser: str | None = None,
     cookies_file: str | None = None,
-    background_tasks: BackgroundTasks = None
+    compute_type: str | None = None
 ):
     """Downloads a video from a URL using yt-dlp and transcribes it.
 
@@ -34,10 +163,9 @@ def download_video_route(
         cookies_from_browser: Browser to extract cookies from (chrome, firefox, safari, edge, brave).
                               Useful for X/Twitter and age-restricted content.
         cookies_file: Path to Netscape-format cookies.txt file
+        compute_type: faster-whisper compute type (e.g. int8, int8_float16,
+                      float16); picked per device when omitted
     """
-    if background_tasks is None:
-        raise HTTPException(status_code=500, detail="BackgroundTasks dependency missing")
-
     target_dir = os.path.abspath(output_dir or config.downloads_dir)
     ensure_directory_exists(target_dir)
 
@@ -45,87 +173,69 @@ def download_video_route(
     effective_cookies_browser = cookies_from_browser or config.download.cookies_from_browser
     effective_cookies_file = cookies_file or config.download.cookies_file
 
-    def run_download_and_transcribe():
-        try:
-            logger.info(f"Downloading video from {url} to {target_dir}")
-
-            # Use shared module logic (includes subtitle download)
-            filepath = download_video(
-                url,
-                output_template=f"{target_dir}/%(title)s.%(ext)s",
-                quiet=False,
-                cookies_from_browser=effective_cookies_browser,
-                cookies_file=effective_cookies_file
-            )
-            
-            if not os.path.exists(filepath):
-                logger.error(f"Download reported success but file not found at {filepath}")
-                return
+    # Downloads run in the worker pool so they proceed in parallel, while
+    # transcriptions queue for the single transcription worker
+    download = submit_task(
+        _run_download, url, target_dir,
+        effective_cookies_browser, effective_cookies_file
+    )
+    job = submit_transcription_after(
+        download, _run_transcribe_download, target_dir, device, compute_type,
+        on_done=get_vector_store().invalidate
+    )
+    return {"status": "started", "url": url, "job_id": job.job_id}
 
-            logger.info(f"Successfully downloaded: {filepath}")
 
-            # 1. Check if subtitles were downloaded
-            transcript_path = os.path.splitext(filepath)[0] + ".json"
-            existing_sub = find_transcript(filepath)
-            
-            segments = None
-            
-            if existing_sub:
-                logger.info(f"Found existing subtitle file: {existing_sub}")
-                # Parse existing VTT/SRT into our internal JSON format
-                segments = parse_transcript(filepath)
-                if segments:
-                    logger.info("Successfully parsed existing subtitles. Skipping Whisper transcription.")
+def _run_transcribe_and_index(
+    abs_filepath: str,
+    device: str,
+    compute_type: str | None = None
+) -> None:
+    """Worker-process task: transcribe a local file, then add and index it."""
+    try:
+        logger.info(f"Processing local file: {abs_filepath}")
+        
+        # Check if already transcribed
+        transcript_path = get_transcript_path(abs_filepath)
+        
+        segments = None
+        if not os.path.exists(transcript_path):
+            segments = _transcribe_file(
+                abs_filepath, transcript_path, device, compute_type
+            )
+            logger.info(f"Transcription saved: {transcript_path}")
+        
+        # Add to database
+        with DbSession(engine) as session:
+            # Scan the parent directory to add the file
+            parent_dir = os.path.dirname(abs_filepath)
+            _scan_path(parent_dir, session)
             
-            # 2. Transcribe if no subtitles found
-            if not segments:
-                logger.info("No subtitles found. Starting Whisper transcription...")
-                model_mgr = get_model_manager()
-                backend = None
-                if device == "mlx":
-                    backend = TranscriptionBackend.MLX_WHISPER
-                elif device == "cpu":
-                    backend = TranscriptionBackend.FASTER_WHISPER
-                
-                trans_result = model_mgr.transcribe(filepath, backend=backend)
-                segments = trans_result.segments
-
-            # 3. Save transcript to JSON (for uniformity and server cache)
-            if segments:
-                with open(transcript_path, "w", encoding="utf-8") as f:
-                    json.dump(segments, f)
-                logger.info(f"Transcript saved to {transcript_path}")
+            # Auto-index for semantic search
+            if features.enable_auto_indexing and features.enable_semantic_search:
+                video = session.exec(
+                    select(Video).where(Video.path == abs_filepath)
+                ).first()
+                if video:
+                    # Only an existing transcript needs loading for indexing
+                    if segments is None:
+                        segments = jsonio.load_file(transcript_path)
+                    vector_store = get_vector_store()
+                    vector_store.index_video(video.id, segments, session)
             
-            # Scan to update DB and index
-            with DbSession(engine) as session:
-                _scan_path(target_dir, session)
-                
-                # Auto-index for semantic search
-                if features.enable_auto_indexing and features.enable_semantic_search and segments:
-                    video = session.exec(
-                        select(Video).where(Video.path == filepath)
-                    ).first()
-                    if video:
-                        vector_store = get_vector_store()
-                        vector_store.index_video(video.id, segments, session)
-                
-        except Exception as e:
-            logger.error(f"Download or transcription failed: {e}")
-
-    background_tasks.add_task(run_download_and_transcribe)
-    return {"status": "started", "url": url}
+        logger.info(f"Successfully processed local file: {abs_filepath}")
+    except Exception as e:
+        logger.error(f"Local file processing failed: {e}")
+        raise
 
 
 @router.post("/add-local")
-def add_local_file(
+async def add_local_file(
     filepath: str,
     device: str = "auto",
-    background_tasks: BackgroundTasks = None
+    compute_type: str | None = None
 ):
     """Adds a local video file to the library and transcribes it."""
-    if background_tasks is None:
-        raise HTTPException(status_code=500, detail="BackgroundTasks dependency missing")
-
     abs_filepath = os.path.abspath(filepath)
     
     # Validate file exists
@@ -133,67 +243,14 @@ def add_local_file(
         raise HTTPException(status_code=404, detail="File not found")
     
     # Validate it's a media file
-    ext = os.path.splitext(abs_filepath)[1].lower()
-    if ext not in MEDIA_EXTENSIONS:
+    if not is_media_file(abs_filepath):
         raise HTTPException(
             status_code=400, 
             detail=f"Invalid file type. Supported: {', '.join(MEDIA_EXTENSIONS)}"
         )
     
-    def run_transcribe_and_index():
-        try:
-            logger.info(f"Processing local file: {abs_filepath}")
-            
-            # Check if already transcribed
-            transcript_path = os.path.splitext(abs_filepath)[0] + ".json"
-            needs_transcription = not os.path.exists(transcript_path)
-            
-            if needs_transcription:
-                # Transcribe using model manager
-                model_mgr = get_model_manager()
-                backend = None
-                if device == "mlx":
-                    backend = TranscriptionBackend.MLX_WHISPER
-                elif device == "cpu":
-                    backend = TranscriptionBackend.FASTER_WHISPER
-                
-                trans_result = model_mgr.transcribe(abs_filepath, backend=backend)
-                
-                # Save transcript
-                with open(transcript_path, "w", encoding="utf-8") as f:
-                    json.dump(trans_result.segments, f)
-                
-                logger.info(f"Transcription saved: {transcript_path}")
-            
-            # Add to database
-            with DbSession(engine) as session:
-                # Scan the parent directory to add the file
-                parent_dir = os.path.dirname(abs_filepath)
-                _scan_path(parent_dir, session)
-                
-                # Auto-index for semantic search
-                if features.enable_auto_indexing and features.enable_semantic_search:
-                    video = session.exec(
-                        select(Video).where(Video.path == abs_filepath)
-                    ).first()
-                    if video and not needs_transcription:
-                        # Load existing transcript for indexing
-                        with open(transcript_path, "r", encoding="utf-8") as f:
-                            segments = json.load(f)
-                        vector_store = get_vector_store()
-                        vector_store.index_video(video.id, segments, session)
-                    elif video and needs_transcription:
-                        # Use the fresh transcription
-                        # Note: trans_result is local to the if block above. 
-                        # I must ensure it's available here or re-read it.
-                        # Wait, if needs_transcription is True, trans_result is defined.
-                        # Python scoping allows it.
-                        vector_store = get_vector_store()
-                        vector_store.index_video(video.id, trans_result.segments, session)
-                
-            logger.info(f"Successfully processed local file: {abs_filepath}")
-        except Exception as e:
-            logger.error(f"Local file processing failed: {e}")
-    
-    background_tasks.add_task(run_transcribe_and_index)
-    return {"status": "started", "filepath": abs_filepath}
+    job = submit_transcription(
+        _run_transcribe_and_index, abs_filepath, device, compute_type,
+        on_done=get_vector_store().invalidate
+    )
+    return {"status": "started", "filepath": abs_filepath, "job_id": job.job_id}
@@ -0,0 +1,16 @@
+"""
+Background Job Routes
+"""
+from fastapi import APIRouter, HTTPException
+
+from ..workers import get_job_status
+
+router = APIRouter(tags=["jobs"])
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Get the status of a background job started by another endpoint."""
+    status = get_job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status
@@ -2,17 +2,67 @@
 Library Management Routes
 """
 import os
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select, insert
 
-from ..dependencies import get_session, get_vector_store, config, logger
+from ..dependencies import (
+    get_session, get_vector_store, get_video_snapshot, invalidate_video, config, logger
+)
 from ..models import Video
 from ...core import engine as search_engine
-from ...utils.config import MEDIA_EXTENSIONS
+from ...utils import jsonio
+from ...utils.helpers import is_media_file
 from ..db import engine
 
 router = APIRouter(prefix="/library", tags=["library"])
 
+# Directory listings and stats are I/O-bound, so scan with threads
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Rows fetched per round trip when streaming the library
+_STREAM_BATCH = 1000
+
+
+def _scan_dir(root: str, existing_paths: set) -> tuple[list[str], list[dict]]:
+    """Lists one directory, returning its subdirectories and new video rows."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.error(f"Error accessing {root}: {e}")
+        return [], []
+
+    subdirs = []
+    rows = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+            continue
+        if is_media_file(entry.name):
+            full_path = entry.path
+            if full_path in existing_paths:
+                continue
+            try:
+                stats = entry.stat()
+                # The listing doubles as the transcript lookup table
+                transcript_path = search_engine.find_transcript(full_path, dir_listing=entries)
+                rows.append({
+                    "path": full_path,
+                    "filename": entry.name,
+                    "size_bytes": stats.st_size,
+                    "created_at": stats.st_mtime,
+                    "has_transcript": transcript_path is not None,
+                    "transcript_path": transcript_path
+                })
+            except OSError as e:
+                logger.error(f"Error accessing {full_path}: {e}")
+    return subdirs, rows
+
+
 # Helper function (internal)
 def _scan_path(path: str, session: Session) -> int:
     """Scans a path for media files and adds them to the database using absolute paths."""
@@ -20,46 +70,71 @@ def _scan_path(path: str, session: Session) -> int:
     if not os.path.exists(abs_target_path):
         os.makedirs(abs_target_path, exist_ok=True)
         
-    count = 0
-    for root, _, files in os.walk(abs_target_path):
-        for file in files:
-            ext = os.path.splitext(file)[1].lower()
-            if ext in MEDIA_EXTENSIONS:
-                full_path = os.path.join(root, file)
-                existing = session.exec(select(Video).where(Video.path == full_path)).first()
-                if not existing:
-                    try:
-                        stats = os.stat(full_path)
-                        transcript_path = search_engine.find_transcript(full_path)
-                        video = Video(
-                            path=full_path,
-                            filename=file,
-                            size_bytes=stats.st_size,
-                            created_at=stats.st_mtime,
-                            has_transcript=transcript_path is not None,
-                            transcript_path=transcript_path
-                        )
-                        session.add(video)
-                        count += 1
-                        logger.info(f"Added to library: {file}")
-                    except OSError as e:
-                        logger.error(f"Error accessing {full_path}: {e}")
-                        
-    session.commit()
-    return count
+    # Load every known path once instead of issuing a SELECT per file
+    existing_paths = set(session.exec(select(Video.path)).all())
+
+    # List each level of the tree concurrently, one directory per task
+    scanned = {}
+    level = [abs_target_path]
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        while level:
+            results = pool.map(partial(_scan_dir, existing_paths=existing_paths), level)
+            scanned.update(zip(level, results))
+            level = [sub for root in level for sub in scanned[root][0]]
+
+    # Assemble rows in top-down walk order so ids follow the directory tree
+    new_rows = []
+    pending = [abs_target_path]
+    while pending:
+        subdirs, rows = scanned[pending.pop()]
+        for row in rows:
+            logger.info(f"Added to library: {row['filename']}")
+        new_rows.extend(rows)
+        pending.extend(reversed(subdirs))
+
+    if new_rows:
+        session.exec(insert(Video), params=new_rows)
+        session.commit()
+    return len(new_rows)
 
 
 @router.get("", response_model=list[Video])
-def get_library(session: Session = Depends(get_session)):
-    """Returns a list of all videos in the library."""
-    videos = session.exec(select(Video)).all()
-    return videos
+def get_library(
+    limit: int | None = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    session: Session = Depends(get_session)
+):
+    """Returns videos in the library, optionally one page at a time.
+
+    Args:
+        limit: Maximum number of videos to return (all when omitted)
+        offset: Number of videos to skip, in id order
+    """
+    statement = select(Video).order_by(Video.id).offset(offset)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return session.exec(statement).all()
+
+
+def _stream_videos() -> Iterator[bytes]:
+    """Yields every video as one NDJSON line, fetching rows in batches."""
+    # The session lives as long as the response body, not the request handler
+    with Session(engine) as session:
+        statement = select(Video).order_by(Video.id).execution_options(yield_per=_STREAM_BATCH)
+        for video in session.exec(statement):
+            yield jsonio.dumps(video.model_dump()) + b"\n"
+
+
+@router.get("/stream")
+def stream_library():
+    """Streams the whole library as newline-delimited JSON, one video per line."""
+    return StreamingResponse(_stream_videos(), media_type="application/x-ndjson")
 
 
 @router.get("/{video_id}", response_model=Video)
 def get_video(video_id: int, session: Session = Depends(get_session)):
     """Get a specific video by ID."""
-    video = session.get(Video, video_id)
+    video = get_video_snapshot(video_id, session)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     return video
@@ -86,4 +161,5 @@ def delete_video(video_id: int, session: Session = Depends(get_session)):
     
     session.delete(video)
     session.commit()
+    invalidate_video(video_id)
     return {"status": "deleted", "video_id": video_id}
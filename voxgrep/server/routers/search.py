@@ -6,10 +6,11 @@ import os
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
-from ..dependencies import get_session, get_vector_store, features, logger
+from ..dependencies import get_session, get_vector_store, get_query_cache, features, logger
 from ..models import SearchResult, Video
 from ...core import engine as search_engine
-from ...utils.config import MEDIA_EXTENSIONS, DEFAULT_SEARCH_TYPE
+from ...utils.config import DEFAULT_SEARCH_TYPE
+from ...utils.helpers import is_media_file
 
 router = APIRouter(tags=["search"])
 
@@ -57,11 +58,22 @@ def search(
         
         # 1. Semantic Search (Vector Store)
         if type == "semantic" and features.enable_semantic_search:
-            vector_store = get_vector_store()
-            start_time = os.times()
-            semantic_results = vector_store.search(
-                query, session, threshold=threshold, video_ids=target_video_ids
+            # Repeated queries are served from the result cache, which the
+            # vector store clears whenever the index changes. The key holds
+            # exactly what the search sees (it only strips the query), since
+            # e.g. differently cased queries embed differently
+            cache = get_query_cache()
+            cache_key = (
+                query.strip(), type, threshold,
+                tuple(sorted(target_video_ids or ()))
             )
+            semantic_results = cache.get(cache_key)
+            if semantic_results is None:
+                vector_store = get_vector_store()
+                semantic_results = vector_store.search(
+                    query, session, threshold=threshold, video_ids=target_video_ids
+                )
+                cache.put(cache_key, semantic_results)
             return [SearchResult(**r) for r in semantic_results]
         
         # 2. Optimized Database Search (for Sentence Search)
@@ -133,6 +145,39 @@ def search(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/search/cache/stats")
+def get_search_cache_stats():
+    """Returns hit/miss statistics for the semantic search result cache."""
+    return get_query_cache().stats()
+
+
+def _iter_media_files(root: str):
+    """
+    Yields (path, directory listing) for media files under root, top-down.
+
+    Uses scandir entries directly so classifying files needs no extra stat
+    calls, and hands each listing on for transcript lookup.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.error(f"Error accessing {directory}: {e}")
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif is_media_file(entry.name):
+                yield entry.path, entries
+        # Reversed so subdirectories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+
 @router.get("/ngrams")
 def get_ngrams(path: str, n: int = 1):
     """Returns n-grams for indexed videos in the given path."""
@@ -140,13 +185,9 @@ def get_ngrams(path: str, n: int = 1):
     
     abs_path = os.path.abspath(path)
     if os.path.isdir(abs_path):
-        for root, _, files in os.walk(abs_path):
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in MEDIA_EXTENSIONS:
-                    full_path = os.path.join(root, file)
-                    if search_engine.find_transcript(full_path):
-                        files_to_search.append(full_path)
+        for full_path, listing in _iter_media_files(abs_path):
+            if search_engine.find_transcript(full_path, dir_listing=listing):
+                files_to_search.append(full_path)
     else:
         if search_engine.find_transcript(abs_path):
             files_to_search = [abs_path]
@@ -155,9 +196,7 @@ def get_ngrams(path: str, n: int = 1):
         return []
 
     try:
-        from collections import Counter
-        grams = search_engine.get_ngrams(files_to_search, n)
-        most_common = Counter(grams).most_common(100)
+        most_common = search_engine.count_ngrams(files_to_search, n).most_common(100)
         
         results = []
         for ngram, count in most_common:
@@ -2,71 +2,76 @@
 Speaker Diarization Routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlmodel import Session, select, Session as DbSession
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session, select, insert, Session as DbSession
 
-from ..dependencies import get_session, features, logger
+from ..dependencies import get_session, get_video_snapshot, invalidate_video, features, logger
 from ..models import Video, Speaker
 from ..db import engine
+from ..workers import submit_task
 
 router = APIRouter(tags=["speakers"])
 
+def _run_diarization(
+    video_id: int,
+    video_path: str,
+    num_speakers: int | None,
+    force: bool
+) -> None:
+    """Worker-process task: diarize a video and store its speakers."""
+    try:
+        from ..diarization import diarize_cached, summarize_speakers
+        
+        segments = diarize_cached(video_path, num_speakers=num_speakers, force=force)
+        
+        # Update database
+        with DbSession(engine) as bg_session:
+            vid = bg_session.get(Video, video_id)
+            vid.has_diarization = True
+            bg_session.add(vid)
+            
+            # Store speakers with one executemany INSERT
+            rows = [
+                {
+                    "video_id": video_id,
+                    "speaker_label": speaker_id,
+                    "total_duration": duration,
+                    "segment_count": count
+                }
+                for speaker_id, duration, count in summarize_speakers(segments)
+            ]
+            if rows:
+                bg_session.exec(insert(Speaker), params=rows)
+            
+            bg_session.commit()
+        
+        logger.info(f"Diarization completed for video {video_id}")
+    except Exception as e:
+        logger.error(f"Diarization failed: {e}")
+        raise
+
+
 @router.post("/diarize/{video_id}")
 def diarize_video(
     video_id: int,
     num_speakers: int | None = None,
     force: bool = False,
-    background_tasks: BackgroundTasks = None,
     session: Session = Depends(get_session)
 ):
     """Run speaker diarization on a video."""
     if not features.enable_speaker_diarization:
         raise HTTPException(status_code=400, detail="Speaker diarization is disabled")
     
-    video = session.get(Video, video_id)
+    video = get_video_snapshot(video_id, session)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
-    def run_diarization():
-        try:
-            from ..diarization import diarize_cached
-            
-            segments = diarize_cached(video.path, num_speakers=num_speakers, force=force)
-            
-            # Update database
-            with DbSession(engine) as bg_session:
-                vid = bg_session.get(Video, video_id)
-                vid.has_diarization = True
-                bg_session.add(vid)
-                
-                # Store speakers
-                speaker_map = {}
-                for seg in segments:
-                    if seg.speaker_id not in speaker_map:
-                        speaker_map[seg.speaker_id] = {
-                            "duration": 0,
-                            "count": 0
-                        }
-                    speaker_map[seg.speaker_id]["duration"] += seg.end - seg.start
-                    speaker_map[seg.speaker_id]["count"] += 1
-                
-                for speaker_id, stats in speaker_map.items():
-                    speaker = Speaker(
-                        video_id=video_id,
-                        speaker_label=speaker_id,
-                        total_duration=stats["duration"],
-                        segment_count=stats["count"]
-                    )
-                    bg_session.add(speaker)
-                
-                bg_session.commit()
-            
-            logger.info(f"Diarization completed for video {video_id}")
-        except Exception as e:
-            logger.error(f"Diarization failed: {e}")
-    
-    background_tasks.add_task(run_diarization)
-    return {"status": "started", "video_id": video_id}
+    job = submit_task(
+        _run_diarization, video_id, video.path, num_speakers, force,
+        on_done=partial(invalidate_video, video_id)
+    )
+    return {"status": "started", "video_id": video_id, "job_id": job.job_id}
 
 
 @router.get("/speakers/{video_id}", response_model=list[Speaker])
@@ -4,17 +4,28 @@ System, Health, and Configuration Routes
 import sys
 import os
 import subprocess
+from functools import partial
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 
 from sqlmodel import Session
 
-from ..dependencies import get_session, get_model_manager, config, features, logger
+from ..dependencies import (
+    get_session, get_model_manager, get_video_snapshot, invalidate_video, config, features, logger
+)
 from ..models import Video
 from ..multi_model import TranscriptionBackend
+from ..query_cache import QueryCache
+from ..workers import submit_transcription
+from ...core.engine import get_transcript_path
 
 router = APIRouter(tags=["system"])
 
+# Model availability only changes when packages or API keys do, so the
+# provider import checks behind /models are rerun at most once a minute
+MODELS_CACHE_TTL = 60
+_models_cache = QueryCache(max_size=1, ttl=MODELS_CACHE_TTL)
+
 @router.get("/health")
 def health_check():
     """Health check endpoint."""
@@ -51,8 +62,12 @@ def open_folder(path: str):
 @router.get("/models")
 def get_available_models():
     """Get list of available transcription models."""
+    cached = _models_cache.get("models")
+    if cached is not None:
+        return cached
+    
     model_mgr = get_model_manager()
-    return {
+    result = {
         "models": [
             {
                 "name": m.name,
@@ -66,6 +81,53 @@ def get_available_models():
         ],
         "backends": model_mgr.get_available_backends()
     }
+    _models_cache.put("models", result)
+    return result
+
+def _run_transcription(
+    video_id: int,
+    video_path: str,
+    model: str | None,
+    backend: str | None,
+    language: str | None
+) -> None:
+    """Worker-process task: transcribe a video and record the transcript."""
+    try:
+        model_mgr = get_model_manager()
+        
+        backend_enum = None
+        if backend:
+            try:
+                backend_enum = TranscriptionBackend(backend)
+            except ValueError:
+                logger.warning(f"Unknown backend: {backend}")
+        
+        # Segments are written to the transcript as they are decoded
+        transcript_path = get_transcript_path(video_path)
+        model_mgr.transcribe_stream(
+            video_path,
+            transcript_path,
+            backend=backend_enum,
+            model=model,
+            language=language
+        )
+        
+        # Update database
+        from ..db import engine
+        from sqlmodel import Session as DbSession
+        
+        with DbSession(engine) as bg_session:
+            vid = bg_session.get(Video, video_id)
+            vid.has_transcript = True
+            vid.transcript_path = transcript_path
+            bg_session.add(vid)
+            bg_session.commit()
+        
+        logger.info(f"Transcription completed for video {video_id}")
+    except Exception as e:
+        logger.error(f"Transcription failed: {e}")
+        raise
+
 
 @router.post("/transcribe/{video_id}")
 def transcribe_video(
@@ -74,55 +136,18 @@ def transcribe_video(
     backend: str | None = None,
     language: str | None = None,
     force: bool = False,
-    background_tasks: BackgroundTasks = None,
     session: Session = Depends(get_session)
 ):
     """Transcribe a video using the specified model and backend."""
-    video = session.get(Video, video_id)
+    video = get_video_snapshot(video_id, session)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
     if video.has_transcript and not force:
         return {"status": "already_transcribed", "video_id": video_id}
     
-    def run_transcription():
-        try:
-            model_mgr = get_model_manager()
-            
-            backend_enum = None
-            if backend:
-                try:
-                    backend_enum = TranscriptionBackend(backend)
-                except ValueError:
-                    logger.warning(f"Unknown backend: {backend}")
-            
-            result = model_mgr.transcribe(
-                video.path,
-                backend=backend_enum,
-                model=model,
-                language=language
-            )
-            
-            # Save transcript
-            import json
-            transcript_path = os.path.splitext(video.path)[0] + ".json"
-            with open(transcript_path, "w", encoding="utf-8") as f:
-                json.dump(result.segments, f)
-            
-            # Update database
-            from ..db import engine
-            from sqlmodel import Session as DbSession
-            
-            with DbSession(engine) as bg_session:
-                vid = bg_session.get(Video, video_id)
-                vid.has_transcript = True
-                vid.transcript_path = transcript_path
-                bg_session.add(vid)
-                bg_session.commit()
-            
-            logger.info(f"Transcription completed for video {video_id}")
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-    
-    background_tasks.add_task(run_transcription)
-    return {"status": "started", "video_id": video_id}
+    job = submit_transcription(
+        _run_transcription, video_id, video.path, model, backend, language,
+        on_done=partial(invalidate_video, video_id)
+    )
+    return {"status": "started", "video_id": video_id, "job_id": job.job_id}
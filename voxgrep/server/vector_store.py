@@ -6,17 +6,21 @@ Uses sqlite-vss or falls back to in-memory numpy for vector operations.
 """
 import os
 import json
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 from typing import List, Optional, Tuple, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, delete, insert, func
 
-from ..utils.config import get_cache_dir, DEFAULT_SEMANTIC_MODEL
+from ..utils.config import get_cache_dir, DEFAULT_SEMANTIC_MODEL, FeatureFlags
 from ..utils.helpers import setup_logger
 from .db import engine
 from .models import Video, Embedding
+from .query_cache import get_query_cache
 
 logger = setup_logger(__name__)
 
@@ -27,14 +31,47 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+# Try to import hnswlib for approximate nearest neighbour search
+try:
+    import hnswlib
+    HNSW_AVAILABLE = True
+except ImportError:
+    HNSW_AVAILABLE = False
+
+# Below this many vectors a brute-force scan is as fast as an HNSW query
+ANN_MIN_VECTORS = 20000
+
+# int8 rows are dequantized in blocks of this many rows for scoring
+INT8_SCORE_BLOCK = 8192
+
+# Segments per embedding model forward pass when indexing
+EMBED_BATCH_SIZE = int(os.getenv("VOXGREP_EMBED_BATCH", "128"))
+
+# Segments encoded and inserted per step of a bulk index, bounding the
+# embeddings held in memory when indexing a whole library
+INDEX_FLUSH_ROWS = 8192
+
+
+def _decode_embedding(blob: bytes, dim: int) -> np.ndarray:
+    """Read an embedding_blob, stored as float32 or (opt-in) float16."""
+    return np.frombuffer(blob, dtype=np.float16 if len(blob) == 2 * dim else np.float32)
+
+
+def _segment_row(video_id: int, index: int, segment: dict) -> tuple:
+    """Validate a transcript segment into a (video, index, text, start, end) row."""
+    content = segment.get("content", "")
+    if not isinstance(content, str):
+        raise TypeError(f"segment {index} content is {type(content).__name__}, not text")
+    return video_id, index, content, float(segment.get("start", 0)), float(segment.get("end", 0))
+
 
 class EmbeddingModel:
     """Singleton for the sentence transformer model used for embeddings."""
-    _instance: Optional[SentenceTransformer] = None
+    _instance: Optional["SentenceTransformer"] = None
     _model_name: str = DEFAULT_SEMANTIC_MODEL
     
     @classmethod
-    def get_instance(cls, model_name: Optional[str] = None) -> SentenceTransformer:
+    def get_instance(cls, model_name: Optional[str] = None) -> "SentenceTransformer":
         """Get or create the embedding model instance."""
         if not TRANSFORMERS_AVAILABLE:
             raise RuntimeError("sentence-transformers is not installed")
@@ -53,6 +90,125 @@ class EmbeddingModel:
         return model.get_sentence_embedding_dimension()
 
 
+@lru_cache(maxsize=4096)
+def _encode_query(model_name: str, query: str) -> np.ndarray:
+    """
+    Encode and L2-normalize a search query, memoized per model.
+
+    Result caching is keyed on filters and threshold as well, so this layer
+    lets those variations reuse the vector instead of rerunning the model.
+    """
+    model = EmbeddingModel.get_instance(model_name)
+    embedding = model.encode([query], show_progress_bar=False)[0]
+    embedding = embedding / np.linalg.norm(embedding)
+    embedding.setflags(write=False)
+    return embedding
+
+
+@dataclass(frozen=True)
+class _IndexState:
+    """
+    One immutable generation of the in-memory index.
+
+    Rebuilds create a new state and publish it in a single assignment, so a
+    search that took a reference keeps consistent arrays and HNSW labels
+    even if another thread rebuilds meanwhile.
+    """
+    # Row-aligned arrays: normalized vectors, Embedding ids and video ids
+    embeddings: np.ndarray
+    row_ids: np.ndarray
+    row_video_ids: np.ndarray
+    # Rows grouped by video: video_rows[video_starts[i]:video_starts[i + 1]]
+    # are the rows of video video_keys[i]
+    video_keys: np.ndarray
+    video_starts: np.ndarray
+    video_rows: np.ndarray
+    ann_index: Any = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        embeddings: np.ndarray,
+        row_ids: np.ndarray,
+        row_video_ids: np.ndarray,
+        ann_index: Any = None
+    ) -> "_IndexState":
+        """Build a state, grouping rows by video for filtered searches."""
+        video_rows = np.argsort(row_video_ids, kind="stable")
+        video_keys, video_starts = np.unique(row_video_ids[video_rows], return_index=True)
+        return cls(
+            embeddings, row_ids, row_video_ids,
+            video_keys, np.append(video_starts, len(video_rows)), video_rows,
+            ann_index
+        )
+
+    def rows_for_videos(self, video_ids: List[int]) -> np.ndarray:
+        """Row indices of the given videos, in ascending row order."""
+        wanted = np.unique(np.asarray(video_ids, dtype=np.int64))
+        pos = np.searchsorted(self.video_keys, wanted)
+        pos = pos[pos < len(self.video_keys)]
+        pos = pos[np.isin(self.video_keys[pos], wanted)]
+        if len(pos) == 0:
+            return np.empty(0, dtype=np.int64)
+        rows = np.concatenate([
+            self.video_rows[self.video_starts[p]:self.video_starts[p + 1]] for p in pos
+        ])
+        rows.sort()
+        return rows
+
+    def score_rows(
+        self,
+        query_norm: np.ndarray,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Cosine similarity of the query against the given rows (default all)."""
+        matrix = self.embeddings
+        if matrix.dtype != np.int8:
+            # Rows are pre-normalized, so one matrix-vector product suffices
+            return np.dot(matrix if rows is None else matrix[rows], query_norm)
+
+        # numpy has no BLAS path for integer products, so widen a block at a
+        # time into a reusable float32 buffer and score it with sgemv
+        count = len(matrix) if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        block = np.empty((min(INT8_SCORE_BLOCK, count), matrix.shape[1]), dtype=np.float32)
+        query = np.asarray(query_norm, dtype=np.float32) / 127
+        for start in range(0, count, INT8_SCORE_BLOCK):
+            stop = start + INT8_SCORE_BLOCK
+            chunk = matrix[start:stop] if rows is None else matrix[rows[start:stop]]
+            buf = block[:len(chunk)]
+            buf[...] = chunk
+            np.dot(buf, query, out=scores[start:start + len(chunk)])
+        return scores
+
+    def ann_candidates(
+        self,
+        query_norm: np.ndarray,
+        limit: int,
+        allowed: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (row indices, cosine scores) of the approximate top matches.
+
+        Args:
+            query_norm: Normalized query vector
+            limit: Number of results the caller needs
+            allowed: Optional boolean row mask; other rows are skipped
+                during graph traversal rather than filtered afterwards
+        """
+        count = len(self.embeddings) if allowed is None else int(allowed.sum())
+        k = min(count, max(limit * 4, 64))
+        self.ann_index.set_ef(max(2 * k, 256))
+        if allowed is None:
+            labels, distances = self.ann_index.knn_query(query_norm, k=k)
+        else:
+            labels, distances = self.ann_index.knn_query(
+                query_norm, k=k, filter=lambda label: allowed[label]
+            )
+        # hnswlib's "ip" space reports 1 - dot product as the distance
+        return labels[0].astype(np.int64), 1.0 - distances[0]
+
+
 class VectorStore:
     """
     Vector store for semantic search across the VoxGrep library.
@@ -62,11 +218,27 @@ class VectorStore:
     specialized vector databases like sqlite-vss or LanceDB.
     """
     
-    def __init__(self):
+    def __init__(self, quantize: bool = False, half_precision: bool = False):
+        """
+        Args:
+            quantize: Keep the in-memory matrix as int8 (scaled by 127)
+                instead of float32, a quarter of the memory and snapshot size
+            half_precision: Store new embedding blobs as float16 instead of
+                float32, halving their size at a small precision cost
+        """
+        self.quantize = quantize
+        self._blob_dtype = np.float16 if half_precision else np.float32
         self._embedding_cache: Dict[int, np.ndarray] = {}
+        # Current index; None until built or while the library is empty
+        self._state: Optional[_IndexState] = None
         self._index_dirty = True
-        self._combined_embeddings: Optional[np.ndarray] = None
-        self._embedding_video_map: List[Tuple[int, int, dict]] = []  # (video_id, segment_idx, segment_data)
+        # Bumped by every invalidate(), so a rebuild that raced with one
+        # leaves the index flagged dirty
+        self._generation = 0
+        self._flag_lock = threading.Lock()
+        self._snapshot_dir = get_cache_dir() / "vector_index"
+        # Serializes rebuilds, and with them writes to the snapshot files
+        self._rebuild_lock = threading.Lock()
     
     def index_video(
         self, 
@@ -87,88 +259,303 @@ class VectorStore:
         Returns:
             Number of embeddings created
         """
+        counts = self.index_videos_bulk(
+            {video_id: transcript}, session, force=force, skip_errors=False
+        )
+        return counts.get(video_id, 0)
+
+    def index_videos_bulk(
+        self,
+        video_segments: Dict[int, List[dict]],
+        session: Session,
+        force: bool = False,
+        batch_size: int = EMBED_BATCH_SIZE,
+        skip_errors: bool = True
+    ) -> Dict[int, int]:
+        """
+        Generate and store embeddings for several videos with one encode call.
+
+        Segments from every video are flattened into a single list so the
+        model runs on full batches instead of one short batch per video.
+        They are encoded and inserted INDEX_FLUSH_ROWS at a time within a
+        single transaction.
+
+        Args:
+            video_segments: Mapping of video ID to its transcript segments
+            session: Database session
+            force: If True, regenerate embeddings even if they exist
+            batch_size: Number of segments per model forward pass
+            skip_errors: If True, a video whose segments cannot be embedded
+                is logged and left out instead of aborting the whole batch
+
+        Returns:
+            Mapping of video ID to number of embeddings created (0 for videos
+            already indexed or without segments). Videos that failed are
+            left out.
+        """
         if not TRANSFORMERS_AVAILABLE:
             logger.warning("Cannot index video: sentence-transformers not available")
-            return 0
-        
-        # Check if already indexed
-        if not force:
-            existing = session.exec(
-                select(Embedding).where(Embedding.video_id == video_id)
-            ).first()
-            if existing:
-                logger.debug(f"Video {video_id} already indexed, skipping")
-                return 0
-        else:
-            # Delete existing embeddings for this video
-            existing_embeddings = session.exec(
-                select(Embedding).where(Embedding.video_id == video_id)
-            ).all()
-            for emb in existing_embeddings:
-                session.delete(emb)
+            return {}
+
+        video_ids = list(video_segments)
+        if not video_ids:
+            return {}
+
+        counts: Dict[int, int] = {}
+        if force:
+            # Delete existing embeddings for these videos
+            session.exec(delete(Embedding).where(Embedding.video_id.in_(video_ids)))
             session.commit()
-        
-        # Generate embeddings
+            self.invalidate()
+        else:
+            # Skip videos that are already indexed
+            indexed = set(session.exec(
+                select(Embedding.video_id)
+                .where(Embedding.video_id.in_(video_ids))
+                .distinct()
+            ).all())
+            for video_id in indexed:
+                logger.debug(f"Video {video_id} already indexed, skipping")
+                counts[video_id] = 0
+            video_ids = [v for v in video_ids if v not in indexed]
+
+        failed: Dict[int, Exception] = {}
+        rows = []
+        for video_id in video_ids:
+            try:
+                rows.extend([
+                    _segment_row(video_id, i, segment)
+                    for i, segment in enumerate(video_segments[video_id] or ())
+                ])
+                counts[video_id] = 0
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                failed[video_id] = e
+                logger.error(f"Failed to index video {video_id}: {e}")
+        if not rows:
+            return counts
+
         model = EmbeddingModel.get_instance()
-        texts = [seg.get("content", "") for seg in transcript]
-        
-        if not texts:
-            return 0
-        
-        logger.info(f"Generating {len(texts)} embeddings for video {video_id}")
-        embeddings = model.encode(texts, show_progress_bar=False)
-        
-        # Store in database
-        for i, (segment, embedding) in enumerate(zip(transcript, embeddings)):
-            emb_record = Embedding(
-                video_id=video_id,
-                segment_index=i,
-                segment_start=segment.get("start", 0),
-                segment_end=segment.get("end", 0),
-                segment_content=segment.get("content", ""),
-                embedding_blob=embedding.tobytes(),
-                embedding_dim=len(embedding)
-            )
-            session.add(emb_record)
-        
+        logger.info(f"Generating {len(rows)} embeddings for {len(counts)} videos")
+        for start in range(0, len(rows), INDEX_FLUSH_ROWS):
+            chunk = [row for row in rows[start:start + INDEX_FLUSH_ROWS] if row[0] not in failed]
+            if not chunk:
+                continue
+            
+            # Generate embeddings
+            try:
+                embeddings = model.encode(
+                    [row[2] for row in chunk], batch_size=batch_size,
+                    show_progress_bar=False, convert_to_numpy=True
+                )
+            except Exception:
+                if not skip_errors:
+                    raise
+                # Retry video by video so one bad transcript only fails itself
+                chunk, embeddings = self._encode_per_video(model, chunk, batch_size, failed)
+                if not chunk:
+                    continue
+
+            # Store in database with one executemany INSERT per chunk
+            records = []
+            for (video_id, i, content, seg_start, seg_end), embedding in zip(chunk, embeddings):
+                records.append({
+                    "video_id": video_id,
+                    "segment_index": i,
+                    "segment_start": seg_start,
+                    "segment_end": seg_end,
+                    "segment_content": content,
+                    "embedding_blob": embedding.astype(self._blob_dtype).tobytes(),
+                    "embedding_dim": len(embedding)
+                })
+                counts[video_id] += 1
+            session.exec(insert(Embedding), params=records)
+
+        if failed:
+            # Drop rows inserted from earlier chunks of videos that failed
+            session.exec(delete(Embedding).where(Embedding.video_id.in_(list(failed))))
+            for video_id in failed:
+                counts.pop(video_id, None)
+
         session.commit()
-        self._index_dirty = True
-        logger.info(f"Indexed {len(transcript)} segments for video {video_id}")
-        return len(transcript)
+        self.invalidate()
+        for video_id, count in counts.items():
+            if count:
+                logger.info(f"Indexed {count} segments for video {video_id}")
+        return counts
+
+    @staticmethod
+    def _encode_per_video(
+        model: "SentenceTransformer",
+        chunk: List[tuple],
+        batch_size: int,
+        failed: Dict[int, Exception]
+    ) -> Tuple[List[tuple], List[np.ndarray]]:
+        """Encode a chunk one video at a time, recording videos that fail."""
+        kept: List[tuple] = []
+        embeddings: List[np.ndarray] = []
+        for video_id in dict.fromkeys(row[0] for row in chunk):
+            video_rows = [row for row in chunk if row[0] == video_id]
+            try:
+                video_embeddings = model.encode(
+                    [row[2] for row in video_rows], batch_size=batch_size,
+                    show_progress_bar=False, convert_to_numpy=True
+                )
+            except Exception as e:
+                failed[video_id] = e
+                logger.error(f"Failed to index video {video_id}: {e}")
+                continue
+            kept.extend(video_rows)
+            embeddings.extend(video_embeddings)
+        return kept, embeddings
     
+    def invalidate(self) -> None:
+        """Flag the in-memory index for rebuild and drop cached search results."""
+        with self._flag_lock:
+            self._generation += 1
+            self._index_dirty = True
+        get_query_cache().clear()
+
+    def _fingerprint(self, session: Session) -> list:
+        """Cheap summary of the Embedding table used to validate snapshots."""
+        count, max_id, max_created = session.exec(
+            select(func.count(Embedding.id), func.max(Embedding.id), func.max(Embedding.created_at))
+        ).one()
+        dtype = "int8" if self.quantize else "float32"
+        return [count, max_id, max_created, EmbeddingModel._model_name, dtype]
+
+    def _load_snapshot(self, fingerprint: list) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Memory-map the saved matrix if it still matches the database.
+
+        Returns:
+            (embeddings, row ids, row video ids), or None if there is no
+            valid snapshot
+        """
+        try:
+            with open(self._snapshot_dir / "fingerprint.json", "r", encoding="utf-8") as f:
+                if json.load(f) != fingerprint:
+                    return None
+            embeddings = np.load(self._snapshot_dir / "embeddings.npy", mmap_mode="r")
+            row_ids = np.load(self._snapshot_dir / "row_ids.npy")
+            row_video_ids = np.load(self._snapshot_dir / "row_video_ids.npy")
+        except (OSError, ValueError):
+            return None
+        if not len(row_ids) == len(row_video_ids) == len(embeddings):
+            return None
+        return embeddings, row_ids, row_video_ids
+
+    def _save_snapshot(
+        self,
+        fingerprint: list,
+        embeddings: np.ndarray,
+        row_ids: np.ndarray,
+        row_video_ids: np.ndarray
+    ) -> None:
+        """
+        Persist the matrix and row ids so restarts can skip the rebuild.
+
+        Every file is written under a temporary name and moved into place, so
+        a previous snapshot that is still memory-mapped keeps its own data.
+        The old fingerprint is removed first and the new one written last,
+        so a partial save never validates.
+        """
+        fingerprint_path = self._snapshot_dir / "fingerprint.json"
+        arrays = {
+            "embeddings.npy": embeddings,
+            "row_ids.npy": row_ids,
+            "row_video_ids.npy": row_video_ids,
+        }
+        try:
+            self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            fingerprint_path.unlink(missing_ok=True)
+            for name, array in arrays.items():
+                tmp_path = self._snapshot_dir / f"{name}.part"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, array)
+                os.replace(tmp_path, self._snapshot_dir / name)
+            tmp_path = self._snapshot_dir / "fingerprint.json.part"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(fingerprint, f)
+            os.replace(tmp_path, fingerprint_path)
+        except OSError as e:
+            logger.warning(f"Could not save vector index snapshot: {e}")
+
     def _rebuild_index(self, session: Session) -> None:
-        """Rebuild the in-memory index from database."""
-        logger.debug("Rebuilding vector index from database")
-        
-        all_embeddings = session.exec(select(Embedding)).all()
-        
-        if not all_embeddings:
-            self._combined_embeddings = None
-            self._embedding_video_map = []
-            self._index_dirty = False
-            return
-        
-        # Build numpy array and metadata
-        embedding_list = []
-        self._embedding_video_map = []
+        """Rebuild the in-memory index, unless another thread just did."""
+        with self._rebuild_lock:
+            if not self._index_dirty:
+                return
+            generation = self._generation
+            state = self._load_or_build_index(session)
+            with self._flag_lock:
+                self._state = state
+                # Embeddings committed after the fingerprint was read
+                # invalidated again; keep the flag so they get picked up
+                if self._generation == generation:
+                    self._index_dirty = False
+
+    def _load_or_build_index(self, session: Session) -> Optional[_IndexState]:
+        """Load the index from the snapshot or the database (None if empty)."""
+        fingerprint = self._fingerprint(session)
+        if fingerprint[0] == 0:
+            return None
         
-        for emb in all_embeddings:
-            vector = np.frombuffer(emb.embedding_blob, dtype=np.float32)
-            embedding_list.append(vector)
-            self._embedding_video_map.append((
-                emb.video_id,
-                emb.segment_index,
-                {
-                    "start": emb.segment_start,
-                    "end": emb.segment_end,
-                    "content": emb.segment_content
-                }
-            ))
+        snapshot = self._load_snapshot(fingerprint)
+        if snapshot is not None:
+            embeddings, row_ids, row_video_ids = snapshot
+            logger.debug(f"Vector index loaded from snapshot ({fingerprint[0]} vectors)")
+        else:
+            logger.debug("Rebuilding vector index from database")
+            # Only ids and vectors are needed here; segment text is fetched
+            # for the matching rows at query time
+            rows = session.exec(
+                select(Embedding.id, Embedding.video_id, Embedding.embedding_blob, Embedding.embedding_dim)
+                .order_by(Embedding.id)
+            ).all()
+            row_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            row_video_ids = np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows))
+            widths = {len(r[2]) // r[3] for r in rows}
+            if len(widths) == 1:
+                embeddings = np.frombuffer(
+                    b"".join(r[2] for r in rows),
+                    dtype=np.float16 if widths == {2} else np.float32
+                ).reshape(len(rows), -1).astype(np.float32)
+            else:
+                # float16 and float32 rows are mixed
+                embeddings = np.stack(
+                    [_decode_embedding(r[2], r[3]) for r in rows]
+                ).astype(np.float32)
+            
+            # Normalize once so a dot product is the cosine similarity; zero
+            # vectors produce NaNs, which are replaced with 0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = np.nan_to_num(embeddings, copy=False)
+            if self.quantize:
+                embeddings = np.round(embeddings * 127).astype(np.int8)
+            self._save_snapshot(fingerprint, embeddings, row_ids, row_video_ids)
+            logger.debug(f"Vector index rebuilt with {len(rows)} vectors")
         
-        self._combined_embeddings = np.vstack(embedding_list)
-        self._index_dirty = False
-        logger.debug(f"Vector index rebuilt with {len(embedding_list)} vectors")
+        return _IndexState.from_arrays(
+            embeddings, row_ids, row_video_ids, self._build_ann_index(embeddings)
+        )
     
+    def _build_ann_index(self, embeddings: np.ndarray):
+        """Build an HNSW index over normalized embeddings, if worthwhile."""
+        if not HNSW_AVAILABLE or len(embeddings) < ANN_MIN_VECTORS:
+            return None
+
+        count, dim = embeddings.shape
+        if embeddings.dtype == np.int8:
+            embeddings = embeddings.astype(np.float32) / 127
+        index = hnswlib.Index(space="ip", dim=dim)
+        index.init_index(max_elements=count, ef_construction=200, M=16)
+        index.add_items(embeddings, np.arange(count))
+        logger.debug(f"Built HNSW index over {count} vectors")
+        return index
+
     def search(
         self,
         query: str,
@@ -206,63 +593,84 @@ class VectorStore:
             logger.warning(f"Invalid threshold {threshold}, clamping to 0.0-1.0")
             threshold = max(0.0, min(1.0, threshold))
         
-        # Rebuild index if needed
+        # Rebuild index if needed, then work on one consistent state even if
+        # another thread publishes a new one meanwhile
         try:
             if self._index_dirty:
                 self._rebuild_index(session)
             
-            if self._combined_embeddings is None or len(self._combined_embeddings) == 0:
+            state = self._state
+            if state is None or len(state.embeddings) == 0:
                 logger.debug("No embeddings found for search")
                 return []
             
-            # Encode query
-            model = EmbeddingModel.get_instance()
-            query_embedding = model.encode([query], show_progress_bar=False)[0]
+            # Encode query (memoized, already normalized)
+            query_norm = _encode_query(EmbeddingModel._model_name, query.strip())
             
-            # Calculate cosine similarity
-            # Normalize embeddings for cosine similarity
-            query_norm = query_embedding / np.linalg.norm(query_embedding)
-            embeddings_norm = self._combined_embeddings / np.linalg.norm(
-                self._combined_embeddings, axis=1, keepdims=True
-            )
+            # Large libraries use the HNSW index. A video filter is applied
+            # before scoring: small selections are scanned exactly, large ones
+            # restrict the HNSW traversal to their rows
+            if video_ids is None:
+                if state.ann_index is not None:
+                    indices, scores = state.ann_candidates(query_norm, limit)
+                else:
+                    scores = state.score_rows(query_norm)
+                    indices = np.arange(len(scores))
+            else:
+                indices = state.rows_for_videos(video_ids)
+                if len(indices) == 0:
+                    return []
+                if state.ann_index is not None and len(indices) >= ANN_MIN_VECTORS:
+                    allowed = np.zeros(len(state.embeddings), dtype=bool)
+                    allowed[indices] = True
+                    indices, scores = state.ann_candidates(query_norm, limit, allowed)
+                else:
+                    scores = state.score_rows(query_norm, indices)
             
-            # Replace NaNs (from zero vectors) with 0 to avoid crashes
-            embeddings_norm = np.nan_to_num(embeddings_norm)
+            # Threshold, then walk the survivors best-first until limit is
+            # reached; ids come from the same state the scores did
+            keep = np.flatnonzero(scores >= threshold)
+            keep = keep[np.argsort(-scores[keep], kind="stable")]
             
-            scores = np.dot(embeddings_norm, query_norm)
+            keep = keep[:limit]
+            hits = [
+                (int(emb_id), float(score))
+                for emb_id, score in zip(state.row_ids[indices[keep]], scores[keep])
+            ]
             
         except Exception as e:
             logger.error(f"Error during semantic search calculation: {e}")
             return []
         
-        # Filter by threshold and video_ids
+        if not hits:
+            return []
+        
+        # Fetch segment data and video paths for the hits in one query
+        rows = session.exec(
+            select(
+                Embedding.id, Embedding.video_id, Embedding.segment_start,
+                Embedding.segment_end, Embedding.segment_content, Video.path
+            )
+            .join(Video, Video.id == Embedding.video_id)
+            .where(Embedding.id.in_([emb_id for emb_id, _ in hits]))
+        ).all()
+        by_id = {r[0]: r for r in rows}
+        
         results = []
-        for idx, score in enumerate(scores):
-            if score < threshold:
-                continue
-            
-            video_id, segment_idx, segment_data = self._embedding_video_map[idx]
-            
-            if video_ids is not None and video_id not in video_ids:
-                continue
-            
-            # Get video path from database
-            video = session.get(Video, video_id)
-            if not video:
+        for emb_id, score in hits:
+            row = by_id.get(emb_id)
+            if row is None:
                 continue
-            
+            _, video_id, start, end, content, path = row
             results.append({
-                "file": video.path,
-                "start": segment_data["start"],
-                "end": segment_data["end"],
-                "content": segment_data["content"],
-                "score": float(score),
+                "file": path,
+                "start": start,
+                "end": end,
+                "content": content,
+                "score": score,
                 "video_id": video_id
             })
-        
-        # Sort by score and limit
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:limit]
+        return results
     
     def get_stats(self, session: Session) -> dict:
         """Get statistics about the vector index."""
@@ -289,7 +697,7 @@ class VectorStore:
             session.delete(emb)
         
         session.commit()
-        self._index_dirty = True
+        self.invalidate()
         return count
 
 
@@ -301,5 +709,9 @@ def get_vector_store() -> VectorStore:
     """Get or create the global vector store instance."""
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore()
+        flags = FeatureFlags()
+        _vector_store = VectorStore(
+            quantize=flags.enable_int8_embeddings,
+            half_precision=flags.enable_fp16_embeddings
+        )
     return _vector_store
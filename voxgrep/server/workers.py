@@ -0,0 +1,242 @@
+"""
+VoxGrep Worker Pool Module
+
+Runs CPU-heavy background jobs (indexing, diarization, export) in a process
+pool so they do not hold the GIL on the API's threadpool. Transcription runs
+in a separate single-process pool that keeps the Whisper model loaded.
+Submitted jobs get an id whose status is served by /jobs/{id}.
+"""
+import multiprocessing
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..utils.config import ServerConfig
+from ..utils.helpers import setup_logger
+
+logger = setup_logger(__name__)
+
+# Global pool instances
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_transcriber_pool: Optional[ProcessPoolExecutor] = None
+
+# Recent jobs by id; the oldest are forgotten beyond this many
+MAX_TRACKED_JOBS = 1000
+_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def get_cpu_pool() -> ProcessPoolExecutor:
+    """Get or create the global worker process pool."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        workers = ServerConfig().worker_processes
+        # spawn rather than fork: torch/CUDA and MLX are not fork-safe
+        _cpu_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Started worker pool with {workers} processes")
+    return _cpu_pool
+
+
+def _preload_transcriber() -> None:
+    """Transcriber process initializer: load the default Whisper model."""
+    from .multi_model import get_model_manager
+    try:
+        get_model_manager().warm_up()
+    except Exception as e:
+        # Tasks still work; the model just loads on first use
+        logger.warning(f"Failed to pre-load transcription model: {e}")
+
+
+def get_transcriber_pool() -> ProcessPoolExecutor:
+    """
+    Get or create the transcription worker.
+
+    A single long-lived process loads the model once and serves every
+    transcription, instead of each CPU worker loading its own copy.
+    """
+    global _transcriber_pool
+    if _transcriber_pool is None:
+        _transcriber_pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preload_transcriber
+        )
+        # Start the process now so the model loads before the first request
+        _transcriber_pool.submit(int)
+        logger.info("Started transcription worker")
+    return _transcriber_pool
+
+
+def _submit(
+    pool: ProcessPoolExecutor,
+    fn: Callable[..., Any],
+    args: tuple,
+    kwargs: dict,
+    on_done: Optional[Callable[[], None]]
+) -> Future:
+    """Submit fn to pool, logging failures and running on_done afterwards."""
+    future = pool.submit(fn, *args, **kwargs)
+
+    def _finished(f: Future) -> None:
+        if f.cancelled():
+            return
+        exc = f.exception()
+        if exc is not None:
+            logger.error(f"Background task {fn.__name__} failed: {exc}")
+        if on_done is not None:
+            try:
+                on_done()
+            except Exception as e:
+                logger.error(f"Completion callback for {fn.__name__} failed: {e}")
+
+    future.add_done_callback(_finished)
+    return future
+
+
+def _track(future: Future) -> Future:
+    """Register future under a new job id, also stored as future.job_id."""
+    future.job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _jobs[future.job_id] = future
+        while len(_jobs) > MAX_TRACKED_JOBS:
+            _jobs.popitem(last=False)
+    return future
+
+
+def get_job_status(job_id: str) -> Optional[dict]:
+    """
+    Status of a submitted job, or None if the id is unknown.
+
+    Returns:
+        Dict with job_id, status (queued, running, completed, failed or
+        cancelled) and error (the failure message, if any)
+    """
+    with _jobs_lock:
+        future = _jobs.get(job_id)
+    if future is None:
+        return None
+    
+    error = None
+    if future.cancelled():
+        status = "cancelled"
+    elif future.done():
+        exc = future.exception()
+        status = "failed" if exc is not None else "completed"
+        error = str(exc) if exc is not None else None
+    elif future.running():
+        status = "running"
+    else:
+        status = "queued"
+    return {"job_id": job_id, "status": status, "error": error}
+
+
+def submit_task(
+    fn: Callable[..., Any],
+    *args: Any,
+    on_done: Optional[Callable[[], None]] = None,
+    **kwargs: Any
+) -> Future:
+    """
+    Run a module-level function in the worker pool.
+
+    Args:
+        fn: Picklable (module-level) function to run
+        *args: Picklable positional arguments for fn
+        on_done: Optional callback run in the server process once fn
+            finishes, e.g. to invalidate in-memory state it changed
+        **kwargs: Picklable keyword arguments for fn
+
+    Returns:
+        Future for the submitted task, with its id as future.job_id
+    """
+    return _track(_submit(get_cpu_pool(), fn, args, kwargs, on_done))
+
+
+def submit_transcription(
+    fn: Callable[..., Any],
+    *args: Any,
+    on_done: Optional[Callable[[], None]] = None,
+    **kwargs: Any
+) -> Future:
+    """
+    Run a task that transcribes in the transcription worker.
+
+    Takes the same arguments as submit_task. Tasks run one at a time,
+    which also keeps concurrent jobs from contending for the GPU.
+    """
+    return _track(_submit(get_transcriber_pool(), fn, args, kwargs, on_done))
+
+
+def submit_transcription_after(
+    first: Future,
+    fn: Callable[..., Any],
+    *args: Any,
+    on_done: Optional[Callable[[], None]] = None,
+    **kwargs: Any
+) -> Future:
+    """
+    Run a transcription task once another task has finished.
+
+    Lets CPU-side preparation (e.g. a download) run in the worker pool
+    without holding up the transcription worker. fn receives first's
+    result as its first argument. It is skipped if first failed or returned
+    None, and the chained job then fails as well.
+
+    Args:
+        first: Future of the preparation task
+        fn: Picklable (module-level) function to run
+        *args: Further positional arguments for fn
+        on_done: Optional callback run in the server process once fn
+            finishes
+        **kwargs: Picklable keyword arguments for fn
+
+    Returns:
+        Future covering both steps, with its own job_id
+    """
+    chained: Future = Future()
+    chained.set_running_or_notify_cancel()
+    
+    def _forward(f: Future) -> None:
+        if f.cancelled():
+            chained.set_exception(CancelledError())
+        elif f.exception() is not None:
+            chained.set_exception(f.exception())
+        else:
+            chained.set_result(f.result())
+    
+    def _start(f: Future) -> None:
+        if f.cancelled() or f.exception() is not None:
+            _forward(f)
+            return
+        if f.result() is None:
+            chained.set_exception(RuntimeError(
+                f"Preparation step produced nothing, so {fn.__name__} was not run"
+            ))
+            return
+        try:
+            second = _submit(
+                get_transcriber_pool(), fn, (f.result(), *args), kwargs, on_done
+            )
+        except RuntimeError as e:
+            # The pool was shut down while the first step ran
+            chained.set_exception(e)
+            return
+        second.add_done_callback(_forward)
+    
+    first.add_done_callback(_start)
+    return _track(chained)
+
+
+def shutdown_cpu_pool() -> None:
+    """Stop the worker pools, dropping tasks that have not started."""
+    global _cpu_pool, _transcriber_pool
+    for pool in (_cpu_pool, _transcriber_pool):
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    _cpu_pool = None
+    _transcriber_pool = None
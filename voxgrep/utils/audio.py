@@ -3,12 +3,17 @@ Audio processing utilities for VoxGrep.
 """
 
 import os
+import re
+import hashlib
 import subprocess
 import tempfile
 import logging
+import wave
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,10 +127,85 @@ def normalize_audio(
         raise RuntimeError(error_msg) from e
 
 
+def load_pcm_wav(wav_file: str, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Load a 16-bit mono PCM WAV (as written by normalize_audio) into a float32 array.
+
+    The samples are read straight into NumPy, so the transcription backend
+    does not have to spawn another decoder for audio we already converted.
+
+    Args:
+        wav_file: Path to the WAV file
+        sample_rate: Expected sample rate (Whisper's native rate by default)
+
+    Returns:
+        Mono float32 samples scaled to [-1.0, 1.0]
+
+    Raises:
+        ValueError: If the file is not 16-bit mono PCM at the expected rate
+    """
+    with wave.open(wav_file, "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getframerate() != sample_rate:
+            raise ValueError(
+                f"Expected 16-bit mono PCM at {sample_rate} Hz, got "
+                f"{wf.getnchannels()}ch/{wf.getsampwidth() * 8}bit/{wf.getframerate()} Hz"
+            )
+        frames = wf.readframes(wf.getnframes())
+
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def decode_audio(input_file: str, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Decode any audio/video file to mono float32 samples with one ffmpeg run.
+
+    Args:
+        input_file: Path to the audio or video file
+        sample_rate: Sample rate to resample to
+
+    Returns:
+        Mono float32 samples in [-1.0, 1.0]
+
+    Raises:
+        RuntimeError: If ffmpeg is not available or decoding fails
+    """
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-i", input_file,
+        "-vn",                    # Skip video decoding
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-f", "f32le",            # Raw float32 samples, no header
+        "pipe:1"
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise RuntimeError(
+            "ffmpeg is required to decode audio but was not found. "
+            "Please install ffmpeg and ensure it's in your PATH."
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace") if e.stderr else str(e)
+        raise RuntimeError(f"Audio decoding failed for {input_file}: {stderr}") from e
+
+    return np.frombuffer(result.stdout, dtype="<f4")
+
+
+def _source_cache_key(path: str, size: int, mtime_ns: int) -> str:
+    """Short content key for a source file identified by path, size and mtime."""
+    return hashlib.blake2b(f"{path}:{size}:{mtime_ns}".encode(), digest_size=8).hexdigest()
+
+
 def get_normalized_cache_path(video_file: str) -> str:
     """
     Get the cache path for normalized audio file.
     
+    The file name is the source's file name plus a key derived from its
+    path, size and mtime, so a changed source (or a sibling with the same
+    stem but another extension) maps to a different cache entry.
+    
     Args:
         video_file: Path to original video file
         
@@ -136,13 +216,44 @@ def get_normalized_cache_path(video_file: str) -> str:
     cache_dir = video_path.parent / ".voxgrep_cache"
     cache_dir.mkdir(exist_ok=True)
     
-    return str(cache_dir / f"{video_path.stem}_normalized.wav")
+    st = os.stat(video_file)
+    key = _source_cache_key(str(video_path.resolve()), st.st_size, st.st_mtime_ns)
+    return str(cache_dir / f"{video_path.name}_{key}_normalized.wav")
+
+
+def remove_stale_normalized_audio(video_file: str) -> None:
+    """
+    Delete cached normalized audio for video_file that no longer matches it.
+
+    Each edit of the source produces a new full-length WAV, so older
+    entries for the same file (and ones named by the earlier stem-only
+    scheme) are removed once a new one has been written.
+
+    Args:
+        video_file: Path to original video file
+    """
+    video_path = Path(video_file)
+    cache_dir = video_path.parent / ".voxgrep_cache"
+    current = Path(get_normalized_cache_path(video_file)).name
+    stem, name = re.escape(video_path.stem), re.escape(video_path.name)
+    stale = re.compile(rf"(?:{name}_[0-9a-f]{{16}}|{stem})_normalized\.wav")
+    
+    for entry in cache_dir.iterdir():
+        if entry.name != current and stale.fullmatch(entry.name):
+            try:
+                entry.unlink()
+                logger.debug(f"Removed stale normalized audio: {entry}")
+            except OSError as e:
+                logger.warning(f"Could not remove stale normalized audio {entry}: {e}")
 
 
 def should_normalize_audio(video_file: str, force: bool = False) -> bool:
     """
     Check if audio normalization is needed or cached.
     
+    Because the cache path is keyed on the source's size and mtime, a single
+    existence check decides whether the cached audio is still valid.
+    
     Args:
         video_file: Path to video file
         force: Force normalization even if cache exists
@@ -155,14 +266,9 @@ def should_normalize_audio(video_file: str, force: bool = False) -> bool:
     
     cache_path = get_normalized_cache_path(video_file)
     
-    # If cache doesn't exist, we need to normalize
+    # If cache doesn't exist (or the source changed), we need to normalize
     if not os.path.exists(cache_path):
         return True
     
-    # If cache is older than source, re-normalize
-    if os.path.getmtime(cache_path) < os.path.getmtime(video_file):
-        logger.info("Cached normalized audio is outdated, will re-normalize")
-        return True
-    
     logger.info(f"Using cached normalized audio: {cache_path}")
     return False
@@ -43,6 +43,19 @@ MLX_MODEL_MAPPING = {
     "large-v3": "mlx-community/whisper-large-v3-mlx",
     "large-v2": "mlx-community/whisper-large-v2-mlx",
     "distil-large-v3": "mlx-community/distil-whisper-large-v3",
+    # 4-bit quantized variants (roughly half the memory, faster on Apple Silicon)
+    "tiny-4bit": "mlx-community/whisper-tiny-mlx-4bit",
+    "base-4bit": "mlx-community/whisper-base-mlx-4bit",
+    "small-4bit": "mlx-community/whisper-small-mlx-4bit",
+    "medium-4bit": "mlx-community/whisper-medium-mlx-4bit",
+    "large-4bit": "mlx-community/whisper-large-v3-mlx-4bit",
+    "large-v3-4bit": "mlx-community/whisper-large-v3-mlx-4bit",
+    "large-v2-4bit": "mlx-community/whisper-large-v2-mlx-4bit",
+}
+
+# Supported MLX quantization levels (quantization -> model name suffix)
+MLX_QUANTIZATION_SUFFIXES = {
+    "int4": "-4bit",
 }
 
 def get_best_device() -> str:
@@ -84,6 +97,10 @@ DEFAULT_SEARCH_TYPE = "sentence"
 DEFAULT_SEMANTIC_THRESHOLD = 0.45
 DEFAULT_SEMANTIC_MODEL = "all-MiniLM-L6-v2"
 
+# pyannote pipeline used for speaker diarization. 3.1 runs its embedding model
+# in pure PyTorch (3.0 used onnxruntime, which left the GPU mostly idle)
+DEFAULT_DIARIZATION_MODEL = "pyannote/speaker-diarization-3.1"
+
 DEFAULT_IGNORED_WORDS = [
     "a", "o", "as", "os", "e", "é", "de", "do", "da", "dos", "das", 
     "em", "no", "na", "nos", "nas", "que", "para", "por", "com", 
@@ -117,6 +134,8 @@ class ServerConfig:
     cors_origins: list[str] = field(default_factory=lambda: ["*"])
     log_level: str = "INFO"
     download: DownloadConfig = field(default_factory=DownloadConfig)
+    # Each worker loads its own models, so the pool is capped
+    worker_processes: int = field(default_factory=lambda: min(4, os.cpu_count() or 1))
 
 
 # ============================================================================
@@ -172,3 +191,8 @@ class FeatureFlags:
     enable_gpu_acceleration: bool = True
     enable_speaker_diarization: bool = False  # Future feature
     enable_auto_indexing: bool = True
+    enable_int8_embeddings: bool = False  # Quarter-size vector index, approximate scores
+    # Store embeddings on disk as float16: half the size, slightly lossy
+    enable_fp16_embeddings: bool = field(
+        default_factory=lambda: os.getenv("VOXGREP_FP16_EMBEDDINGS", "0") == "1"
+    )
@@ -13,33 +13,44 @@ from .exceptions import InvalidFileFormatError
 
 logger = logging.getLogger(__name__)
 
+# Set lookups for the per-file extension checks used while scanning
+_VIDEO_EXTS = frozenset(VIDEO_EXTENSIONS)
+_AUDIO_EXTS = frozenset(AUDIO_EXTENSIONS)
+_MEDIA_EXTS = frozenset(MEDIA_EXTENSIONS)
+_SUBTITLE_EXTS = frozenset(SUBTITLE_EXTENSIONS)
+
 
 # ============================================================================
 # File Type Detection
 # ============================================================================
 def get_file_extension(filename: str) -> str:
-    """Get the lowercase file extension without the dot."""
-    return Path(filename).suffix.lower()
+    """Get the lowercase file extension, including the dot (same rules as Path.suffix)."""
+    # String slicing instead of building a Path; called once per file in scans
+    name = os.path.basename(os.fspath(filename).rstrip(os.sep))
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
 
 
 def is_video_file(filename: str) -> bool:
     """Check if a file is a video file based on extension."""
-    return get_file_extension(filename) in VIDEO_EXTENSIONS
+    return get_file_extension(filename) in _VIDEO_EXTS
 
 
 def is_audio_file(filename: str) -> bool:
     """Check if a file is an audio file based on extension."""
-    return get_file_extension(filename) in AUDIO_EXTENSIONS
+    return get_file_extension(filename) in _AUDIO_EXTS
 
 
 def is_media_file(filename: str) -> bool:
     """Check if a file is a media file (video or audio)."""
-    return get_file_extension(filename) in MEDIA_EXTENSIONS
+    return get_file_extension(filename) in _MEDIA_EXTS
 
 
 def is_subtitle_file(filename: str) -> bool:
     """Check if a file is a subtitle/transcript file."""
-    return get_file_extension(filename) in SUBTITLE_EXTENSIONS
+    return get_file_extension(filename) in _SUBTITLE_EXTS
 
 
 def get_media_type(filename: str) -> str:
@@ -50,9 +61,9 @@ def get_media_type(filename: str) -> str:
         'video', 'audio', or 'unknown'
     """
     ext = get_file_extension(filename)
-    if ext in VIDEO_EXTENSIONS:
+    if ext in _VIDEO_EXTS:
         return 'video'
-    elif ext in AUDIO_EXTENSIONS:
+    elif ext in _AUDIO_EXTS:
         return 'audio'
     return 'unknown'
 
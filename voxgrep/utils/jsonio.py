@@ -0,0 +1,95 @@
+"""
+JSON I/O helpers for VoxGrep.
+
+Transcripts with word-level timestamps routinely run into megabytes, so
+loading and saving them goes through orjson when it is installed and falls
+back to the standard library otherwise.
+"""
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterable, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception either way.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON bytes."""
+    if ORJSON_AVAILABLE:
+        # Transcription backends may hand back numpy arrays
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: str) -> Any:
+    """Read and deserialize a JSON file."""
+    with open(path, "rb") as infile:
+        return loads(infile.read())
+
+
+def dump_file(obj: Any, path: str) -> None:
+    """
+    Serialize an object and write it to a JSON file.
+
+    The bytes go to a temporary file that is moved into place once
+    complete, so readers never see a truncated file at path.
+    """
+    with _atomic_writer(path) as outfile:
+        outfile.write(dumps(obj))
+
+
+@contextmanager
+def _atomic_writer(path: str) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file that replaces path once the block completes.
+
+    If the block raises, the temporary file is removed and path is left
+    untouched.
+    """
+    tmp_path = f"{path}.part"
+    try:
+        with open(tmp_path, "wb") as outfile:
+            yield outfile
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def dump_iter_file(items: Iterable[Any], path: str) -> int:
+    """
+    Write items to a JSON array file one at a time as they are produced.
+
+    Only the current item is held in memory. The array is written the same
+    way as dump_file, so an interrupted write never leaves a truncated file
+    at path.
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    with _atomic_writer(path) as outfile:
+        outfile.write(b"[")
+        for item in items:
+            if count:
+                outfile.write(b",")
+            outfile.write(dumps(item))
+            count += 1
+        outfile.write(b"]")
+    return count